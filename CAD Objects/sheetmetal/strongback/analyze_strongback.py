@@ -1,47 +1,116 @@
+import os
 import re
-import math
+import sys
+import mmap
+import itertools
+import numpy as np
 
-def analyze_step(file_path):
-    print(f"Analyzing {file_path}...")
-    
-    with open(file_path, 'r') as f:
-        content = f.read()
+# Regex to find CARTESIAN_POINT
+# #14=CARTESIAN_POINT('',(0.,0.,0.)) ;
+# #26=CARTESIAN_POINT('Axis2P3D Location',(0.,87.757,50.038)) ;
+# Bytes pattern so the memory-mapped file can be scanned directly (no decode).
+# Possessive quantifiers (Python 3.11+) never backtrack, so each candidate
+# is matched in a single linear pass after the literal prefix is found.
+# The whole "x,y,z" triple is one group; NumPy parses the numbers in C.
+_CP_RE = re.compile(rb"CARTESIAN_POINT\s*+\([^,]*+,\s*+\(\s*+([-\d\.E]++\s*+,\s*+[-\d\.E]++\s*+,\s*+[-\d\.E]++)\s*+\)\s*+\)")
+
+# Approximate bytes scanned per window. The only transient per-point objects
+# are one window's matches, so this keeps them to ~1k short bytes objects.
+_BLOCK_SIZE = 1 << 18
+
+def _window_end(buf, pos, size):
+    """
+    End of the scan window starting at pos: just past the first entity
+    terminator after _BLOCK_SIZE bytes. pos is outside any quoted string, so a
+    ';' terminates an entity only when the quotes before it are balanced
+    (a doubled '' escape counts twice); a ';' inside a label is skipped.
+    """
+    end = buf.find(b";", pos + _BLOCK_SIZE)
+    if end < 0:
+        return size
+    quotes = buf[pos:end].count(b"'")
+    while quotes % 2:
+        nxt = buf.find(b";", end + 1)
+        if nxt < 0:
+            return size
+        quotes += buf[end:nxt].count(b"'")
+        end = nxt
+    return end + 1
+
+def _fold_window(buf, pos, end, mn, mx, limit=None):
+    """
+    Fold the CARTESIAN_POINTs in buf[pos:end] into the running bbox. Returns the point count.
+    With limit, only the first limit points are matched and folded.
+    """
+    if limit is None:
+        matches = _CP_RE.findall(buf, pos, end)
+    else:
+        matches = [m.group(1) for m in itertools.islice(_CP_RE.finditer(buf, pos, end), max(0, limit))]
+    if not matches:
+        return 0
+    # Parsed values are interleaved x,y,z (AoS). Transpose into contiguous
+    # per-axis rows (SoA) so each min/max is one long unit-stride reduction.
+    xyz = np.ascontiguousarray(np.fromstring(b",".join(matches), sep=",").reshape(-1, 3).T)
+    np.minimum(mn, xyz.min(axis=1), out=mn)
+    np.maximum(mx, xyz.max(axis=1), out=mx)
+    return xyz.shape[1]
+
+def analyze_step(file_path, quick=False, early_exit_after=2000):
+    """
+    Print the CARTESIAN_POINT bounding box of a STEP file and guess its units.
 
-    # Regex to find CARTESIAN_POINT
-    # #14=CARTESIAN_POINT('',(0.,0.,0.)) ;
-    # #26=CARTESIAN_POINT('Axis2P3D Location',(0.,87.757,50.038)) ;
+    quick=True samples instead of scanning everything: the first
+    early_exit_after // 2 points of the file, then up to the rest of the
+    early_exit_after budget from its last window. At most early_exit_after
+    points are parsed. Enough for unit inference; the bbox is then approximate.
+    """
+    print(f"Analyzing {file_path}...")
     
-    pattern = re.compile(r"CARTESIAN_POINT\s*\([^,]*,\s*\(\s*([-\d\.E]+)\s*,\s*([-\d\.E]+)\s*,\s*([-\d\.E]+)\s*\)\s*\)")
+    # Memory-map the file and scan it in windows that end on a STEP entity
+    # terminator (';'), reducing each window's points with NumPy. The OS pages
+    # the file in on demand, so there is no userspace copy of the content.
+    mn = np.full(3, np.inf)
+    mx = np.full(3, -np.inf)
+    n = 0
     
-    matches = pattern.findall(content)
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Full scans read front to back: ask for aggressive readahead
+                # (the mmap equivalent of a large read buffer). Not on Windows.
+                if not quick and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                pos = 0
+                head_budget = early_exit_after // 2 if quick else None
+                while pos < size and (head_budget is None or n < head_budget):
+                    end = _window_end(mm, pos, size)
+                    n += _fold_window(mm, pos, end, mn, mx,
+                                      None if head_budget is None else head_budget - n)
+                    pos = end
+                
+                if quick and pos < size:
+                    # Tail sample: the last window, starting on an entity boundary
+                    tail_start = size - _BLOCK_SIZE
+                    if tail_start > pos:
+                        t = mm.find(b";", tail_start)
+                        pos = size if t < 0 else t + 1
+                    n += _fold_window(mm, pos, size, mn, mx, early_exit_after - n)
     
-    if not matches:
+    if not n:
         print("No CARTESIAN_POINTs found.")
         return
-
-    points = []
-    for m in matches:
-        x, y, z = float(m[0]), float(m[1]), float(m[2])
-        points.append((x, y, z))
         
-    print(f"Found {len(points)} points.")
-    
-    if not points:
-        return
+    if quick:
+        print(f"Sampled {n} points (quick mode, bbox is approximate).")
+    else:
+        print(f"Found {n} points.")
 
     # Filter out potential "garbage" or distant origin points if any (naive approach)
     # Just do raw bbox first
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    zs = [p[2] for p in points]
-    
-    min_x, max_x = min(xs), max(xs)
-    min_y, max_y = min(ys), max(ys)
-    min_z, max_z = min(zs), max(zs)
-    
-    len_x = max_x - min_x
-    len_y = max_y - min_y
-    len_z = max_z - min_z
+    min_x, min_y, min_z = mn.tolist()
+    max_x, max_y, max_z = mx.tolist()
+    len_x, len_y, len_z = (mx - mn).tolist()
     
     print(f"Bounding Box (Raw Units - likely mm):")
     print(f"  X: {min_x:.2f} to {max_x:.2f} (Length: {len_x:.2f})")
@@ -58,4 +127,10 @@ def analyze_step(file_path):
     print(f"  Height: {len_z:.2f} mm (~{len_z/25.4:.2f} inches)")
 
 if __name__ == "__main__":
-    analyze_step(r"c:\Programming\buildteamai\CAD Objects\sheetmetal\strongback\strongback.step")
+    # Batch mode: every path on the command line reuses the precompiled _CP_RE.
+    # --quick samples the head and tail of each file instead of a full scan.
+    quick = "--quick" in sys.argv[1:]
+    paths = [a for a in sys.argv[1:] if a != "--quick"]
+    paths = paths or [r"c:\Programming\buildteamai\CAD Objects\sheetmetal\strongback\strongback.step"]
+    for path in paths:
+        analyze_step(path, quick=quick)
@@ -1,4 +1,5 @@
 from build123d import *
+import numpy as np
 import os
 
 def create_strongback(length=24.0, width=8.0, height=4.0, thickness=0.125, hole_spacing=6.0, hole_dia=0.5):
@@ -30,15 +31,23 @@ def create_strongback(length=24.0, width=8.0, height=4.0, thickness=0.125, hole_
         
         # Add Holes
         # Web face is the bottom (Y=0, spanning X=0..width)
-        # We need to find the correct face.
-        web_face = bp.faces().sort_by(Axis.Y)[0]
+        # We need to find the correct face: one linear argmin pass, no full sort.
+        web_face = min(bp.faces(), key=lambda f: f.center().Y)
         
-        with BuildSketch(web_face) as sk2:
-             # Grid of holes along length (Z axis of part)
-            with GridLocations(x_spacing=0, y_spacing=hole_spacing, count_x=1, count_y=int(length // hole_spacing)):
-                 Circle(radius=hole_dia/2)
+        hole_count = int(length // hole_spacing)
         
-        extrude(amount=-thickness*2, mode=Mode.SUBTRACT)
+        # Hole centres along length (Z axis of part), centred on the web like a
+        # 1 x N grid. Kept as an array for any per-hole follow-up logic.
+        hole_ys = (np.arange(hole_count) - (hole_count - 1) / 2.0) * hole_spacing
+        
+        # One Circle under the locations emits every hole face in a single sketch
+        # fuse, and the single SUBTRACT extrude cuts them all in one OCC boolean.
+        if hole_count:
+            with BuildSketch(web_face) as sk2:
+                with Locations(*[(0.0, float(y)) for y in hole_ys]):
+                     Circle(radius=hole_dia/2)
+            
+            extrude(amount=-thickness*2, mode=Mode.SUBTRACT)
 
     return bp.part
 
@@ -5,7 +5,9 @@ This example demonstrates how to use the PyramidGenerator with the new feature s
 to create pyramids with filleted edges programmatically.
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 sys.path.append("C:/Programming/buildteamai/exts/company.twin.tools")
 
 from company.twin.tools.objects.pyramid import PyramidGenerator
@@ -112,6 +114,24 @@ def example_3_disabled_feature():
     return solid_with_features
 
 
+def _build_and_export(config):
+    """Build one filleted pyramid config and export it (runs in a worker process)"""
+    features = [
+        {'type': 'fillet', 'edges': 'vertical', 'radius': config['fillet'], 'enabled': True}
+    ]
+
+    solid = PyramidGenerator.create(
+        base=config['base'],
+        height=config['height'],
+        taper_angle=config['angle'],
+        features=features
+    )
+
+    filename = f"pyramid_{config['name'].lower().replace(' ', '_')}.step"
+    bd.export_step(solid, filename)
+    return f"{config['name']}: {len(solid.faces())} faces -> {filename}"
+
+
 def example_4_different_pyramids():
     """Create various pyramid types with fillets"""
     print("\n=== Example 4: Different Pyramid Configurations ===")
@@ -123,21 +143,10 @@ def example_4_different_pyramids():
         {"name": "Large Base", "base": 300, "height": 150, "angle": -20, "fillet": 10}
     ]
 
-    for config in configs:
-        features = [
-            {'type': 'fillet', 'edges': 'vertical', 'radius': config['fillet'], 'enabled': True}
-        ]
-
-        solid = PyramidGenerator.create(
-            base=config['base'],
-            height=config['height'],
-            taper_angle=config['angle'],
-            features=features
-        )
-
-        filename = f"pyramid_{config['name'].lower().replace(' ', '_')}.step"
-        bd.export_step(solid, filename)
-        print(f"{config['name']}: {len(solid.faces())} faces -> {filename}")
+    # Configs are independent; OCC state is process-global, so use processes not threads
+    with ProcessPoolExecutor(max_workers=min(len(configs), os.cpu_count() or 1)) as ex:
+        for summary in ex.map(_build_and_export, configs):
+            print(summary)
 
 
 def example_5_all_edges():
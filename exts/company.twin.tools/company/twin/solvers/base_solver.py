@@ -1,19 +1,67 @@
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Callable, Iterator, Tuple, Type
+
+
+@dataclass(slots=True)
+class SolveResult:
+    """
+    Standard output of BaseSolver.solve.
+
+    Fields are plain attributes (no per-access string hashing). Item access
+    (result['parts'], result.get('anchors', {})) is kept for existing callers.
+
+    Instanced solvers store each unique solid once in parts and map instance
+    names to (solid_id, Location) in transforms; use expand_instances() to walk
+    either form.
+
+    Solvers may also fill the instance_* fields: parallel lists of instance names
+    and solid ids plus an (N, 4, 4) float64 stack of the same placements as
+    column-vector matrices (translation in [:3, 3]) for bulk consumers.
+    """
+    parts: Dict[str, Any]                               # solid_id (or name) -> build123d.Solid
+    transforms: Dict[str, Any]                          # name -> (solid_id, Location) or Location
+    anchors: Dict[str, Dict[str, Tuple]] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    instance_names: List[str] = field(default_factory=list)
+    instance_solids: List[str] = field(default_factory=list)
+    instance_matrices: Optional[Any] = None            # np.ndarray (N, 4, 4) or None
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def expand_instances(self) -> Iterator[Tuple[str, Any, Any]]:
+        """
+        Yields (name, solid, location) per placed instance, i.e. the old flat
+        parts[name] / transforms[name] form. The same solid object is yielded
+        for every instance that shares it.
+        """
+        for name, entry in self.transforms.items():
+            if isinstance(entry, tuple):
+                solid_id, loc = entry
+                yield name, self.parts[solid_id], loc
+            else:
+                yield name, self.parts[name], entry
 
 class BaseSolver(ABC):
     """
     Abstract Base Class for all Constraint Solvers.
     
     A Solver takes a dictionary of inputs (parameters, constraints)
-    and returns a dictionary of outputs (geometry data, transforms, metadata).
+    and returns a SolveResult (geometry data, transforms, metadata).
     
     Each Solver represents a specific engineering domain (Frame, Duct, Wall).
     """
     
     @abstractmethod
-    def solve(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    def solve(self, inputs: Dict[str, Any]) -> SolveResult:
         """
         Execute the solver logic.
         
@@ -22,12 +70,12 @@ class BaseSolver(ABC):
                     Example: {'width': 100, 'height': 200, 'load': 50}
                     
         Returns:
-            Dictionary containing the results.
-            Standardized Keys:
-            - 'parts': Dict[str, build123d.Solid] - The generated geometry
-            - 'transforms': Dict[str, build123d.Location] - The placement of parts
-            - 'anchors': Dict[str, Dict[str, Tuple]] - Connection points for other solvers
-            - 'metadata': Dict[str, Any] - Engineering data (weight, cost, etc.)
+            SolveResult containing the results.
+            Standardized Fields:
+            - parts: Dict[str, build123d.Solid] - The generated geometry
+            - transforms: Dict[str, build123d.Location] - The placement of parts
+            - anchors: Dict[str, Dict[str, Tuple]] - Connection points for other solvers
+            - metadata: Dict[str, Any] - Engineering data (weight, cost, etc.)
         """
         pass
 
@@ -38,3 +86,32 @@ class BaseSolver(ABC):
         Returns True if valid, raises ValueError if invalid.
         """
         return True
+
+
+# Solver Registry
+# Maps a domain name ('frame', 'duct', 'wall') to its solver class, so graph
+# builders can resolve a solver once and reuse the bound solve method.
+SOLVER_REGISTRY: Dict[str, Type[BaseSolver]] = {}
+
+
+def register(name: str) -> Callable[[Type[BaseSolver]], Type[BaseSolver]]:
+    """
+    Class decorator that registers a solver under a domain name.
+
+    Usage:
+        @register("frame")
+        class FrameSolver(BaseSolver): ...
+    """
+    def decorator(cls: Type[BaseSolver]) -> Type[BaseSolver]:
+        SOLVER_REGISTRY[name] = cls
+        return cls
+    return decorator
+
+
+def resolve_solver(name: str) -> Callable[[Dict[str, Any]], SolveResult]:
+    """
+    Instantiate the registered solver once and return its bound solve method.
+    Call this at graph-build time and keep the result for per-part solves.
+    Raises KeyError if no solver is registered under the name.
+    """
+    return SOLVER_REGISTRY[name]().solve
@@ -1,10 +1,137 @@
 
+import functools
+import json
 from typing import Dict, Any, Tuple, List
+import numpy as np
 import build123d as bd
 from company.twin.tools.objects.wide_flange import WideFlangeGenerator
 from company.twin.tools.objects.hss_tube import HSSGenerator
-from .base_solver import BaseSolver
+from company.twin.tools.utils._numba_compat import njit
+from .base_solver import BaseSolver, SolveResult, register
 
+
+@njit(cache=True, fastmath=True)
+def _box_props(d: float, bf: float, tf: float, tw: float) -> Tuple[float, float, float, float]:
+    """(A, Ix, Sx, r) of a rectangular box section."""
+    # Box Area
+    outer_area = d * bf
+    inner_d = d - 2*tf
+    inner_b = bf - 2*tw
+    inner_area = inner_d * inner_b
+    area = outer_area - inner_area
+    
+    # Moment of Inertia (Ix) - Strong Axis
+    # (b h^3 - bi hi^3) / 12  (cubes as explicit products)
+    d3 = d * d * d
+    inner_d3 = inner_d * inner_d * inner_d
+    ix = (bf * d3 - inner_b * inner_d3) / 12.0
+    
+    # Radius of Gyration (r) approx
+    # r = sqrt(I/A)
+    r = (ix / area)**0.5 if area > 0 else 1.0
+    
+    # Section Modulus (Sx) = Ix / (d/2)
+    sx = ix / (d / 2.0)
+    return area, ix, sx, r
+
+
+@njit(cache=True, fastmath=True)
+def _i_beam_props(d: float, bf: float, tf: float, tw: float) -> Tuple[float, float, float, float]:
+    """(A, Ix, Sx, r) of an I-beam approximated as flanges + web."""
+    # Area = 2*bf*tf + (d-2*tf)*tw
+    area = 2 * bf * tf + (d - 2*tf) * tw
+    
+    # Ix = (b h^3 - (b-tw)(h-2tf)^3) / 12  (cubes as explicit products)
+    d3 = d * d * d
+    di = d - 2*tf
+    di3 = di * di * di
+    ix = (bf * d3 - (bf - tw) * di3) / 12.0
+    
+    # r approx
+    r = (ix / area)**0.5 if area > 0 else 1.0
+    
+    # Section Modulus (Sx) = Ix / (d/2)
+    sx = ix / (d / 2.0)
+    return area, ix, sx, r
+
+
+@njit(cache=True, fastmath=True)
+def _center_load_deflection(P: float, L: float, E: float, Ix: float) -> float:
+    """Midspan deflection of a simply supported beam under a center point load: P L^3 / 48 E I."""
+    return (P * L * L * L) / (48.0 * E * Ix)
+
+
+@functools.lru_cache(maxsize=512)
+def _section_props(designation: str, is_box: bool, d: float, bf: float, tf: float, tw: float) -> Tuple[float, float, float, float]:
+    """
+    Section property math behind FrameSolver.calculate_section_properties.
+    Returns (A, Ix, Sx, r). Memoized across solves; keyed on designation plus
+    dimensions so edited profiles stay correct. Call _section_props.cache_clear()
+    if the AISC tables are reloaded.
+    """
+    # Simplified: Box or I-Beam approximation (see kernels above)
+    if is_box:
+        area, ix, sx, r = _box_props(d, bf, tf, tw)
+    else:
+        area, ix, sx, r = _i_beam_props(d, bf, tf, tw)
+    
+    # Plain floats regardless of input types (int dims compile int specializations under Numba)
+    return float(area), float(ix), float(sx), float(r)
+
+
+def _build_member(profile: Dict[str, Any], length: float) -> bd.Solid:
+    """Builds a member solid based on profile type (W-Shape or HSS)."""
+    designation = profile.get('designation', '')
+    if designation.startswith('HSS') or 'Tube' in designation:
+        return HSSGenerator.create_from_aisc(profile, length=length)
+    else:
+        return WideFlangeGenerator.create_from_aisc(profile, length=length)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_member(profile_key: str, length: float) -> bd.Solid:
+    """
+    Memoized _build_member keyed on the profile's JSON (designation plus dimensions,
+    so edited profiles stay correct) and the exact length, so placements computed
+    from that length stay exact. Repeated solves and sweeps over width / num_frames
+    reuse the column and connecting-beam solids.
+    """
+    return _build_member(json.loads(profile_key), length)
+
+
+def _translation_matrix(x: float, y: float, z: float) -> np.ndarray:
+    """4x4 column-vector translation matrix."""
+    m = np.eye(4)
+    m[:3, 3] = (x, y, z)
+    return m
+
+
+def _rotation_matrix(axis: str, degrees: float) -> np.ndarray:
+    """4x4 right-handed rotation about a principal axis ('X', 'Y' or 'Z')."""
+    c = float(np.cos(np.radians(degrees)))
+    s = float(np.sin(np.radians(degrees)))
+    i, j = {'X': (1, 2), 'Y': (2, 0), 'Z': (0, 1)}[axis]
+    m = np.eye(4)
+    m[i, i] = c
+    m[i, j] = -s
+    m[j, i] = s
+    m[j, j] = c
+    return m
+
+
+@functools.lru_cache(maxsize=64)
+def _instance_keys(prefix: str, count: int, indexed: bool) -> Tuple[str, ...]:
+    """
+    Instance names for count copies of a member: prefix_0 .. prefix_{count-1},
+    or bare prefix when not indexed (single frame). Memoized so repeated solves
+    with the same frame count reuse the strings instead of re-formatting them.
+    """
+    if not indexed:
+        return (prefix,) * count
+    return tuple(f"{prefix}_{i}" for i in range(count))
+
+
+@register("frame")
 class FrameSolver(BaseSolver):
     """
     Solver for Structural Steel Frames.
@@ -17,6 +144,7 @@ class FrameSolver(BaseSolver):
         """
         Calculate Section Properties (Ix, Sx, A, r) from dimensions.
         Approximates based on shape (I-Beam or Box).
+        Results are cached per (designation, dimensions); see _section_props.
         """
         # Extract Dimensions
         d = profile.get('depth_d') or profile.get('outer_height', 10.0)
@@ -24,38 +152,9 @@ class FrameSolver(BaseSolver):
         tf = profile.get('flange_thickness_tf') or profile.get('wall_thickness', 0.5)
         tw = profile.get('web_thickness_tw') or profile.get('wall_thickness', 0.5)
         name = profile.get('designation', '')
+        is_box = 'HSS' in name or 'Tube' in name
         
-        # Area
-        # Simplified: Box or I-Beam area
-        if 'HSS' in name or 'Tube' in name:
-            # Box Area
-            outer_area = d * bf
-            inner_d = d - 2*tf
-            inner_b = bf - 2*tw
-            inner_area = inner_d * inner_b
-            area = outer_area - inner_area
-            
-            # Moment of Inertia (Ix) - Strong Axis
-            # (b h^3 - bi hi^3) / 12
-            ix = (bf * d**3 - inner_b * inner_d**3) / 12.0
-            
-            # Radius of Gyration (r) approx
-            # r = sqrt(I/A)
-            r = (ix / area)**0.5 if area > 0 else 1.0
-            
-        else:
-            # I-Beam Approximation (Flanges + Web)
-            # Area = 2*bf*tf + (d-2*tf)*tw
-            area = 2 * bf * tf + (d - 2*tf) * tw
-            
-            # Ix = (b h^3 - (b-tw)(h-2tf)^3) / 12
-            ix = (bf * d**3 - (bf - tw) * (d - 2*tf)**3) / 12.0
-            
-            # r approx
-            r = (ix / area)**0.5 if area > 0 else 1.0
-            
-        # Section Modulus (Sx) = Ix / (d/2)
-        sx = ix / (d / 2.0)
+        area, ix, sx, r = _section_props(name, is_box, d, bf, tf, tw)
         
         return {
             'A': area,
@@ -68,14 +167,124 @@ class FrameSolver(BaseSolver):
     def _create_member(self, profile: Dict[str, Any], length: float) -> bd.Solid:
         """
         Creates a member solid based on profile type (W-Shape or HSS).
+        Solids are cached per (profile, length); see _cached_member.
+        Callers must treat the result as immutable (place it via Locations, no .move()).
         """
-        designation = profile.get('designation', '')
-        if designation.startswith('HSS') or 'Tube' in designation:
-            return HSSGenerator.create_from_aisc(profile, length=length)
+        try:
+            profile_key = json.dumps(profile, sort_keys=True)
+        except (TypeError, ValueError):
+            return _build_member(profile, length)
+        
+        return _cached_member(profile_key, float(length))
+
+    @staticmethod
+    def _profile_half_extents(profile: Dict[str, Any], orientation_deg: float) -> Tuple[float, float]:
+        """
+        Returns (half_x, half_y) of the profile's axis-aligned footprint after rotating
+        it by orientation_deg about Z. Mirrors the generator layouts: W shapes put bf
+        along X and d along Y, rectangular HSS outer_width x outer_height, all centered.
+        """
+        if profile.get('shape') == 'round':
+            radius = profile.get('outer_diameter', 6.0) / 2.0
+            return radius, radius
+        
+        half_bf = (profile.get('flange_width_bf') or profile.get('outer_width', 6.0)) / 2.0
+        half_d = (profile.get('depth_d') or profile.get('outer_height', 6.0)) / 2.0
+        
+        theta = np.radians(orientation_deg)
+        c = abs(float(np.cos(theta)))
+        s = abs(float(np.sin(theta)))
+        return c * half_bf + s * half_d, s * half_bf + c * half_d
+
+    def _validate(self, header_profile: Dict[str, Any], point_load_lbs: float, header_length: float) -> Dict[str, Any]:
+        """
+        Header deflection / bending check under a center point load (simply supported).
+        Returns the validation dict stored in metadata['validation'].
+        """
+        # Constants
+        E = 29000.0 # ksi (Steel)
+        Fy = 50.0   # ksi
+        
+        # Header Properties
+        h_props = self.calculate_section_properties(header_profile)
+        Ix = h_props['Ix']
+        Sx = h_props['Sx']
+        
+        # Load P (kips)
+        P = point_load_lbs / 1000.0
+        L = header_length
+        
+        # Deflection Delta (Center Point Load - Simply Supported)
+        # P L^3 / 48 E I
+        if Ix > 0:
+            delta = float(_center_load_deflection(P, L, E, Ix))
         else:
-            return WideFlangeGenerator.create_from_aisc(profile, length=length)
+            delta = 999.0
+            
+        # Max Moment M (Center Point Load)
+        # P L / 4
+        M = (P * L) / 4.0
+        
+        # Bending Stress fb
+        # M / Sx
+        if Sx > 0:
+            fb = M / Sx
+        else:
+            fb = 999.0
+            
+        # Allowable Limits
+        # Deflection: L/360 (Stricter standard for live loads/finishes)
+        limit_delta = L / 360.0
+        
+        # Stress: 0.66 Fy (ASD approx)
+        limit_stress = 0.66 * Fy
+        
+        # Status
+        status = "PASS"
+        if delta > limit_delta or fb > limit_stress:
+            status = "FAIL"
+            
+        return {
+            'point_load_lbs': point_load_lbs,
+            'deflection': delta,
+            'limit_deflection': limit_delta,
+            'stress': fb,
+            'limit_stress': limit_stress,
+            'status': status
+        }
+
+    @staticmethod
+    def _place_single_frame(
+        transforms: Dict[str, Any],
+        half_width: float,
+        bp_thk: float,
+        header_center_y: float,
+        bp_rot_m: np.ndarray,
+        bp_euler: Tuple[float, float, float],
+        header_local_m: np.ndarray,
+        header_euler: Tuple[float, float, float]
+    ) -> Tuple[List[str], List[str], np.ndarray]:
+        """
+        Straight-line placement for a single frame at Z = 0 with both columns.
+        Fills transforms and returns (instance names, solid ids, (5, 4, 4) matrices)
+        in the same order the general path emits them.
+        """
+        names = ['base_plate_left', 'column_left', 'base_plate_right', 'column_right', 'header']
+        solid_ids = ['base_plate', 'col_main', 'base_plate', 'col_main', 'header']
+        eulers = (bp_euler, (0, 0, 0), bp_euler, (0, 0, 0), header_euler)
+        
+        mats = np.empty((5, 4, 4))
+        mats[0] = _translation_matrix(-half_width, 0, 0) @ bp_rot_m
+        mats[1] = _translation_matrix(-half_width, bp_thk, 0)
+        mats[2] = _translation_matrix(half_width, 0, 0) @ bp_rot_m
+        mats[3] = _translation_matrix(half_width, bp_thk, 0)
+        mats[4] = _translation_matrix(0, header_center_y, 0) @ header_local_m
+        
+        for name, solid_id, pos, euler in zip(names, solid_ids, mats[:, :3, 3].tolist(), eulers):
+            transforms[name] = (solid_id, bd.Location(tuple(pos), euler))
+        return names, solid_ids, mats
 
-    def solve(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    def solve(self, inputs: Dict[str, Any]) -> SolveResult:
 
         """
         Execute the frame solver logic.
@@ -92,9 +301,11 @@ class FrameSolver(BaseSolver):
                 - num_frames (int): Number of frames to array
                 - frame_spacing (float): Spacing between frames
                 - conn_beam_profile (Dict): AISC data for connecting beams
+                - validate (bool): Run the header deflection/stress check (default True)
                 
         Returns:
-            Dictionary with 'parts', 'transforms', 'anchors', 'metadata'.
+            SolveResult with parts (unique solids by solid_id), transforms
+            (instance name -> (solid_id, Location)), anchors, metadata.
         """
         # Validate / Extract Inputs
         width = inputs.get('width', 144.0)
@@ -114,38 +325,14 @@ class FrameSolver(BaseSolver):
             raise ValueError("Missing profile data for FrameSolver")
 
         # ---------------------------------------------------------
-        # 1. TEMPORARY CONTEXT: Measure Columns
+        # 1. COLUMN EXTENTS (analytic, no temp solid)
         # ---------------------------------------------------------
         
-        # Create a temp column to measure its bounding box in the rotated state
-        temp_col = self._create_member(col_profile, length=height)
-        
-        # Apply orientation (local rotation around Z)
-        temp_col = temp_col.rotate(bd.Axis.Z, col_orientation)
-        
-        # Measure X-extent (Half Width) & Y-extent (for connecting beams)
-        bbox = temp_col.bounding_box()
-        max_x = bbox.max.X
-        min_x = bbox.min.X
-        col_half_width = max(abs(max_x), abs(min_x))
-        
-        # Depth for connecting beams (Local Y, Global Z when upright? No, Column is vertical Z)
-        # When column is vertical (Z-up in build123d temp), its "Depth" in the array direction
-        # depends on orientation.
-        # Orientation 0: Web along X. Flanges along Y. Depth is bounding box Y.
-        # Orientation 90: Web along Y. Flanges along X. Depth is bounding box X (relative to original).
-        # In the temp_col (Z-up), we rotated by col_orientation.
-        # Array direction will be Global Z (in Omniverse/Result) -> which corresponds to build123d Y?
-        # Wait, let's check coordinate mapping.
-        # "rotate(bd.Axis.X, -90)" creates the upright column in output.
-        # build123d Z -> Global Y (Up).
-        # build123d X -> Global X (Right).
-        # build123d Y -> Global Z (Back/Depth).
-        
-        # So we need the extent of temp_col along Y axis.
-        max_y = bbox.max.Y
-        min_y = bbox.min.Y
-        col_half_depth = max(abs(max_y), abs(min_y))
+        # Half extents of the column footprint after the local Z rotation.
+        # Coordinate mapping ("rotate(bd.Axis.X, -90)" stands the column up):
+        # build123d X -> Global X (Right), build123d Y -> Global Z (Depth).
+        # So the X extent sets the header clearance, the Y extent the conn beam length.
+        col_half_width, col_half_depth = self._profile_half_extents(col_profile, col_orientation)
         
         # ---------------------------------------------------------
         # 2. CALCULATE HEADER GEOMETRY
@@ -169,7 +356,8 @@ class FrameSolver(BaseSolver):
             bp_len, bp_wid, bp_thk,
             align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MIN)
         )
-        bp_rot = bd.Rotation(-90, 0, 0)
+        bp_euler = (-90, 0, 0)
+        bp_rot_m = _rotation_matrix('X', -90)
         
         # -- COLUMN GEOMETRY --
         col_length = height - bp_thk
@@ -184,13 +372,16 @@ class FrameSolver(BaseSolver):
         header_top_y = height
         header_center_y = header_top_y - (header_depth / 2)
         
+        # The raw member is kept as built; centering (-L/2 in Z) and orienting along X
+        # (90 deg about Y) are folded into one local Location applied per instance.
         h_solid = self._create_member(header_profile, length=header_length)
-        h_solid = h_solid.move(bd.Location((0, 0, -header_length/2))) # Center Z
-        h_solid = h_solid.rotate(bd.Axis.Y, 90) # Orient along X
+        header_euler = (0, 90, 0)
+        header_local_m = _rotation_matrix('Y', 90) @ _translation_matrix(0, 0, -header_length/2)
         
         # -- CONNECTING BEAM GEOMETRY --
         conn_beam_solid = None
         conn_beam_length = 0.0
+        conn_beam_local_m = None
         
         if num_frames > 1 and conn_beam_profile:
             # Calculate Length
@@ -216,8 +407,8 @@ class FrameSolver(BaseSolver):
             # But create_member usually creates along Z.
             # So it is already along Z!
             
-            # Center it?
-            conn_beam_solid = conn_beam_solid.move(bd.Location((0, 0, -conn_beam_length/2)))
+            # Center it? (-L/2 in Z, applied through conn_beam_local_m below;
+            # member solids are cached and shared, so they are never moved in place)
             
             # Move to location:
             # We need it at Top of Steel? Or flush with Header Top?
@@ -234,144 +425,116 @@ class FrameSolver(BaseSolver):
             # Yes, usually.
             
             cb_center_y = height - (cb_depth / 2)
-            conn_beam_solid = conn_beam_solid.move(bd.Location((0, cb_center_y, 0)))
+            conn_beam_local_m = _translation_matrix(0, cb_center_y, -conn_beam_length/2)
 
 
+        # ---------------------------------------------------------
+        # 4. ENGINEERING VALIDATION (First Frame Only for now)
+        # Independent of the frame index, so computed before the frame loop.
+        # Skipped (None) when inputs['validate'] is False, e.g. for parameter sweeps.
+        # ---------------------------------------------------------
+        validation_data = None
+        if inputs.get('validate', True):
+            validation_data = self._validate(header_profile, point_load_lbs, header_length)
+
         # ---------------------------------------------------------
         # LOOP FRAMES
         # ---------------------------------------------------------
         
+        # Each unique solid is stored once; transforms map instance names to
+        # (solid_id, Location) so consumers tessellate per solid, not per instance.
+        parts['base_plate'] = base_plate
+        parts['col_main'] = col_solid
+        parts['header'] = h_solid
+        if conn_beam_solid is not None:
+            parts['conn_beam'] = conn_beam_solid
+        
         skip_left = inputs.get('skip_start_col_left', False)
         skip_right = inputs.get('skip_start_col_right', False)
         
-        for i in range(num_frames):
-            
-            z_offset = -i * frame_spacing # Negative Z is usually "into" the screen/scene in some conventions, or positive?
-            # USD: Z is forward/back. Let's use negative Z to go "back"? 
-            # Or positive? frame_spacing is positive.
-            # Let's use NEGATIVE Z for "Depth" (standard "back" direction in some Right Handed systems? No, usually -Z is forward in OpenGL, +Z back).
-            # In USD, +Z is usually "Front" or "Back" depending on setup.
-            # Let's use -Z for subsequent frames to march "backwards" effectively.
-            
-            # Suffix for keys
-            sfx = f"_{i}" if num_frames > 1 else ""
-            
-            # -- BASE PLATES --
-            # Left
-            if not (i == 0 and skip_left):
-                loc_bp_left = bd.Location((-width/2, 0, z_offset)) * bp_rot
-                parts[f'base_plate_left{sfx}'] = base_plate
-                transforms[f'base_plate_left{sfx}'] = loc_bp_left
-            
-            # Right
-            if not (i == 0 and skip_right):
-                loc_bp_right = bd.Location((width/2, 0, z_offset)) * bp_rot
-                parts[f'base_plate_right{sfx}'] = base_plate
-                transforms[f'base_plate_right{sfx}'] = loc_bp_right
-            
-            # -- COLUMNS --
-            # Left
-            if not (i == 0 and skip_left):
-                loc_col_left = bd.Location((-width/2, bp_thk, z_offset))
-                parts[f"column_left{sfx}"] = col_solid
-                transforms[f"column_left{sfx}"] = loc_col_left
-            
-            # Right
-            if not (i == 0 and skip_right):
-                loc_col_right = bd.Location((width/2, bp_thk, z_offset))
-                parts[f"column_right{sfx}"] = col_solid
-                transforms[f"column_right{sfx}"] = loc_col_right
-            
-            # -- HEADER --
-            loc_header = bd.Location((0, header_center_y, z_offset))
-            parts[f'header{sfx}'] = h_solid
-            transforms[f'header{sfx}'] = loc_header
-            
-            # -- CONNECTING BEAMS --
-            # Create beams pointing to the NEXT frame (if not last frame)
-            if conn_beam_solid and i < num_frames - 1:
-                
-                # Center of this span in Z
-                # Current Frame Z: z_offset
-                # Next Frame Z: z_offset - frame_spacing
-                # Midpoint Z: z_offset - (frame_spacing / 2)
-                
-                mid_z = z_offset - (frame_spacing / 2.0)
-                
-                # Left Side Beam
-                # X = -width/2
-                loc_cb_left = bd.Location((-width/2, 0, mid_z))
-                parts[f'conn_beam_left_{i}'] = conn_beam_solid
-                transforms[f'conn_beam_left_{i}'] = loc_cb_left
-                
-                # Right Side Beam
-                # X = width/2
-                loc_cb_right = bd.Location((width/2, 0, mid_z))
-                parts[f'conn_beam_right_{i}'] = conn_beam_solid
-                transforms[f'conn_beam_right_{i}'] = loc_cb_right
-                
+        if num_frames == 1 and not (skip_left or skip_right):
+            # Common UI case: one frame at Z = 0, nothing skipped, no connecting beams.
+            inst_names, inst_solids, inst_matrices = self._place_single_frame(
+                transforms, width * 0.5, bp_thk, header_center_y,
+                bp_rot_m, bp_euler, header_local_m, header_euler
+            )
+        else:
+            # Frame Z offsets and connecting-beam span midpoints for every frame,
+            # generated in one vectorized pass.
+            # Use -Z for subsequent frames to march "backwards" effectively.
+            frame_z = -np.arange(num_frames, dtype=np.float64) * frame_spacing
+            half_spacing = frame_spacing * 0.5
+            span_mid_z = frame_z[:-1] - half_spacing
         
-        # ---------------------------------------------------------
-        # 4. ENGINEERING VALIDATION (First Frame Only for now)
-        # ---------------------------------------------------------
+            # Loop invariants, hoisted out of the per-side / per-family code below
+            indexed = num_frames > 1
+            half_width = width * 0.5
+            sides_x = (('left', -half_width), ('right', half_width))
+            identity = np.eye(4)
+            no_rotation = (0, 0, 0)
         
-        # Constants
-        E = 29000.0 # ksi (Steel)
-        Fy = 50.0   # ksi
+            # Emit masks: only the first frame's columns/base plates can be skipped.
+            # Computed once so the side loops below visit emitted frames only.
+            left_mask = np.ones(num_frames, dtype=bool)
+            left_mask[:1] = not skip_left
+            right_mask = np.ones(num_frames, dtype=bool)
+            right_mask[:1] = not skip_right
         
-        # Header Properties
-        h_props = self.calculate_section_properties(header_profile)
-        Ix = h_props['Ix']
-        Sx = h_props['Sx']
+            # Instance table (SoA): names, solid ids and one 4x4 matrix per placement.
+            # Each member family is composed in one batched matmul (stacked translations
+            # @ fixed local matrix); bd.Location objects are only built at the end from
+            # the composed translation and the family's fixed rotation.
+            inst_names = []
+            inst_solids = []
+            inst_blocks = []
         
-        # Load P (kips)
-        P = point_load_lbs / 1000.0
-        L = header_length
+            def add_family(keys, solid_id, positions, local_m, euler):
+                stack = np.tile(identity, (len(keys), 1, 1))
+                stack[:, :3, 3] = positions
+                mats = np.matmul(stack, local_m)
+                for key, pos in zip(keys, mats[:, :3, 3].tolist()):
+                    transforms[key] = (solid_id, bd.Location(tuple(pos), euler))
+                inst_names.extend(keys)
+                inst_solids.extend([solid_id] * len(keys))
+                inst_blocks.append(mats)
         
-        # Deflection Delta (Center Point Load - Simply Supported)
-        # P L^3 / 48 E I
-        if Ix > 0:
-            delta = (P * L**3) / (48 * E * Ix)
-        else:
-            delta = 999.0
-            
-        # Max Moment M (Center Point Load)
-        # P L / 4
-        M = (P * L) / 4.0
+            # -- BASE PLATES + COLUMNS (per side) --
+            for (side, x), mask in zip(sides_x, (left_mask, right_mask)):
+                idx = np.flatnonzero(mask)
+                z = frame_z[idx]
+                bp_keys = _instance_keys(f'base_plate_{side}', num_frames, indexed)
+                col_keys = _instance_keys(f'column_{side}', num_frames, indexed)
+                idx = idx.tolist()
+                add_family([bp_keys[i] for i in idx], 'base_plate',
+                           np.column_stack((np.full_like(z, x), np.zeros_like(z), z)), bp_rot_m, bp_euler)
+                add_family([col_keys[i] for i in idx], 'col_main',
+                           np.column_stack((np.full_like(z, x), np.full_like(z, bp_thk), z)), identity, no_rotation)
         
-        # Bending Stress fb
-        # M / Sx
-        if Sx > 0:
-            fb = M / Sx
-        else:
-            fb = 999.0
-            
-        # Allowable Limits
-        # Deflection: L/360 (Stricter standard for live loads/finishes)
-        limit_delta = L / 360.0
+            # -- HEADERS --
+            add_family(list(_instance_keys('header', num_frames, indexed)), 'header',
+                       np.column_stack((np.zeros_like(frame_z), np.full_like(frame_z, header_center_y), frame_z)),
+                       header_local_m, header_euler)
         
-        # Stress: 0.66 Fy (ASD approx)
-        limit_stress = 0.66 * Fy
+            # -- CONNECTING BEAMS --
+            # One beam per side per span, pointing to the NEXT frame
+            # (span midpoints precomputed: z_offset - half_spacing)
+            if conn_beam_solid:
+                num_spans = len(span_mid_z)
+                zeros = np.zeros_like(span_mid_z)
+                for side, x in sides_x:
+                    add_family(list(_instance_keys(f'conn_beam_{side}', num_spans, True)), 'conn_beam',
+                               np.column_stack((np.full_like(span_mid_z, x), zeros, span_mid_z)),
+                               conn_beam_local_m, no_rotation)
+            inst_matrices = np.concatenate(inst_blocks) if inst_blocks else np.empty((0, 4, 4))
         
-        # Status
-        status = "PASS"
-        if delta > limit_delta or fb > limit_stress:
-            status = "FAIL"
-            
-        validation_data = {
-            'point_load_lbs': point_load_lbs,
-            'deflection': delta,
-            'limit_deflection': limit_delta,
-            'stress': fb,
-            'limit_stress': limit_stress,
-            'status': status
-        }
-
-        return {
-            'parts': parts,
-            'transforms': transforms,
-            'anchors': anchors,
-            'metadata': {
+        return SolveResult(
+            parts=parts,
+            transforms=transforms,
+            anchors=anchors,
+            instance_names=inst_names,
+            instance_solids=inst_solids,
+            instance_matrices=inst_matrices,
+            metadata={
                 'header_length': header_length,
                 'col_orientation': col_orientation,
                 'gap': gap,
@@ -381,4 +544,4 @@ class FrameSolver(BaseSolver):
                 'conn_beam_length': conn_beam_length,
                 'num_frames': num_frames
             }
-        }
+        )
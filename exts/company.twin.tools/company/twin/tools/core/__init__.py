@@ -1,2 +1,2 @@
 # Core calculation modules
-from .smacna import SMACNADuctSizer, PressureClass, StiffenerType, GaugeInfo, DuctSize, StiffenerRequirements
+from .smacna import SMACNADuctSizer, PressureClass, StiffenerType, GaugeInfo, DuctSize, DuctSizeBatch, StiffenerRequirements
@@ -9,10 +9,15 @@ It provides functions for:
 """
 
 import math
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import Tuple, Optional
 from enum import Enum
 
+import numpy as np
+
+from ..utils._numba_compat import njit
+
 
 class PressureClass(Enum):
     """SMACNA Static Pressure Classifications"""
@@ -34,7 +39,7 @@ class StiffenerType(Enum):
     TIE_ROD = "tie_rod"              # Internal rod connecting opposite walls
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GaugeInfo:
     """Sheet metal gauge information"""
     gauge: int
@@ -42,7 +47,7 @@ class GaugeInfo:
     thickness_mm: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DuctSize:
     """Calculated duct dimensions"""
     width: float  # inches
@@ -52,7 +57,29 @@ class DuctSize:
     aspect_ratio: float
 
 
-@dataclass
+@dataclass(slots=True)
+class DuctSizeBatch:
+    """Calculated duct dimensions for a run of segments (one array per field)"""
+    width: np.ndarray  # inches
+    height: np.ndarray  # inches
+    area_sqin: np.ndarray
+    equivalent_diameter: np.ndarray
+    aspect_ratio: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.width)
+
+    def __getitem__(self, i: int) -> DuctSize:
+        return DuctSize(
+            width=float(self.width[i]),
+            height=float(self.height[i]),
+            area_sqin=float(self.area_sqin[i]),
+            equivalent_diameter=float(self.equivalent_diameter[i]),
+            aspect_ratio=float(self.aspect_ratio[i])
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class StiffenerRequirements:
     """Stiffener/reinforcement requirements for a duct"""
     stiffener_type: StiffenerType
@@ -82,6 +109,16 @@ GAUGE_TABLE = {
     999: [18, 18, 16, 16, 16],  # 85"+
 }
 
+# Precomputed lookup indices for GAUGE_TABLE (built once at import).
+# bisect_left / np.searchsorted on these reproduce the "first entry >= value" scans.
+_PRESSURE_CLASSES = (0.5, 1.0, 2.0, 3.0, 4.0)
+_MAX_DIMS = tuple(sorted(GAUGE_TABLE))
+# One row per max-dimension bucket, plus a trailing 26 ga row for sizes past the table
+_GAUGE_ROWS = tuple(tuple(GAUGE_TABLE[m]) for m in _MAX_DIMS) + ((26,) * len(_PRESSURE_CLASSES),)
+_PRESSURE_CLASSES_ARR = np.array(_PRESSURE_CLASSES)
+_MAX_DIMS_ARR = np.array(_MAX_DIMS, dtype=np.float64)
+_GAUGE_MATRIX = np.array(_GAUGE_ROWS, dtype=np.int64)
+
 # Stiffener spacing by pressure class (inches)
 STIFFENER_SPACING = {
     0.5: 96,  # 8 feet
@@ -94,6 +131,27 @@ STIFFENER_SPACING = {
 }
 
 
+@njit(cache=True, fastmath=True)
+def _eq_dia(width: float, height: float) -> float:
+    """De = 1.3 × (W × H)^0.625 / (W + H)^0.25 for positive W, H."""
+    return 1.3 * (width * height)**0.625 / (width + height)**0.25
+
+
+# Stiffener selection when a panel needs stiffening:
+# bisect_left(_STIFFENER_PC_BOUNDS, pressure_class) -> row of
+# (stiffener_type, tie_rod_required, cross_break_required, notes)
+_STIFFENER_PC_BOUNDS = (1.0, 2.0, 3.0)
+_STIFFENER_TABLE = (
+    (StiffenerType.CROSS_BREAK, False, True, "Cross-break stiffening required"),     # <= 1"
+    (StiffenerType.STANDING_SEAM, False, False, "Standing seam reinforcement required"),  # <= 2"
+    (StiffenerType.ANGLE, False, False, "Angle stiffener reinforcement required"),   # <= 3"
+    (StiffenerType.TIE_ROD, True, False, "Tie rod reinforcement required"),          # > 3"
+)
+
+# log(1.3), the equivalent-diameter coefficient for the batch log-space form
+_LOG_1_3 = math.log(1.3)
+
+
 class SMACNADuctSizer:
     """SMACNA-compliant duct sizing and construction calculator"""
     
@@ -154,6 +212,71 @@ class SMACNADuctSizer:
             aspect_ratio=actual_aspect
         )
     
+    @staticmethod
+    def calculate_duct_size_batch(
+        cfm,
+        velocity_fpm=1200,
+        aspect_ratio=1.0,
+        round_to: float = 2.0
+    ) -> DuctSizeBatch:
+        """
+        Vectorized calculate_duct_size for a whole duct run.
+        
+        Args:
+            cfm: Array of airflows in cubic feet per minute
+            velocity_fpm: Air velocity in feet per minute (scalar or array)
+            aspect_ratio: Width/Height ratio (scalar or array, clamped to 1.0-4.0)
+            round_to: Round dimensions to this increment (default 2")
+            
+        Returns:
+            DuctSizeBatch with one entry per input segment
+        """
+        cfm = np.asarray(cfm, dtype=np.float64)
+        velocity_fpm = np.asarray(velocity_fpm, dtype=np.float64)
+        aspect_ratio = np.clip(np.asarray(aspect_ratio, dtype=np.float64), 1.0, 4.0)
+        
+        # Required cross-sectional area
+        area_sqin = (cfm / velocity_fpm) * 144
+        
+        # W/H = aspect_ratio, W*H = area (square ducts keep W == H exactly)
+        width = np.sqrt(area_sqin * aspect_ratio)
+        height = np.where(
+            aspect_ratio == 1.0,
+            width,
+            np.divide(area_sqin, width, out=np.zeros_like(width), where=width > 0)
+        )
+        width, height = np.broadcast_arrays(width, height)
+        
+        # Round to specified increment
+        width = np.ceil(width / round_to) * round_to
+        height = np.ceil(height / round_to) * round_to
+        
+        # Recalculate actual area after rounding
+        actual_area = width * height
+        actual_aspect = np.divide(width, height, out=np.ones_like(width), where=height > 0)
+        
+        # Equivalent diameter, 0.0 where either side is zero.
+        # Log-space form (exp of 0.625 ln A - 0.25 ln(W + H) + ln 1.3), evaluated
+        # in place: one exp + two logs and no extra temporaries per segment.
+        valid = (width > 0) & (height > 0)
+        eq_dia = np.zeros_like(width)
+        log_sum = width[valid] + height[valid]
+        np.log(log_sum, out=log_sum)
+        log_sum *= -0.25
+        log_eq = np.log(actual_area[valid])
+        log_eq *= 0.625
+        log_eq += log_sum
+        log_eq += _LOG_1_3
+        eq_dia[valid] = np.exp(log_eq, out=log_eq)
+        
+        return DuctSizeBatch(
+            width=width,
+            height=height,
+            area_sqin=actual_area,
+            equivalent_diameter=eq_dia,
+            aspect_ratio=actual_aspect
+        )
+    
     @staticmethod
     def _equivalent_diameter(width: float, height: float) -> float:
         """
@@ -163,7 +286,7 @@ class SMACNADuctSizer:
         """
         if width <= 0 or height <= 0:
             return 0.0
-        return 1.3 * math.pow(width * height, 0.625) / math.pow(width + height, 0.25)
+        return float(_eq_dia(width, height))
     
     @staticmethod
     def get_gauge(
@@ -185,25 +308,35 @@ class SMACNADuctSizer:
         # Use the larger dimension
         max_dim = max(width, height)
         
-        # Find the pressure class index
-        pressure_classes = [0.5, 1.0, 2.0, 3.0, 4.0]
-        pc_index = 2  # Default to 2" w.g.
-        for i, pc in enumerate(pressure_classes):
-            if pressure_class <= pc:
-                pc_index = i
-                break
-        else:
-            pc_index = len(pressure_classes) - 1
+        # Pressure class index (classes above 4" w.g. use the 4" column)
+        pc_index = min(bisect_left(_PRESSURE_CLASSES, pressure_class), len(_PRESSURE_CLASSES) - 1)
         
-        # Find gauge from table
-        gauge = 26  # Default
-        for max_size, gauges in sorted(GAUGE_TABLE.items()):
-            if max_dim <= max_size:
-                gauge = gauges[pc_index]
-                break
+        # Size bucket (past the last bucket falls through to the 26 ga default row)
+        gauge = _GAUGE_ROWS[bisect_left(_MAX_DIMS, max_dim)][pc_index]
         
         return GAUGE_THICKNESS.get(gauge, GAUGE_THICKNESS[26])
     
+    @staticmethod
+    def get_gauge_batch(width, height, pressure_class=2.0) -> np.ndarray:
+        """
+        Vectorized get_gauge for a whole duct list.
+        
+        Args:
+            width: Array of duct widths in inches
+            height: Array of duct heights in inches
+            pressure_class: Static pressure in inches w.g. (scalar or array)
+            
+        Returns:
+            Integer array of gauge numbers (look up GAUGE_THICKNESS for thickness)
+        """
+        max_dim = np.maximum(np.asarray(width, dtype=np.float64), np.asarray(height, dtype=np.float64))
+        pc_index = np.minimum(
+            np.searchsorted(_PRESSURE_CLASSES_ARR, pressure_class),
+            len(_PRESSURE_CLASSES) - 1
+        )
+        row = np.searchsorted(_MAX_DIMS_ARR, max_dim)
+        return _GAUGE_MATRIX[row, pc_index]
+    
     @staticmethod
     def get_stiffener_requirements(
         width: float,
@@ -237,22 +370,10 @@ class SMACNADuctSizer:
         cross_break_required = False
         notes = ""
         
-        # SMACNA criteria for stiffening
+        # SMACNA criteria for stiffening (type by pressure class bucket, see _STIFFENER_TABLE)
         if max_dim >= 19 and panel_area_sqft > 10 and gauge >= 20:
-            if pressure_class <= 1.0:
-                stiffener_type = StiffenerType.CROSS_BREAK
-                cross_break_required = True
-                notes = "Cross-break stiffening required"
-            elif pressure_class <= 2.0:
-                stiffener_type = StiffenerType.STANDING_SEAM
-                notes = "Standing seam reinforcement required"
-            elif pressure_class <= 3.0:
-                stiffener_type = StiffenerType.ANGLE
-                notes = "Angle stiffener reinforcement required"
-            else:
-                stiffener_type = StiffenerType.TIE_ROD
-                tie_rod_required = True
-                notes = "Tie rod reinforcement required"
+            stiffener_type, tie_rod_required, cross_break_required, notes = \
+                _STIFFENER_TABLE[bisect_left(_STIFFENER_PC_BOUNDS, pressure_class)]
         
         # Large ducts may need tie rods regardless
         if max_dim >= 60:
@@ -294,6 +415,11 @@ def size_duct(cfm: float, velocity: float = 1200, aspect: float = 1.0) -> DuctSi
     return SMACNADuctSizer.calculate_duct_size(cfm, velocity, aspect)
 
 
+def size_duct_batch(cfm, velocity=1200, aspect=1.0) -> DuctSizeBatch:
+    """Quick function to size a whole duct run from an array of CFM values."""
+    return SMACNADuctSizer.calculate_duct_size_batch(cfm, velocity, aspect)
+
+
 def get_gauge(width: float, height: float, pressure: float = 2.0) -> GaugeInfo:
     """Quick function to get gauge for duct dimensions."""
     return SMACNADuctSizer.get_gauge(width, height, pressure)
@@ -2,11 +2,13 @@
 TripoSR / Tripo Cloud API Clients
 ===================================
 Lightweight HTTP clients for 3D mesh generation from images.
-Uses only stdlib (urllib) — no requests/httpx dependency needed in Kit.
+Uses only stdlib (urllib / http.client) — no requests/httpx dependency needed in Kit;
+orjson is picked up for JSON when installed.
 
 Two backends:
   - ``TripoSRClient``   — local FastAPI server (open-source TripoSR model)
   - ``TripoCloudClient`` — Tripo cloud API (v2.5/v3.0 models, PBR textures)
+  - ``AsyncTripoCloudClient`` — asyncio front end for running several cloud jobs at once
 
 Usage::
 
@@ -17,45 +19,462 @@ Usage::
     # Cloud API
     cloud = TripoCloudClient("tsk_xxxxx")
     result = cloud.generate("widget.png")  # returns GLB
+    results = cloud.generate_many(["a.png", "b.png"], concurrency=4)
+
+    # Cloud API, concurrent jobs (inside a coroutine)
+    async with AsyncTripoCloudClient("tsk_xxxxx") as cloud:
+        results = await cloud.generate_many(["a.png", "b.png"])
 """
 
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import http.client
+import io
 import json
 import os
+import secrets
+import socket
+import ssl
 import tempfile
+import threading
 import time
-import uuid
+import urllib.parse
 import urllib.request
 import urllib.error
-from typing import Optional
+from typing import Awaitable, BinaryIO, List, Optional, Tuple, Union
+
+# Optional: orjson parses the small per-poll JSON payloads several times faster;
+# without it the stdlib json module is used.
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+if HAS_ORJSON:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Optional: httpx lets AsyncTripoCloudClient multiplex the status polls of all
+# in-flight jobs over one connection (HTTP/2 when h2 is also installed); without
+# it polls run on the executor over the keep-alive pool.
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import h2  # noqa: F401  (httpx's HTTP/2 backend)
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+# Read/write block size when streaming a response body to disk
+_COPY_BUFSIZE = 1024 * 1024
+
+# Multipart framing, filled with bytes %-formatting (boundary, field, filename)
+_PART_HEADER = (
+    b"--%s\r\n"
+    b'Content-Disposition: form-data; name="%s"; filename="%s"\r\n'
+    b"Content-Type: application/octet-stream\r\n"
+    b"\r\n"
+)
+_PART_CLOSE = b"\r\n--%s--\r\n"
+
+
+def _copy_response(resp, sink: BinaryIO) -> None:
+    """
+    Stream an HTTP response into ``sink`` through one reused buffer: readinto()
+    fills it in place, so no bytes object is allocated per chunk. Short writes
+    (unbuffered sinks) are resumed.
+    """
+    buf = memoryview(bytearray(_COPY_BUFSIZE))
+    while True:
+        n = resp.readinto(buf)
+        if not n:
+            return
+        view = buf[:n]
+        while view:
+            view = view[sink.write(view):]
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    """
+    One default-verified TLS context for every client and pooled connection, so
+    CA certificates are loaded once rather than per new HTTPS connection.
+    """
+    ctx = ssl.create_default_context()
+    ctx.set_alpn_protocols(["http/1.1"])
+    return ctx
+
+
+def _new_boundary() -> bytes:
+    """Random multipart boundary; one per client is reused for every upload."""
+    return secrets.token_hex(16).encode()
+
+
+class _MultipartFileBody:
+    """
+    Single-file multipart/form-data body streamed from disk.
+
+    Iterating yields the part header, then the file in _COPY_BUFSIZE blocks read
+    into one reused buffer, then the closing boundary. http.client sends each
+    piece as it comes, so the file is never concatenated with its framing or held
+    in memory in full; len() gives the exact Content-Length up front. Every
+    iteration starts from the beginning, so a retry simply sends it again.
+    """
+
+    def __init__(self, field_name: str, path: str, boundary: bytes):
+        self.boundary = boundary
+        filename = os.path.basename(path).encode()
+        self._prefix = _PART_HEADER % (boundary, field_name.encode(), filename)
+        self._suffix = _PART_CLOSE % boundary
+        self._path = path
+        self._length = len(self._prefix) + os.path.getsize(path) + len(self._suffix)
+        self._active = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __enter__(self) -> "_MultipartFileBody":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def headers(self) -> dict:
+        return {
+            "Content-Type": "multipart/form-data; boundary=" + self.boundary.decode(),
+            "Content-Length": str(self._length),
+        }
+
+    def __iter__(self):
+        self.close()
+        self._active = self._chunks()
+        return self._active
+
+    def _chunks(self):
+        yield self._prefix
+        buf = bytearray(_COPY_BUFSIZE)
+        view = memoryview(buf)
+        with open(self._path, "rb", buffering=0) as f:
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                yield view[:n]
+        yield self._suffix
+
+    def close(self) -> None:
+        """Stop an unfinished iteration and release its file handle."""
+        if self._active is not None:
+            self._active.close()
+            self._active = None
+
+
+class _HealthCache:
+    """
+    Last "ready" health payload for one client, reused for ``ttl`` seconds.
+
+    Entries are keyed on what they were fetched with (server URL / API key), so
+    changing either forces a fresh check. After the TTL the entry is kept as the
+    last-known-good answer returned (marked "stale") when a refresh fails.
+    """
+
+    def __init__(self, ttl: float = 10.0):
+        self.ttl = ttl
+        self._entry = None  # (key, monotonic timestamp, payload)
+
+    def get(self, key) -> Optional[dict]:
+        entry = self._entry
+        if entry is not None and entry[0] == key and time.monotonic() - entry[1] < self.ttl:
+            return dict(entry[2])
+        return None
+
+    def put(self, key, payload: dict) -> None:
+        if payload.get("status") == "ready":
+            self._entry = (key, time.monotonic(), dict(payload))
+
+    def stale(self, key, detail: str) -> Optional[dict]:
+        entry = self._entry
+        if entry is None or entry[0] != key:
+            return None
+        return {**entry[2], "status": "stale", "detail": detail}
+
+
+class _PollSchedule:
+    """
+    Adaptive delay between task status polls.
+
+    When the server reports ``running_left_time`` (its own ETA in seconds), the
+    next poll is scheduled for that moment (1-15 s). Otherwise, when the task
+    reports ``progress`` (0-100), the remaining time is estimated from the
+    progress rate so far and the next poll lands about a quarter of the way
+    there (1-15 s). Without either the delay grows geometrically from the first
+    delay (x1.3, capped at 8 s). Consecutive polls with no progress back off a
+    further x1.5 each. Delays never run past the deadline.
+    """
+
+    MIN_DELAY = 1.0
+    MAX_DELAY = 15.0
+    GROWTH = 1.3
+    GEOMETRIC_CAP = 8.0
+    STALL_BACKOFF = 1.5
+
+    def __init__(self, first_delay: float = 1.0):
+        self._delay = first_delay
+        self._first = True
+        self._t0 = time.monotonic()
+        self._last_progress = None
+        self._stalls = 0
+
+    def next_delay(self, task_data: dict, deadline: float) -> float:
+        progress = task_data.get("progress")
+        if not isinstance(progress, (int, float)):
+            progress = None
+
+        if progress is not None and self._last_progress is not None and progress <= self._last_progress:
+            self._stalls += 1
+        else:
+            self._stalls = 0
+        self._last_progress = progress
+
+        eta = task_data.get("running_left_time")
+        if isinstance(eta, (int, float)) and eta > 0:
+            self._first = False
+            self._delay = min(self.MAX_DELAY, max(self.MIN_DELAY, float(eta)))
+            return max(0.0, min(self._delay, deadline - time.monotonic()))
+
+        if self._first:
+            self._first = False
+            delay = self._delay
+        elif progress is not None and 0 < progress < 100:
+            elapsed = time.monotonic() - self._t0
+            remaining_est = elapsed * (100.0 - progress) / progress
+            delay = min(self.MAX_DELAY, max(self.MIN_DELAY, remaining_est / 4.0))
+        else:
+            delay = min(self.GEOMETRIC_CAP, self._delay * self.GROWTH)
+        self._delay = delay
+
+        delay = min(self.MAX_DELAY, delay * self.STALL_BACKOFF ** self._stalls)
+        return max(0.0, min(delay, deadline - time.monotonic()))
+
+
+class _ConnectionPool:
+    """
+    Keep-alive HTTP(S) connections per (scheme, host, port), stdlib only.
+
+    Connections are checked out for one request and returned once the response
+    has been read in full, so callers on different threads (UI + worker) never
+    share a socket. Failures surface like urlopen: urllib.error.HTTPError for
+    status >= 400, urllib.error.URLError for connection errors.
+    """
+
+    _REDIRECTS = (301, 302, 303, 307, 308)
+    # BadStatusLine covers RemoteDisconnected (server closed the idle socket)
+    _STALE_ERRORS = (http.client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+    # Methods safe to re-send after the server may already have received them
+    _IDEMPOTENT = frozenset(("GET", "HEAD", "PUT", "DELETE", "OPTIONS"))
+
+    # Resolved addresses are reused for this long before asking DNS again
+    DNS_TTL = 300.0
+
+    def __init__(self, maxsize: int = 8):
+        self.maxsize = maxsize
+        self._idle = {}  # (scheme, host, port) -> [HTTPConnection]
+        self._lock = threading.Lock()
+        self._dns = {}  # (host, port) -> (monotonic resolve time, [ip, ...])
+
+    def _resolve(self, host: str, port: int) -> List[str]:
+        entry = self._dns.get((host, port))
+        if entry is not None and time.monotonic() - entry[0] < self.DNS_TTL:
+            return entry[1]
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        ips = list(dict.fromkeys(info[4][0] for info in infos))
+        self._dns[(host, port)] = (time.monotonic(), ips)
+        return ips
+
+    def _create_connection(self, address, timeout, source_address=None):
+        """
+        socket.create_connection() with getaddrinfo answers cached for DNS_TTL.
+        TLS still verifies against the hostname (server_hostname is unchanged).
+        """
+        host, port = address
+        err = None
+        for ip in self._resolve(host, port):
+            try:
+                return socket.create_connection((ip, port), timeout, source_address)
+            except OSError as e:
+                err = e
+        # Every cached address failed: resolve afresh next time
+        self._dns.pop((host, port), None)
+        raise err if err is not None else OSError(f"no addresses for {host}")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _split(url: str):
+        """Parse ``url`` into (pool key, request target), once per distinct URL."""
+        parts = urllib.parse.urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        return (parts.scheme, parts.hostname, parts.port), target
+
+    def _checkout(self, key, timeout: float):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        scheme, host, port = key
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout, blocksize=65536,
+                                               context=_ssl_context())
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout, blocksize=65536)
+        conn._create_connection = self._create_connection
+        return conn, False
+
+    def _checkin(self, key, conn) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            conns = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for conn in conns:
+            conn.close()
+
+    def request(self, method: str, url: str, body=None,
+                headers: Optional[dict] = None, timeout: float = 15.0,
+                sink: Optional[BinaryIO] = None, redirects: int = 5,
+                meta: Optional[dict] = None) -> bytes:
+        """
+        Perform one request on a pooled connection. ``body`` may be bytes, a
+        readable file-like object (sent in 64 KB blocks) or a re-iterable of
+        byte chunks; give a Content-Length for the latter two.
+
+        Returns the response body, or streams it into ``sink`` in 1 MB chunks
+        and returns b"". GET redirects are followed up to ``redirects`` times.
+        If ``meta`` is given it receives the final "status" and "headers".
+        """
+        key, target = self._split(url)
+        conn, reused = self._checkout(key, timeout)
+        try:
+            sent = False
+            try:
+                conn.request(method, target, body=body, headers=headers or {})
+                sent = True
+                resp = conn.getresponse()
+            except self._STALE_ERRORS:
+                # Server dropped an idle keep-alive socket: retry once on a fresh
+                # one. Once the request went out the server may have acted on
+                # it, so only idempotent methods are repeated (a second
+                # POST /task would create a second, billed task).
+                conn.close()
+                if not reused or (sent and method not in self._IDEMPOTENT):
+                    raise
+                if hasattr(body, "seek"):
+                    body.seek(0)  # file bodies; iterable bodies restart on their own
+                conn.request(method, target, body=body, headers=headers or {})
+                resp = conn.getresponse()
+
+            if resp.status in self._REDIRECTS and method == "GET" and redirects > 0:
+                location = resp.getheader("Location")
+                resp.read()
+                self._release(key, conn, resp)
+                conn = None
+                return self.request(method, urllib.parse.urljoin(url, location), body, headers,
+                                    timeout, sink, redirects - 1, meta)
+
+            if meta is not None:
+                meta["status"] = resp.status
+                meta["headers"] = resp.headers
+
+            if resp.status >= 400 or sink is None:
+                data = resp.read()
+            else:
+                data = b""
+                _copy_response(resp, sink)
+            self._release(key, conn, resp)
+            conn = None
+        except urllib.error.URLError:
+            raise
+        except (OSError, http.client.HTTPException) as e:
+            raise urllib.error.URLError(e) from e
+        finally:
+            if conn is not None:
+                conn.close()
+
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(data))
+        return data
+
+    def _release(self, key, conn, resp) -> None:
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
 
 
 class TripoSRClient:
     """Synchronous client for the TripoSR FastAPI server."""
 
+    _GENERATE_QUERY = (
+        "remove_bg={remove_bg}&foreground_ratio={foreground_ratio}"
+        "&mc_resolution={mc_resolution}&output_format={output_format}"
+    )
+
     def __init__(self, base_url: str = "http://127.0.0.1:8000"):
         self.base_url = base_url.rstrip("/")
+        self._health_cache = _HealthCache(ttl=10.0)
+        self._boundary = _new_boundary()
+        self._opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=_ssl_context()))
 
     # ------------------------------------------------------------------
     # Health
     # ------------------------------------------------------------------
     def is_ready(self, timeout: float = 3.0) -> bool:
         """Return True if the server is up and the model is loaded."""
-        try:
-            req = urllib.request.Request(f"{self.base_url}/health")
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                data = json.loads(resp.read())
-                return data.get("status") == "ready"
-        except Exception:
-            return False
+        return self.health(timeout).get("status") == "ready"
 
     def health(self, timeout: float = 3.0) -> dict:
-        """Return the full health payload or an error dict."""
+        """
+        Return the full health payload or an error dict.
+        A "ready" payload is reused for 10 s; if a later check fails, the last
+        one is returned with status "stale".
+        """
+        key = self.base_url
+        cached = self._health_cache.get(key)
+        if cached is not None:
+            return cached
         try:
             req = urllib.request.Request(f"{self.base_url}/health")
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                return json.loads(resp.read())
+            with self._opener.open(req, timeout=timeout) as resp:
+                data = _json_loads(resp.read())
         except Exception as e:
-            return {"status": "error", "detail": str(e)}
+            return self._health_cache.stale(key, str(e)) or {"status": "error", "detail": str(e)}
+        self._health_cache.put(key, data)
+        return data
 
     # ------------------------------------------------------------------
     # Generate
@@ -84,44 +503,23 @@ class TripoSRClient:
             dict with keys: job_id, mesh_path, format, elapsed_seconds
             On error: dict with key "error".
         """
-        if not os.path.exists(image_path):
-            return {"error": f"Image file not found: {image_path}"}
-
-        # Build query string
-        params = (
-            f"remove_bg={'true' if remove_bg else 'false'}"
-            f"&foreground_ratio={foreground_ratio}"
-            f"&mc_resolution={mc_resolution}"
-            f"&output_format={output_format}"
+        params = self._GENERATE_QUERY.format(
+            remove_bg="true" if remove_bg else "false",
+            foreground_ratio=foreground_ratio,
+            mc_resolution=mc_resolution,
+            output_format=output_format,
         )
         url = f"{self.base_url}/generate/json?{params}"
 
-        # Build multipart/form-data body
-        boundary = uuid.uuid4().hex
-        filename = os.path.basename(image_path)
-
-        with open(image_path, "rb") as f:
-            file_data = f.read()
-
-        body = (
-            f"--{boundary}\r\n"
-            f'Content-Disposition: form-data; name="image"; filename="{filename}"\r\n'
-            f"Content-Type: application/octet-stream\r\n"
-            f"\r\n"
-        ).encode() + file_data + f"\r\n--{boundary}--\r\n".encode()
-
-        req = urllib.request.Request(
-            url,
-            data=body,
-            headers={
-                "Content-Type": f"multipart/form-data; boundary={boundary}",
-            },
-            method="POST",
-        )
-
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                return json.loads(resp.read())
+            # Multipart/form-data body streamed from the image file (a missing
+            # file raises FileNotFoundError here, before any network work)
+            with _MultipartFileBody("image", image_path, self._boundary) as body:
+                req = urllib.request.Request(url, data=body, headers=body.headers, method="POST")
+                with self._opener.open(req, timeout=timeout) as resp:
+                    return _json_loads(resp.read())
+        except FileNotFoundError:
+            return {"error": f"Image file not found: {image_path}"}
         except urllib.error.HTTPError as e:
             detail = e.read().decode(errors="replace") if e.fp else str(e)
             return {"error": f"HTTP {e.code}: {detail}"}
@@ -136,82 +534,103 @@ class TripoCloudClient:
 
     BASE_URL = "https://api.tripo3d.ai/v2/openapi"
 
+    # Model downloads are split into up to this many concurrent Range requests,
+    # each at least _RANGE_MIN_PART bytes
+    _RANGE_PARTS = 4
+    _RANGE_MIN_PART = 4 * 1024 * 1024
+
+    # Uploaded image tokens are reused for identical files for this long
+    # (Tripo expires them server-side)
+    _TOKEN_TTL = 3600.0
+
     def __init__(self, api_key: str = ""):
         self.api_key = api_key
+        # Keep-alive connections to the API host and the model CDN host, reused
+        # across upload, task creation, every poll and the download.
+        self._pool = _ConnectionPool(maxsize=8)
+        self._health_cache = _HealthCache(ttl=10.0)
+        self._boundary = _new_boundary()
+        # (api_key, blake2b of file) -> (monotonic upload time, image_token)
+        self._token_cache = {}
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _request(self, method: str, path: str, body: Optional[bytes] = None,
+    def _request(self, method: str, path: str, body: Optional[Union[bytes, BinaryIO]] = None,
                  headers: Optional[dict] = None, timeout: float = 15.0) -> dict:
         """Make an authenticated request and return parsed JSON."""
         url = f"{self.BASE_URL}{path}"
         hdrs = {"Authorization": f"Bearer {self.api_key}"}
         if headers:
             hdrs.update(headers)
-        req = urllib.request.Request(url, data=body, headers=hdrs, method=method)
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read())
+        return _json_loads(self._pool.request(method, url, body=body, headers=hdrs, timeout=timeout))
 
     # ------------------------------------------------------------------
     # Health / balance
     # ------------------------------------------------------------------
     def is_ready(self, timeout: float = 5.0) -> bool:
         """Return True if the API key is valid (balance check succeeds)."""
-        try:
-            data = self._request("GET", "/user/balance", timeout=timeout)
-            return data.get("code") == 0
-        except Exception:
-            return False
+        return self.health(timeout).get("status") == "ready"
 
     def health(self, timeout: float = 5.0) -> dict:
-        """Return balance info or an error dict."""
+        """
+        Return balance info or an error dict.
+        A "ready" result is reused for 10 s per API key; if a later check fails,
+        the last one is returned with status "stale".
+        """
+        key = self.api_key
+        cached = self._health_cache.get(key)
+        if cached is not None:
+            return cached
         try:
             data = self._request("GET", "/user/balance", timeout=timeout)
-            if data.get("code") == 0:
-                bal = data.get("data", {})
-                return {
-                    "status": "ready",
-                    "balance": bal.get("balance", 0),
-                    "frozen": bal.get("frozen", 0),
-                }
-            return {"status": "error", "detail": data.get("message", "unknown")}
         except Exception as e:
-            return {"status": "error", "detail": str(e)}
+            return self._health_cache.stale(key, str(e)) or {"status": "error", "detail": str(e)}
+        if data.get("code") == 0:
+            bal = data.get("data", {})
+            info = {
+                "status": "ready",
+                "balance": bal.get("balance", 0),
+                "frozen": bal.get("frozen", 0),
+            }
+            self._health_cache.put(key, info)
+            return info
+        return {"status": "error", "detail": data.get("message", "unknown")}
 
     # ------------------------------------------------------------------
     # Upload image → image_token
     # ------------------------------------------------------------------
     def _upload_image(self, image_path: str, timeout: float = 30.0) -> str:
-        """Upload an image file and return the image_token."""
-        boundary = uuid.uuid4().hex
-        filename = os.path.basename(image_path)
+        """
+        Upload an image file and return the image_token. A file whose content
+        was uploaded within _TOKEN_TTL with the same API key is not re-sent.
+        An http(s) URL is returned unchanged: the task references it directly
+        and Tripo fetches it, so there is no upload round-trip at all.
+        """
+        if image_path.startswith(("http://", "https://")):
+            return image_path
 
         with open(image_path, "rb") as f:
-            file_data = f.read()
-
-        body = (
-            f"--{boundary}\r\n"
-            f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
-            f"Content-Type: application/octet-stream\r\n"
-            f"\r\n"
-        ).encode() + file_data + f"\r\n--{boundary}--\r\n".encode()
-
-        url = f"{self.BASE_URL}/upload"
-        req = urllib.request.Request(
-            url, data=body,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": f"multipart/form-data; boundary={boundary}",
-            },
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            data = json.loads(resp.read())
+            digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+        key = (self.api_key, digest)
+        cached = self._token_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._TOKEN_TTL:
+            return cached[1]
+
+        with _MultipartFileBody("file", image_path, self._boundary) as body:
+            data = self._request("POST", "/upload", body=body, headers=body.headers, timeout=timeout)
 
         if data.get("code") != 0:
             raise RuntimeError(f"Upload failed: {data.get('message', data)}")
-        return data["data"]["image_token"]
+        token = data["data"]["image_token"]
+        self._token_cache[key] = (time.monotonic(), token)
+        return token
+
+    def _forget_image_token(self, image_token: str) -> None:
+        """Drop a cached token the API rejected, so the next run uploads again."""
+        for key, (_, token) in list(self._token_cache.items()):
+            if token == image_token:
+                self._token_cache.pop(key, None)
 
     # ------------------------------------------------------------------
     # Create task
@@ -225,51 +644,77 @@ class TripoCloudClient:
         face_limit: int = 50000,
         timeout: float = 15.0,
     ) -> str:
-        """Submit an image_to_model task and return the task_id."""
+        """
+        Submit an image_to_model task and return the task_id. ``image_token``
+        is an upload token or an image URL (see _upload_image).
+        """
+        if image_token.startswith(("http://", "https://")):
+            ext = os.path.splitext(urllib.parse.urlsplit(image_token).path)[1].lower().lstrip(".")
+            file_ref = {"type": "jpg" if ext in ("", "jpeg") else ext, "url": image_token}
+        else:
+            file_ref = {"type": "image", "file_token": image_token}
         payload = {
             "type": "image_to_model",
-            "file": {"type": "image", "file_token": image_token},
+            "file": file_ref,
             "model_version": model_version,
             "texture": texture,
             "pbr": pbr,
             "face_limit": face_limit,
         }
-        body = json.dumps(payload).encode()
-        data = self._request(
-            "POST", "/task",
-            body=body,
-            headers={"Content-Type": "application/json"},
-            timeout=timeout,
-        )
+        body = _json_dumps(payload)
+        try:
+            data = self._request(
+                "POST", "/task",
+                body=body,
+                headers={"Content-Type": "application/json"},
+                timeout=timeout,
+            )
+        except urllib.error.HTTPError:
+            self._forget_image_token(image_token)
+            raise
         if data.get("code") != 0:
+            self._forget_image_token(image_token)
             raise RuntimeError(f"Task creation failed: {data.get('message', data)}")
         return data["data"]["task_id"]
 
     # ------------------------------------------------------------------
     # Poll task until completion
     # ------------------------------------------------------------------
+    @staticmethod
+    def _check_task(task_id: str, data: dict) -> dict:
+        """Return the task data from a poll response; raise if the task failed."""
+        if data.get("code") != 0:
+            raise RuntimeError(f"Poll error: {data.get('message', data)}")
+
+        task_data = data["data"]
+        status = task_data.get("status")
+
+        if status in ("failed", "cancelled", "unknown"):
+            raise RuntimeError(f"Task {task_id} {status}: {task_data}")
+        return task_data
+
     def _poll_task(
         self,
         task_id: str,
-        poll_interval: float = 3.0,
+        poll_interval: float = 1.0,
         timeout: float = 300.0,
     ) -> dict:
-        """Poll until the task succeeds or fails. Returns the task data dict."""
+        """
+        Poll until the task succeeds or fails. Returns the task data dict.
+        poll_interval is the first delay; later delays follow _PollSchedule.
+        """
         deadline = time.monotonic() + timeout
+        schedule = _PollSchedule(poll_interval)
+        # Same URL every iteration, so the pool hands back the same keep-alive
+        # socket (LIFO) and the parsed target from _ConnectionPool._split.
+        path = f"/task/{task_id}"
         while time.monotonic() < deadline:
-            data = self._request("GET", f"/task/{task_id}", timeout=15.0)
-            if data.get("code") != 0:
-                raise RuntimeError(f"Poll error: {data.get('message', data)}")
-
-            task_data = data["data"]
-            status = task_data.get("status")
-
-            if status == "success":
+            data = self._request("GET", path, timeout=15.0)
+            task_data = self._check_task(task_id, data)
+            if task_data.get("status") == "success":
                 return task_data
-            if status in ("failed", "cancelled", "unknown"):
-                raise RuntimeError(f"Task {task_id} {status}: {task_data}")
 
-            time.sleep(poll_interval)
+            time.sleep(schedule.next_delay(task_data, deadline))
 
         raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
 
@@ -277,18 +722,74 @@ class TripoCloudClient:
     # Download output file
     # ------------------------------------------------------------------
     def _download_file(self, url: str, dest_path: str, timeout: float = 60.0) -> str:
-        """Download a file from a URL to a local path."""
+        """
+        Download a file from a URL to a local path.
+
+        The first request asks for the first _RANGE_MIN_PART bytes. A server
+        without Range support answers 200 with the whole file, which lands in
+        dest_path as-is, and files no larger than one part are complete after
+        the 206. Otherwise the total size comes from Content-Range and the
+        rest of the file is fetched as parallel ranges into a preallocated
+        file. An empty object (416, "bytes */0") yields an empty file.
+        """
         os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            with open(dest_path, "wb") as f:
-                while True:
-                    chunk = resp.read(65536)
-                    if not chunk:
-                        break
-                    f.write(chunk)
+        meta = {}
+        first = self._RANGE_MIN_PART
+        # Unbuffered: the pool already writes in _COPY_BUFSIZE blocks
+        with open(dest_path, "wb", buffering=0) as f:
+            try:
+                self._pool.request("GET", url, headers={"Range": f"bytes=0-{first - 1}"},
+                                   timeout=timeout, sink=f, meta=meta)
+            except urllib.error.HTTPError as e:
+                if e.code != 416:
+                    raise
+                # Unsatisfiable range: empty object, or a server that
+                # rejects the probe -- fall back to one plain GET
+                f.seek(0)
+                f.truncate()
+                if (e.headers.get("Content-Range") or "").rpartition("/")[2] != "0":
+                    self._pool.request("GET", url, timeout=timeout, sink=f)
+                return dest_path
+            if meta["status"] != 206:
+                return dest_path
+            total = meta["headers"].get("Content-Range", "").rpartition("/")[2]
+            if not total.isdigit() or f.tell() != min(first, int(total)):
+                f.seek(0)
+                f.truncate()
+                self._pool.request("GET", url, timeout=timeout, sink=f)
+                return dest_path
+            size = int(total)
+            if size <= first:
+                return dest_path
+            f.truncate(size)
+
+        # The first part is already on disk; fetch the remainder in parallel
+        rest = size - first
+        n = max(1, min(self._RANGE_PARTS, rest // self._RANGE_MIN_PART))
+        step = -(-rest // n)
+        ranges = [(a, min(a + step, size) - 1) for a in range(first, size, step)]
+        try:
+            with concurrent.futures.ThreadPoolExecutor(len(ranges)) as ex:
+                for fut in [ex.submit(self._download_range, url, dest_path, a, b, timeout)
+                            for a, b in ranges]:
+                    fut.result()
+        except urllib.error.URLError:
+            # Range not honoured mid-way (or a part failed): one plain GET
+            with open(dest_path, "wb", buffering=0) as f:
+                self._pool.request("GET", url, timeout=timeout, sink=f)
         return dest_path
 
+    def _download_range(self, url: str, dest_path: str, start: int, end: int,
+                        timeout: float) -> None:
+        """Write bytes start..end (inclusive) of ``url`` at the same offset in dest_path."""
+        meta = {}
+        with open(dest_path, "r+b", buffering=0) as f:
+            f.seek(start)
+            self._pool.request("GET", url, headers={"Range": f"bytes={start}-{end}"},
+                               timeout=timeout, sink=f, meta=meta)
+            if meta["status"] != 206 or f.tell() != end + 1:
+                raise urllib.error.URLError(f"range {start}-{end} not honoured")
+
     # ------------------------------------------------------------------
     # Generate (full pipeline)
     # ------------------------------------------------------------------
@@ -299,18 +800,17 @@ class TripoCloudClient:
         texture: bool = True,
         pbr: bool = True,
         face_limit: int = 50000,
-        poll_interval: float = 3.0,
+        poll_interval: float = 1.0,
         timeout: float = 300.0,
     ) -> dict:
         """
         Full pipeline: upload → create task → poll → download GLB.
+        image_path may also be an http(s) URL, which skips the upload step.
 
         Returns dict matching TripoSRClient.generate() shape:
             {mesh_path, job_id, elapsed_seconds, format}
-        On error: {error}.
+        On error: {error}. A missing image surfaces from the upload step.
         """
-        if not os.path.exists(image_path):
-            return {"error": f"Image file not found: {image_path}"}
         if not self.api_key:
             return {"error": "No API key configured"}
 
@@ -325,32 +825,242 @@ class TripoCloudClient:
                 face_limit=face_limit,
             )
             task_data = self._poll_task(task_id, poll_interval=poll_interval, timeout=timeout)
+            return self._fetch_model(task_id, task_data, t0)
+        except Exception as e:
+            return self._error_result(e)
 
-            # Extract the model download URL from rendered output
-            output = task_data.get("output", {})
-            model_url = output.get("pbr_model") or output.get("model")
-            if not model_url:
-                return {"error": f"No model URL in task output: {output}"}
-
-            # Download to temp dir
-            out_dir = os.path.join(tempfile.gettempdir(), "tripo_cloud", task_id)
-            dest = os.path.join(out_dir, "model.glb")
-            self._download_file(model_url, dest)
-
-            elapsed = round(time.monotonic() - t0, 1)
-            return {
-                "mesh_path": dest,
-                "job_id": task_id,
-                "elapsed_seconds": elapsed,
-                "format": "glb",
-            }
+    def generate_many(self, image_paths: List[str], concurrency: int = 4, **kwargs) -> List[dict]:
+        """
+        Run generate() for several images concurrently (at most ``concurrency``
+        jobs in flight), sharing this client's connection pool. Returns one
+        result dict per image, in input order. Blocks: call from a worker thread,
+        or use AsyncTripoCloudClient from a coroutine.
+        """
+        if not image_paths:
+            return []
+        workers = max(1, min(concurrency, len(image_paths)))
+        with concurrent.futures.ThreadPoolExecutor(workers) as ex:
+            return list(ex.map(functools.partial(self.generate, **kwargs), image_paths))
 
-        except urllib.error.HTTPError as e:
+    def _fetch_model(self, task_id: str, task_data: dict, t0: float) -> dict:
+        """Download the finished task's GLB and build the generate() result dict."""
+        # Extract the model download URL from rendered output
+        output = task_data.get("output", {})
+        model_url = output.get("pbr_model") or output.get("model")
+        if not model_url:
+            return {"error": f"No model URL in task output: {output}"}
+
+        # Download to temp dir
+        out_dir = os.path.join(tempfile.gettempdir(), "tripo_cloud", task_id)
+        dest = os.path.join(out_dir, "model.glb")
+        self._download_file(model_url, dest)
+
+        elapsed = round(time.monotonic() - t0, 1)
+        return {
+            "mesh_path": dest,
+            "job_id": task_id,
+            "elapsed_seconds": elapsed,
+            "format": "glb",
+        }
+
+    @staticmethod
+    def _error_result(e: Exception) -> dict:
+        """Map a pipeline exception to the {error} result dict."""
+        if isinstance(e, FileNotFoundError):
+            return {"error": f"Image file not found: {e.filename}"}
+        if isinstance(e, urllib.error.HTTPError):
             detail = e.read().decode(errors="replace") if e.fp else str(e)
             return {"error": f"HTTP {e.code}: {detail}"}
-        except urllib.error.URLError as e:
+        if isinstance(e, urllib.error.URLError):
             return {"error": f"Connection failed: {e.reason}"}
-        except (RuntimeError, TimeoutError) as e:
+        if isinstance(e, (RuntimeError, TimeoutError)):
             return {"error": str(e)}
+        return {"error": f"Unexpected error: {e}"}
+
+
+class AsyncTripoCloudClient:
+    """
+    asyncio client for the Tripo cloud API.
+
+    Wraps a TripoCloudClient: each HTTP call runs on the loop's default executor
+    over the shared keep-alive pool, and polling waits with asyncio.sleep, so the
+    Kit event loop keeps running and several image jobs can be in flight at once.
+    With httpx installed, status polls are awaited natively on one shared
+    httpx.AsyncClient (HTTP/2 with h2), so concurrent jobs poll over one socket;
+    uploads and downloads stay on the pool.
+    """
+
+    def __init__(self, api_key: str = "", max_concurrency: int = 4, upload_concurrency: int = 2):
+        self._client = TripoCloudClient(api_key)
+        self.max_concurrency = max_concurrency
+        self.upload_concurrency = upload_concurrency
+        self._http = None  # httpx.AsyncClient, created on first use inside the loop
+
+    @property
+    def api_key(self) -> str:
+        return self._client.api_key
+
+    @api_key.setter
+    def api_key(self, value: str) -> None:
+        self._client.api_key = value
+
+    async def __aenter__(self) -> "AsyncTripoCloudClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._client._pool.close()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _run(self, fn, *args, **kwargs):
+        """Run a blocking client call on the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
+    async def _request(self, method: str, path: str, timeout: float = 15.0) -> dict:
+        """
+        Authenticated JSON call without a body. Uses httpx when available and
+        raises the same urllib.error types as TripoCloudClient._request.
+        """
+        if not HAS_HTTPX:
+            return await self._run(self._client._request, method, path, timeout=timeout)
+
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=HAS_H2,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                timeout=httpx.Timeout(30.0),
+            )
+        url = f"{self._client.BASE_URL}{path}"
+        try:
+            resp = await self._http.request(
+                method, url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=timeout,
+            )
+        except httpx.TransportError as e:
+            raise urllib.error.URLError(e) from e
+        if resp.status_code >= 400:
+            raise urllib.error.HTTPError(
+                url, resp.status_code, resp.reason_phrase, resp.headers, io.BytesIO(resp.content)
+            )
+        return _json_loads(resp.content)
+
+    # ------------------------------------------------------------------
+    # Health / balance
+    # ------------------------------------------------------------------
+    async def is_ready(self, timeout: float = 5.0) -> bool:
+        """Return True if the API key is valid (balance check succeeds)."""
+        return await self._run(self._client.is_ready, timeout)
+
+    async def health(self, timeout: float = 5.0) -> dict:
+        """Return balance info or an error dict."""
+        return await self._run(self._client.health, timeout)
+
+    # ------------------------------------------------------------------
+    # Poll task until completion
+    # ------------------------------------------------------------------
+    async def _poll_task(
+        self,
+        task_id: str,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+    ) -> dict:
+        """Poll until the task succeeds or fails without blocking the event loop."""
+        deadline = time.monotonic() + timeout
+        schedule = _PollSchedule(poll_interval)
+        path = f"/task/{task_id}"
+        while time.monotonic() < deadline:
+            data = await self._request("GET", path, timeout=15.0)
+            task_data = self._client._check_task(task_id, data)
+            if task_data.get("status") == "success":
+                return task_data
+
+            await asyncio.sleep(schedule.next_delay(task_data, deadline))
+
+        raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
+
+    # ------------------------------------------------------------------
+    # Generate (full pipeline)
+    # ------------------------------------------------------------------
+    async def _upload(self, image_path: str,
+                      slots: Optional[asyncio.Semaphore] = None) -> Tuple[float, str]:
+        """Upload one image; returns (job start time, image_token)."""
+        if slots is None:
+            t0 = time.monotonic()
+            return t0, await self._run(self._client._upload_image, image_path)
+        async with slots:
+            t0 = time.monotonic()
+            return t0, await self._run(self._client._upload_image, image_path)
+
+    async def _complete(
+        self,
+        upload: Awaitable[Tuple[float, str]],
+        model_version: str = "v2.5-20250123",
+        texture: bool = True,
+        pbr: bool = True,
+        face_limit: int = 50000,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+    ) -> dict:
+        """Create, poll and download one job once its upload resolves."""
+        try:
+            t0, image_token = await upload
+            task_id = await self._run(
+                self._client._create_task,
+                image_token,
+                model_version=model_version,
+                texture=texture,
+                pbr=pbr,
+                face_limit=face_limit,
+            )
+            task_data = await self._poll_task(task_id, poll_interval=poll_interval, timeout=timeout)
+            return await self._run(self._client._fetch_model, task_id, task_data, t0)
         except Exception as e:
-            return {"error": f"Unexpected error: {e}"}
+            return TripoCloudClient._error_result(e)
+
+    async def generate(
+        self,
+        image_path: str,
+        model_version: str = "v2.5-20250123",
+        texture: bool = True,
+        pbr: bool = True,
+        face_limit: int = 50000,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+    ) -> dict:
+        """Async TripoCloudClient.generate(); same arguments and result dict."""
+        if not self.api_key:
+            return {"error": "No API key configured"}
+        return await self._complete(
+            self._upload(image_path),
+            model_version=model_version,
+            texture=texture,
+            pbr=pbr,
+            face_limit=face_limit,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        )
+
+    async def generate_many(self, image_paths: List[str], **kwargs) -> List[dict]:
+        """
+        Generate meshes for several images concurrently (at most max_concurrency
+        jobs in flight). Returns one result dict per image, in input order.
+
+        Uploads are not held back by the job limit: every image starts uploading
+        right away (upload_concurrency at a time), so a queued image already has
+        its token when a job slot frees up.
+        """
+        if not self.api_key:
+            return [{"error": "No API key configured"} for _ in image_paths]
+
+        job_slots = asyncio.Semaphore(self.max_concurrency)
+        upload_slots = asyncio.Semaphore(self.upload_concurrency)
+        uploads = [asyncio.ensure_future(self._upload(p, upload_slots)) for p in image_paths]
+
+        async def _one(upload: asyncio.Future) -> dict:
+            async with job_slots:
+                return await self._complete(upload, **kwargs)
+
+        return await asyncio.gather(*(_one(u) for u in uploads))
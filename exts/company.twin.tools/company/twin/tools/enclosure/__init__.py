@@ -3,18 +3,41 @@
 
 """
 Enclosure package initialization.
+
+The model dataclasses are imported eagerly; the panel builder and the
+configurator UI (omni.ui / omni.usd) load on first attribute access.
 """
 
+import importlib
+
 from .enclosure_model import EnclosureModel, Wall, PanelNode, GridStrategy
-from .panels import instantiate_panel
-from .enclosure_configurator import EnclosureConfiguratorWindow, render_enclosure
+
+# Exported name -> submodule that defines it, imported on first use (PEP 562)
+_LAZY = {
+    "instantiate_panel": "panels",
+    "EnclosureConfiguratorWindow": "enclosure_configurator",
+    "render_enclosure": "enclosure_configurator",
+}
 
 __all__ = [
     "EnclosureModel",
-    "Wall", 
+    "Wall",
     "GridStrategy",
     "PanelNode",
     "instantiate_panel",
     "EnclosureConfiguratorWindow",
     "render_enclosure"
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -6,16 +6,43 @@ Enclosure Configurator Window and Renderer.
 Following TunnelModel pattern for clean separation of data, rendering, and UI.
 """
 
+import collections
+import sys
+
+import numpy as np
+import omni.kit.app
 import omni.ui as ui
 import omni.usd
-from pxr import UsdGeom, Gf, Sdf
+from pxr import Gf, Sdf
 
 from .enclosure_model import EnclosureModel, GridStrategy
-from .panels import instantiate_panel
+from .panels import instantiate_panel, instance_panel, _define_spec, _set_xform_ops
 from ..utils.port import Port
-
-
-def render_enclosure(stage, model: EnclosureModel, root_path="/SheetMetal_Enclosure"):
+from ..utils import usd_utils
+from ..utils._numba_compat import njit, HAS_NUMBA
+
+
+# Wall placement (Y-up; Length = X, Height = Y, Width = Z). Local X runs along the
+# columns, local Y up the rows and local Z (thickness) points Outside.
+# (prim name, model attr, wall_type, model flag or None, translate coefficients
+#  applied to (length, height, width), rotateXYZ degrees)
+_WALL_TABLE = (
+    # Z=0, faces -Z. Rot Y=180 inverts local X, so the origin sits at (Length, 0, 0).
+    ("Wall_Left", "left", "left", None, (1, 0, 0), (0, 180, 0)),
+    # Z=Width, faces +Z. No rotation needed.
+    ("Wall_Right", "right", "right", None, (0, 0, 1), (0, 0, 0)),
+    # Y=Height, faces +Y. Rot X=-90: Y->-Z, Z->+Y. Rows run from Z=W to 0.
+    ("Wall_Roof", "top", "roof", None, (0, 1, 1), (-90, 0, 0)),
+    # X=0, faces -X. Rot Y=-90: Z->-X, X->+Z. Cols run 0..Width.
+    ("Wall_Entry", "back", "back", "has_entry_wall", (0, 0, 0), (0, -90, 0)),
+    # X=Length, faces +X. Rot Y=90: Z->+X, X->-Z. Cols run Width..0.
+    ("Wall_Exit", "front", "front", "has_exit_wall", (1, 0, 1), (0, 90, 0)),
+    # Y=0, faces -Y. Rot X=90: Y->+Z, Z->-Y. Rows run 0..Width.
+    ("Floor", "bottom", "floor", "has_floor", (0, 0, 0), (90, 0, 0)),
+)
+
+
+def render_enclosure(stage, model: EnclosureModel, root_path="/SheetMetal_Enclosure", deferred=None, walls=None):
     """
     Renders the EnclosureModel to the USD Stage.
     
@@ -29,6 +56,14 @@ def render_enclosure(stage, model: EnclosureModel, root_path="/SheetMetal_Enclos
     Generates: Left Wall, Right Wall, Roof (3 walls forming tunnel cross-section)
     
     Uses same direct placement approach as Tunnel Builder for accurate positioning.
+
+    If deferred is a list, panels that need geometry are only placed as empty
+    Xforms and their instantiate_panel arguments are appended to it, so the
+    caller can build them over several frames (see _PANELS_PER_TICK).
+
+    If walls is a set of wall prim names (e.g. {"Wall_Left", "Floor"}), an
+    in-place update only re-authors those walls; a topology change still
+    rebuilds every wall.
     """
     # root_path is now passed in.
     
@@ -36,26 +71,29 @@ def render_enclosure(stage, model: EnclosureModel, root_path="/SheetMetal_Enclos
     # The caller manages uniqueness, but we ensure clean slate for this path.
     # The caller manages uniqueness, but we ensure clean slate for this path.
     current_transform = []
-    from ..utils import usd_utils
 
-    if stage.GetPrimAtPath(root_path):
+    layer = stage.GetEditTarget().GetLayer()
+    # Same enclosure dimensions and openings: keep the prims and only
+    # re-author the panels that changed (see _render_wall_direct).
+    in_place = _can_update_in_place(stage, layer, model, root_path)
+
+    if stage.GetPrimAtPath(root_path) and not in_place:
         # Capture transform before removing
         prim = stage.GetPrimAtPath(root_path)
         if prim:
             current_transform = usd_utils.get_local_transform(prim)
             
         # We only remove if it's a "Rebuild" of the same object.
-        # Ideally, we should just update, but for now, full rebuild is safer for data consistency.
+        # Topology changed (dimensions, walls or openings), so rebuild from scratch.
         stage.RemovePrim(root_path)
 
     # Root Xform
     root_prim = stage.DefinePrim(root_path, "Xform")
     
-    # Store enclosure metadata
-    root_prim.CreateAttribute("custom:length", Sdf.ValueTypeNames.Double).Set(model.length)
-    root_prim.CreateAttribute("custom:width", Sdf.ValueTypeNames.Double).Set(model.width)
-    root_prim.CreateAttribute("custom:height", Sdf.ValueTypeNames.Double).Set(model.height)
-    root_prim.CreateAttribute("custom:gauge", Sdf.ValueTypeNames.Int).Set(model.gauge)
+    # Store enclosure metadata: (length, width, height, gauge) in one attribute spec.
+    # The individual values are also serialized below as btai:enclosure:*.
+    root_prim.CreateAttribute("custom:dims", Sdf.ValueTypeNames.Double4).Set(
+        Gf.Vec4d(model.length, model.width, model.height, model.gauge))
 
     # Serialize full model state for reload
     model.serialize(root_prim)
@@ -63,164 +101,44 @@ def render_enclosure(stage, model: EnclosureModel, root_path="/SheetMetal_Enclos
     thickness = model.thickness
     flange_depth = model.flange_depth
 
-    # --- LEFT WALL (Z = 0) ---
-    # Panels face inward (+Z), arranged along X (length) and Y (height)
-    left_path = f"{root_path}/Wall_Left"
-    left_prim = stage.DefinePrim(left_path, "Xform")
-    # Wall Left at Z=0. Normally faces +Z (Inside). 
-    # Rotate 180 Y to point -Z (Outside).
-    # Origin shifts to (Length, 0, 0) because Local X is inverted.
-    UsdGeom.XformCommonAPI(left_prim).SetTranslate(Gf.Vec3d(model.length, 0, 0))
-    UsdGeom.XformCommonAPI(left_prim).SetRotate(Gf.Vec3f(0, 180, 0))
-    
-    _render_wall_direct(stage, model.left, left_path, 
-                        wall_type="left",
-                        tunnel_length=model.length,
-                        tunnel_width=model.width, 
-                        tunnel_height=model.height,
-                        thickness=thickness,
-                        flange_depth=flange_depth,
-                        gauge=model.gauge)
-
-    # --- RIGHT WALL (Z = width) ---
-    # Panels face inward (-Z). We rotate 180 Y.
-    # Origin at (Length, 0, Width).
-    right_path = f"{root_path}/Wall_Right"
-    right_prim = stage.DefinePrim(right_path, "Xform")
-    
-    right_xform = UsdGeom.XformCommonAPI(right_prim)
-    # Wall Right at Z=Width. Normally faces +Z (Outside).
-    # No rotation needed.
-    right_xform.SetTranslate(Gf.Vec3d(0, 0, model.width))
-    right_xform.SetRotate(Gf.Vec3f(0, 0, 0))
-
-    _render_wall_direct(stage, model.right, right_path,
-                        wall_type="right",
-                        tunnel_length=model.length,
-                        tunnel_width=model.width,
-                        tunnel_height=model.height,
-                        thickness=thickness,
-                        flange_depth=flange_depth,
-                        gauge=model.gauge)
-
-    # --- ROOF (Y = height) ---
-    # Panels face downward (-Y).
-    # Cols along X, Rows along Z.
-    # --- ROOF (Y = height) ---
-    # Panels face Up (+Y) for Outside.
-    # Local Z (Thick) -> Global +Y.
-    # Rot X=90: Y->-Z (Cols along Z? No, Cols along X), Z->+Y.
-    # Origin needs to shift because Local Y maps to -Z.
-    # --- ROOF (Y = height) ---
-    # Panels face Up (+Y) for Outside.
-    # Local Z (Thick) -> Global +Y (Out).
-    # Rot X=90: Y->Z, Z->-Y. (Down/In).
-    # Rot X=-90: Y->-Z, Z->+Y. (Up/Out).
-    # Start: (0, H, W).
-    # Cols (Local X) -> +X. (Along Length).
-    # Rows (Local Y) -> -Z. (From W -> 0).
-    roof_path = f"{root_path}/Wall_Roof"
-    roof_prim = stage.DefinePrim(roof_path, "Xform")
-    
-    roof_xform = UsdGeom.XformCommonAPI(roof_prim)
-    roof_xform.SetTranslate(Gf.Vec3d(0, model.height, model.width))
-    roof_xform.SetRotate(Gf.Vec3f(-90, 0, 0))
-    
-    _render_wall_direct(stage, model.top, roof_path,
-                        wall_type="roof",
-                        tunnel_length=model.length,
-                        tunnel_width=model.width,
-                        tunnel_height=model.height,
-                        thickness=thickness,
-                        flange_depth=flange_depth,
-                        gauge=model.gauge)
-
-    if model.has_entry_wall:
-        # --- ENTRY WALL (Back) ---
-        # At X=0, spanning Width (Z) x Height (Y).
-        # Thickness inward (+X). Rotate Y=+90: X->Z, Z->X? No.
-        # Start at (0, 0, Width). Rotate Y=90 (Counter Clockwise around Y).
-        # Local X (Cols) -> -Z (Along Width 0 to -W... wait).
-        # If we want Cols to run along Z (0 to Width), we need specific rotation.
-        # Local X (width) needs to map to Global Z (width).
-        # Local Y (height) needs to map to Global Y (height).
-        # Local Z (thick) needs to map to Global X (Length).
-        
-        # Rot Y=90: X->Z, Z->-X? No, R(90) = [[0,0,1],[0,1,0],[-1,0,0]]
-        # X(1,0,0) -> (0,0,-1) = -Z.
-        # Z(0,0,1) -> (1,0,0) = +X.
-        # So Local X goes to -Z. Wall width is model.width.
-        # If we start at (0,0,W), and go -Z, we go to (0,0,0). Correct span.
-        # Local Z goes to +X. This is inward for Entry Wall (at X=0). Correct.
-        # Local Z (Thick) -> +X (Inward).
-        # --- ENTRY WALL (Back) ---
-        # At X=0. Face -X (Outside).
-        # Rot Y=-90: Z->-X. X->Z.
-        # Local X (Cols) -> +Z. (0..Width).
-        back_path = f"{root_path}/Wall_Entry"
-        back_prim = stage.DefinePrim(back_path, "Xform")
-        
-        back_xform = UsdGeom.XformCommonAPI(back_prim)
-        back_xform.SetTranslate(Gf.Vec3d(0, 0, 0))
-        back_xform.SetRotate(Gf.Vec3f(0, -90, 0))
-
-        _render_wall_direct(stage, model.back, back_path, "back",
-                            model.length, model.width, model.height,
-                            thickness, flange_depth, gauge=model.gauge,
-                            opening_w=model.opening_width, opening_h=model.opening_height)
-
-    if model.has_exit_wall:
-        # --- EXIT WALL (Front) ---
-        # At X=Length, spanning Width (Z) x Height (Y)
-        # Thickness inward (-X).
-        # Translate (Length, 0, 0). Rotate Y=-90.
-        # Rot Y=-90: X->-Z, Z->+X.
-        # X(1,0,0) -> (0,0,1) = +Z.
-        # Z(0,0,1) -> (-1,0,0) = -X.
-        # Local X (Cols) -> +Z. Wall width is model.width.
-        # If we start at (Length, 0, 0) and go +Z, we go to (Length, 0, Width). Correct span.
-        # Local Z (Thick) -> -X. This is inward for Exit Wall (at X=Length). Correct.
-        # --- EXIT WALL (Front) ---
-        # At X=Length. Face +X (Outside).
-        # Rot Y=90: Z->+X. X->-Z.
-        # Local X (Cols) -> -Z. (Width..0).
-        # Start at (Length, 0, Width).
-        front_path = f"{root_path}/Wall_Exit"
-        front_prim = stage.DefinePrim(front_path, "Xform")
-        
-        front_xform = UsdGeom.XformCommonAPI(front_prim)
-        front_xform.SetTranslate(Gf.Vec3d(model.length, 0, model.width))
-        front_xform.SetRotate(Gf.Vec3f(0, 90, 0))
-
-        _render_wall_direct(stage, model.front, front_path, "front",
-                            model.length, model.width, model.height,
-                            thickness, flange_depth, gauge=model.gauge,
-                            opening_w=model.opening_width, opening_h=model.opening_height)
-
-    if model.has_floor:
-        # --- FLOOR (Bottom) ---
-        # At Y=0, spanning Length (X) x Width (Z)
-        # Thickness Down (-Y).
-        # Rotate X=90.
-        # --- FLOOR (Bottom) ---
-        # At Y=0. Face -Y (Outside/Down).
-        # Rot X=-90: Z->-Y. Y->Z.
-        # --- FLOOR (Bottom) ---
-        # At Y=0. Face -Y (Outside/Down).
-        # Rot X=90: Y->Z, Z->-Y. (Down/Out).
-        # Start: (0, 0, 0).
-        # Cols (Local X) -> +X.
-        # Rows (Local Y) -> +Z. (0..W).
-        floor_path = f"{root_path}/Floor"
-        floor_prim = stage.DefinePrim(floor_path, "Xform")
-        
-        floor_xform = UsdGeom.XformCommonAPI(floor_prim)
-        floor_xform.SetTranslate(Gf.Vec3d(0, 0, 0))
-        floor_xform.SetRotate(Gf.Vec3f(90, 0, 0))
-        
-        _render_wall_direct(stage, model.bottom, floor_path, "floor",
-                            model.length, model.width, model.height,
-                            thickness, flange_depth, gauge=model.gauge)
+    # Walls and panels are authored as Sdf specs inside one change block so
+    # the stage recomposes once for the whole enclosure instead of per prim.
+    # A rebuild goes into a scratch layer first and lands on the stage as one
+    # CopySpec per wall; an in-place update edits the existing specs.
+    build_layer = layer if in_place else Sdf.Layer.CreateAnonymous()
+    # Identical panels share geometry: (kind) -> prototype path under _Prototypes
+    prototypes = {}
+    prototype_root = f"{root_path}/{_PROTOTYPES_NAME}"
+    with Sdf.ChangeBlock():
+        for prim_name, wall_attr, wall_type, flag, t_coef, rotate in _WALL_TABLE:
+            if flag and not getattr(model, flag):
+                continue
+            if in_place and walls is not None and prim_name not in walls:
+                continue
+            wall_path = f"{root_path}/{prim_name}"
+            _set_xform_ops(_define_spec(build_layer, wall_path, "Xform"),
+                           translate=(t_coef[0] * model.length, t_coef[1] * model.height, t_coef[2] * model.width),
+                           rotate_xyz=rotate)
+
+            _render_wall_direct(stage, getattr(model, wall_attr), wall_path, wall_type,
+                                model.length, model.width, model.height,
+                                thickness, flange_depth, gauge=model.gauge,
+                                opening_w=model.opening_width, opening_h=model.opening_height,
+                                layer=build_layer, deferred=deferred,
+                                prototypes=prototypes, prototype_root=prototype_root)
+
+        if in_place:
+            _drop_unused_prototypes(layer, root_path)
+
+        if build_layer is not layer:
+            for wall_spec in build_layer.GetPrimAtPath(root_path).nameChildren:
+                Sdf.CopySpec(build_layer, wall_spec.path, layer, wall_spec.path)
+
+    if in_place:
+        # Ports, anchors and the root transform depend only on the topology
+        # and survived the update untouched.
+        print(f"[EnclosureConfigurator] Updated Enclosure at {root_path}")
+        return
 
     # --- ENTRY ANCHOR (Floor Center at Entry) ---
     if model.has_entry_wall:
@@ -230,12 +148,9 @@ def render_enclosure(stage, model: EnclosureModel, root_path="/SheetMetal_Enclos
             port_type="Entry",
             shape="Rectangular",
             width=model.opening_width,
-            height=model.opening_height
+            height=model.opening_height,
+            is_anchor=True
         )
-        # Add custom is_anchor tag
-        prim = stage.GetPrimAtPath(f"{root_path}/Anchor_Entry")
-        if prim:
-            prim.CreateAttribute("custom:is_anchor", Sdf.ValueTypeNames.Bool).Set(True)
 
     # --- EXIT ANCHOR (Floor Center at Exit) ---
     if model.has_exit_wall:
@@ -245,12 +160,9 @@ def render_enclosure(stage, model: EnclosureModel, root_path="/SheetMetal_Enclos
             port_type="Exit",
             shape="Rectangular",
             width=model.opening_width,
-            height=model.opening_height
+            height=model.opening_height,
+            is_anchor=True
         )
-        # Add custom is_anchor tag
-        prim = stage.GetPrimAtPath(f"{root_path}/Anchor_Exit")
-        if prim:
-            prim.CreateAttribute("custom:is_anchor", Sdf.ValueTypeNames.Bool).Set(True)
 
     # --- PORTS ---
     # Add a default Exhaust Port on the Roof Center (for testing)
@@ -272,9 +184,6 @@ def render_enclosure(stage, model: EnclosureModel, root_path="/SheetMetal_Enclos
     print(f"[EnclosureConfigurator] Rendered Enclosure at {root_path}")
 
 
-    print(f"[EnclosureConfigurator] Rendered Enclosure at {root_path}")
-
-
     # We can infer from the root prim attributes if needed, or pass them in.
     # For now, let's assume the wall object *could* carry this info, 
     # but currently it doesn't. 
@@ -298,115 +207,294 @@ def render_enclosure(stage, model: EnclosureModel, root_path="/SheetMetal_Enclos
     # I will assume `opening_w` and `opening_h` are passed as kwargs or similar.
     pass
 
-def _render_wall_direct(stage, wall, parent_path, wall_type, tunnel_length, tunnel_width, tunnel_height, thickness, flange_depth, gauge=16, opening_w=0, opening_h=0):
+
+_WALL_NAMES = tuple(entry[0] for entry in _WALL_TABLE)
+
+# Deferred builds (render_enclosure(deferred=...)) instantiate this many panels per frame
+_PANELS_PER_TICK = 16
+
+# Class prim under the enclosure root holding the shared panel geometry
+_PROTOTYPES_NAME = "_Prototypes"
+
+# Gauges offered by the gauge combo box, in item order
+_GAUGE_UI_LIST = (10, 12, 14, 16, 18)
+
+
+# Rendered wall prim suffix (Wall_<name> / Floor) -> EnclosureModel wall name
+_MODEL_WALL_NAMES = {
+    "Left": "Left",
+    "Right": "Right",
+    "Roof": "Top",
+    "Entry": "Back",
+    "Exit": "Front",
+    "Floor": "Bottom"
+}
+
+
+def _parse_panel_path(path):
+    """
+    Splits '<root>/Wall_<name>/Panel_<col>_<row>[/...]' (or '<root>/Floor/Panel_...')
+    into (name, col, row, root); None if path is not inside a rendered panel.
+    Walks Sdf.Path parents rather than scanning the string: selection
+    handlers call this for every selected path.
+    """
+    sdf_path = Sdf.Path(path)
+    while sdf_path.pathElementCount >= 2:
+        name = sdf_path.name
+        parent = sdf_path.GetParentPath()
+        if name.startswith("Panel_"):
+            parent_name = parent.name
+            if parent_name == "Floor":
+                wall_name = "Floor"
+            elif parent_name.startswith("Wall_") and len(parent_name) > 5:
+                wall_name = parent_name[5:]
+            else:
+                wall_name = None
+            if wall_name:
+                col, _, row = name[6:].partition("_")
+                if col.isdigit() and row.isdigit():
+                    return wall_name, int(col), int(row), str(parent.GetParentPath())
+        sdf_path = parent
+    return None
+
+
+def _topology_signature(model):
+    """Everything that decides which walls, wall transforms and ports exist."""
+    return (model.length, model.width, model.height, model.gauge, model.flange_depth,
+            model.has_entry_wall, model.has_exit_wall, model.has_floor,
+            model.opening_width, model.opening_height)
+
+
+def _stored_topology_signature(prim):
+    """_topology_signature of the model last serialized onto prim."""
+    def _get_attr(name):
+        attr = prim.GetAttribute(f"btai:enclosure:{name}")
+        return attr.Get() if attr and attr.IsValid() and attr.HasValue() else None
+
+    return tuple(_get_attr(name) for name in (
+        "length", "width", "height", "gauge", "flange_depth",
+        "has_entry_wall", "has_exit_wall", "has_floor",
+        "opening_width", "opening_height"))
+
+
+def _can_update_in_place(stage, layer, model, root_path):
+    """
+    True when the enclosure at root_path can be updated panel by panel.
+    Requires the same topology and walls holding nothing but generated panels
+    (the tap tool adds MergedPanel_/Exhaust_Tap prims that a rebuild clears).
+    """
+    root_prim = stage.GetPrimAtPath(root_path)
+    root_spec = layer.GetPrimAtPath(root_path)
+    if not root_prim or not root_spec:
+        return False
+    if _stored_topology_signature(root_prim) != _topology_signature(model):
+        return False
+    for wall_spec in root_spec.nameChildren:
+        if wall_spec.name in _WALL_NAMES and any(
+                not child.name.startswith("Panel_") for child in wall_spec.nameChildren):
+            return False
+    return True
+
+
+def _panel_spec_matches(spec, panel, thickness, gauge):
+    """
+    Compares the custom:* attributes instantiate_panel would author for panel,
+    and checks that the prototype an instanced panel references is built.
+    """
+    expected = {
+        "custom:panel_type": panel.type,
+        "custom:width": panel.width,
+        "custom:height": panel.height,
+        "custom:thickness": thickness,
+        "custom:gauge": gauge,
+        "custom:material": "Galvanized Steel",
+    }
+    for k, v in (panel.variant_params or {}).items():
+        expected[f"custom:{k}"] = float(v)
+    authored = {attr.name: attr.default for attr in spec.attributes if attr.name.startswith("custom:")}
+    if authored != expected:
+        return False
+    # An instanced panel is only complete once its prototype is built. A
+    # placeholder left by a dropped deferred queue has no custom:* metadata.
+    for ref in spec.referenceList.prependedItems:
+        proto = spec.layer.GetPrimAtPath(ref.primPath)
+        if not proto or "custom:panel_type" not in proto.attributes:
+            return False
+    return True
+
+
+def _clear_spec(spec):
+    """Strips a panel spec back to an empty prim so it can be re-instantiated in place."""
+    for child in list(spec.nameChildren):
+        del spec.nameChildren[child.name]
+    for prop in list(spec.properties):
+        spec.RemoveProperty(prop)
+    spec.ClearInfo("customData")
+    spec.referenceList.ClearEdits()
+    spec.ClearInfo("instanceable")
+
+
+def _drop_unused_prototypes(layer, root_path):
+    """Removes shared panel prototypes no panel references any more (after in-place updates)."""
+    proto_root = layer.GetPrimAtPath(f"{root_path}/{_PROTOTYPES_NAME}")
+    root_spec = layer.GetPrimAtPath(root_path)
+    if not proto_root or not root_spec:
+        return
+    used = set()
+    for wall_spec in root_spec.nameChildren:
+        if wall_spec.name not in _WALL_NAMES:
+            continue
+        for panel_spec in wall_spec.nameChildren:
+            used.update(ref.primPath for ref in panel_spec.referenceList.prependedItems)
+    for proto in list(proto_root.nameChildren):
+        if proto.path not in used:
+            del proto_root.nameChildren[proto.name]
+
+
+@njit(cache=True)
+def _skip_mask_kernel(col_starts, col_w, row_starts, row_h, op_x_min, op_x_max, op_y_min, op_y_max, threshold):
+    skip = np.zeros((row_h.shape[0], col_w.shape[0]), dtype=np.bool_)
+    for r in range(row_h.shape[0]):
+        intersect_y = min(row_starts[r] + row_h[r], op_y_max) - max(row_starts[r], op_y_min)
+        if intersect_y <= 0.0:
+            continue
+        for c in range(col_w.shape[0]):
+            intersect_x = min(col_starts[c] + col_w[c], op_x_max) - max(col_starts[c], op_x_min)
+            if intersect_x > 0.0 and intersect_y * intersect_x > row_h[r] * col_w[c] * threshold:
+                skip[r, c] = True
+    return skip
+
+
+def _opening_skip_mask(col_starts, col_w, row_starts, row_h, op_x_min, op_x_max, op_y_min, op_y_max, threshold):
+    """
+    (rows, cols) mask of panels whose overlap with the opening rectangle
+    exceeds threshold * panel area.
+    """
+    if HAS_NUMBA:
+        return _skip_mask_kernel(col_starts, col_w, row_starts, row_h,
+                                 op_x_min, op_x_max, op_y_min, op_y_max, threshold)
+
+    # Check Intersection (rows along axis 0, cols along axis 1)
+    intersect_x = np.maximum(0.0, np.minimum(col_starts + col_w, op_x_max) - np.maximum(col_starts, op_x_min))
+    intersect_y = np.maximum(0.0, np.minimum(row_starts + row_h, op_y_max) - np.maximum(row_starts, op_y_min))
+    return np.outer(intersect_y, intersect_x) > np.outer(row_h, col_w) * threshold
+
+
+def _render_wall_direct(stage, wall, parent_path, wall_type, tunnel_length, tunnel_width, tunnel_height, thickness, flange_depth, gauge=16, opening_w=0, opening_h=0, layer=None, deferred=None, prototypes=None, prototype_root=None):
     """
     Renders a wall using direct panel placement.
+
+    Panel origins and the opening-omission test are computed for the whole
+    (rows, cols) grid at once; only the kept cells are visited in Python.
     """
-    def get_cumulative_pos(sizes, index):
-        return sum(sizes[:index])
-    
-    # Extract column widths and row heights
-    col_widths = [col[0].width for col in wall.columns if col]
-    if not col_widths:
+    # Column widths / row heights and their start offsets are cached on the wall
+    col_w = wall.get_col_widths()
+    if not col_w.size:
         return
         
-    # Get row heights from first column
-    row_heights = [p.height for p in wall.columns[0]] if wall.columns else []
-    
-    for row_idx, row_height in enumerate(row_heights):
-        cumulative_row_pos = get_cumulative_pos(row_heights, row_idx)
-        
-        for col_idx, col_width in enumerate(col_widths):
-            cumulative_col_pos = get_cumulative_pos(col_widths, col_idx)
-            
-            # Get panel from model
-            panel = wall.columns[col_idx][row_idx] if col_idx < len(wall.columns) and row_idx < len(wall.columns[col_idx]) else None
-            if not panel:
-                continue
-                
-            panel_path = f"{parent_path}/Panel_{col_idx}_{row_idx}"
-            
-            # --- PANEL OMISSION LOGIC ---
-            # If this is an Entry/Exit wall and we have an opening defined
-            should_skip = False
-            try:
-                # Ensure opening dims are valid floats
-                op_w = float(opening_w) if opening_w is not None else 0.0
-                op_h = float(opening_h) if opening_h is not None else 0.0
-                
-                if (wall_type in ["back", "front"]) and (op_w > 0.1 and op_h > 0.1):
-                    # Panel Bounds in Wall Space (X=Width, Y=Height)
-                    p_y_min = cumulative_row_pos
-                    p_y_max = cumulative_row_pos + panel.height
-                    
-                    p_x_min = cumulative_col_pos
-                    p_x_max = cumulative_col_pos + panel.width
-                    
-                    # Opening Bounds (Centered on Wall Width, Bottom Aligned at Y=0)
-                    wall_width_total = tunnel_width
-                    if wall_type in ["back"]:
-                         # Back Wall runs 0..Width or Width..0?
-                         # Our logic above says Back Wall X maps to Global -Z.
-                         # Start (0,0,W) -> End (0,0,0).
-                         # So Panel X=0 is Global Z=W. Panel X=W is Global Z=0.
-                         # This reversal might matter if Opening is asymmetric. 
-                         # But Opening is centered, so it's fine.
-                         pass
-
-                    op_x_center = wall_width_total / 2.0
-                    op_x_min = op_x_center - (op_w / 2.0)
-                    op_x_max = op_x_center + (op_w / 2.0)
-                    
-                    op_y_min = 0.0
-                    op_y_max = op_h
-                    
-                    # Check Intersection
-                    intersect_x = max(0, min(p_x_max, op_x_max) - max(p_x_min, op_x_min))
-                    intersect_y = max(0, min(p_y_max, op_y_max) - max(p_y_min, op_y_min))
-                    
-                    intersection_area = intersect_x * intersect_y
-                    panel_area = panel.width * panel.height
-                    
-                    # Omission Threshold: If significant intersection
-                    if intersection_area > (panel_area * 0.15):
-                        should_skip = True
-            except Exception as e:
-                print(f"[EnclosureConfigurator] Error in omission logic: {e}")
-                should_skip = False # Default to showing panel if check fails
-
-            if should_skip:
-                continue
+    row_h = wall.get_row_heights()
+    if not row_h.size:
+        return
 
-            # Instantiate panel geometry
-            instantiate_panel(
+    # Left/bottom edge of every column/row in Wall Space (X=Width, Y=Height)
+    col_starts = wall.get_col_starts()
+    row_starts = wall.get_row_starts()
+
+    # --- PANEL OMISSION LOGIC ---
+    # Only Entry/Exit walls with an opening defined omit panels; every other
+    # wall keeps the whole grid and skips the intersection test entirely.
+    op_w = float(opening_w or 0.0)
+    op_h = float(opening_h or 0.0)
+    has_opening = wall_type in ("back", "front") and op_w > 0.1 and op_h > 0.1
+
+    if has_opening:
+        # Opening Bounds (Centered on Wall Width, Bottom Aligned at Y=0).
+        # Back Wall X runs Global Z=W..0, but the opening is centered so the
+        # reversal does not matter.
+        op_x_center = tunnel_width / 2.0
+        op_x_min = op_x_center - (op_w / 2.0)
+        op_x_max = op_x_center + (op_w / 2.0)
+        op_y_min = 0.0
+        op_y_max = op_h
+
+        # Omission Threshold: If significant intersection
+        skip = _opening_skip_mask(col_starts, col_w, row_starts, row_h,
+                                  op_x_min, op_x_max, op_y_min, op_y_max, 0.15)
+        cells = np.argwhere(~skip).tolist()
+    else:
+        cells = [(r, c) for r in range(len(row_h)) for c in range(len(col_w))]
+
+    if layer is None:
+        layer = stage.GetEditTarget().GetLayer()
+    if prototypes is None:
+        prototypes = {}
+    if prototype_root is None:
+        prototype_root = f"{parent_path.rsplit('/', 1)[0]}/{_PROTOTYPES_NAME}"
+    panel_gauge = getattr(wall, 'gauge', 16) # Fallback if wall doesn't have it, but usually model has it
+    kept = []
+    # Every panel path shares the wall prefix; build it once
+    path_prefix = sys.intern(parent_path + "/")
+
+    # Panel origin X (column start + half the panel width) for the whole
+    # (rows, cols) grid at once
+    origin_x = col_starts + wall.widths * 0.5
+
+    for row_idx, col_idx in cells:
+        panel = wall[col_idx, row_idx]
+
+        panel_name = f"Panel_{col_idx}_{row_idx}"
+        panel_path = path_prefix + panel_name
+        kept.append(panel_name)
+
+        # Position Panel in Wall Space (2D)
+        # Origin of Panel Geometry is Bottom-Center-Back of the panel volume.
+        # X: column start is left edge. Panel origin is Center X.
+        # Y: row start is bottom edge. Panel origin is Bottom Y.
+        
+        p_x = float(origin_x[row_idx, col_idx])
+        p_y = float(row_starts[row_idx])
+        p_z = 0.0
+
+        # Reuse the panel left by a previous render when nothing about it changed
+        spec = layer.GetPrimAtPath(panel_path)
+        if spec and not _panel_spec_matches(spec, panel, thickness, panel_gauge):
+            _clear_spec(spec)
+            spec = None
+
+        if not spec:
+            # Instantiate panel geometry (shared with identical panels)
+            spec = instance_panel(
                 stage,
                 panel_path,
+                prototypes,
+                prototype_root,
                 panel.width,
                 panel.height,
                 thickness,
                 panel.type,
                 panel.variant_params,
                 flange_depth,
-                gauge=getattr(wall, 'gauge', 16) # Fallback if wall doesn't have it, but usually model has it
+                gauge=panel_gauge,
+                layer=layer,
+                deferred=deferred
             )
-            
-            # Position based on wall type
-            prim = stage.GetPrimAtPath(panel_path)
-            if not prim.IsValid():
-                continue
-                
-            xform_api = UsdGeom.XformCommonAPI(prim)
-            
-            # Position Panel in Wall Space (2D)
-            # Origin of Panel Geometry is Bottom-Center-Back of the panel volume.
-            # X: cumulative_col_pos is left edge. Panel origin is Center X.
-            # Y: cumulative_row_pos is bottom edge. Panel origin is Bottom Y.
-            
-            p_x = cumulative_col_pos + (panel.width / 2.0)
-            p_y = cumulative_row_pos
-            p_z = 0.0
-            
-            xform_api.SetTranslate(Gf.Vec3d(p_x, p_y, p_z))
+        elif "xformOp:translate" in spec.attributes and \
+                spec.attributes["xformOp:translate"].default == Gf.Vec3d(p_x, p_y, p_z):
+            continue
+        
+        _set_xform_ops(spec, translate=(p_x, p_y, p_z))
+
+    # Drop panels left over from a previous render that are no longer in the
+    # grid (columns reflowed away, or now covered by the opening).
+    wall_spec = layer.GetPrimAtPath(parent_path)
+    if wall_spec:
+        kept_names = set(kept)
+        for child in list(wall_spec.nameChildren):
+            if child.name not in kept_names:
+                del wall_spec.nameChildren[child.name]
+        # Panels added by the update were appended; keep row-major order
+        if [child.name for child in wall_spec.nameChildren] != kept:
+            wall_spec.nameChildrenOrder = kept
 
 
 class EnclosureConfiguratorWindow(ui.Window):
@@ -459,8 +547,18 @@ class EnclosureConfiguratorWindow(ui.Window):
         # Name
         self._name_model = ui.SimpleStringModel("Enclosure")
 
+        # Panels queued by the last build, instantiated a few per frame
+        self._pending_panels = collections.deque()
+        self._pending_stage = None
+        self._update_sub = None
+        self._built_text = ""
+
         self.frame.set_build_fn(self._build_ui)
 
+    def destroy(self):
+        self._cancel_pending_panels()
+        super().destroy()
+
     def _build_ui(self):
         with ui.VStack(spacing=8, style={"margin": 10}):
             # Header
@@ -525,9 +623,6 @@ class EnclosureConfiguratorWindow(ui.Window):
                 ui.Spacer(width=20)
                 ui.Label("Floor:", width=60)
                 ui.CheckBox(model=self._floor_model)
-                ui.Spacer(width=20)
-                ui.Label("Floor:", width=60)
-                ui.CheckBox(model=self._floor_model)
             
             # Opening Dimensions
             with ui.HStack(height=22):
@@ -585,9 +680,8 @@ class EnclosureConfiguratorWindow(ui.Window):
         height = (self._height_ft.get_value_as_int() * 12.0) + self._height_in.get_value_as_float()
         
         # Gauge
-        gauge_map = [10, 12, 14, 16, 18]
         gauge_idx = self._gauge_combo.model.get_item_value_model().as_int
-        gauge = gauge_map[gauge_idx]
+        gauge = _GAUGE_UI_LIST[gauge_idx]
         
         panel_width = self._panel_width_model.get_value_as_float()
         panel_depth = self._panel_depth_model.get_value_as_float()
@@ -640,16 +734,56 @@ class EnclosureConfiguratorWindow(ui.Window):
         # "Configurator" implies "Configure this thing".
         # Let's use the explicit name. Use creates "Enclosure A", then changes name to "Enclosure B".
         
-        render_enclosure(stage, self._model, root_path=root_path)
+        self._cancel_pending_panels()
+        pending = []
+        render_enclosure(stage, self._model, root_path=root_path, deferred=pending)
         
         self._status_label.text = f"Built Enclosure: {length}\" x {width}\" x {height}\" ({gauge}ga)"
+        if pending:
+            self._queue_panels(stage, pending)
+
+    # ------------------------------------------------------------------ #
+    #  Deferred panel instantiation                                        #
+    # ------------------------------------------------------------------ #
+    def _queue_panels(self, stage, pending):
+        self._pending_panels.extend(pending)
+        self._pending_stage = stage
+        self._built_text = self._status_label.text
+        if self._update_sub is None:
+            self._update_sub = omni.kit.app.get_app().get_update_event_stream().create_subscription_to_pop(
+                self._on_update, name="EnclosurePanelQueue"
+            )
+
+    def _cancel_pending_panels(self):
+        self._pending_panels.clear()
+        self._pending_stage = None
+        self._update_sub = None
+
+    def _on_update(self, e):
+        stage = omni.usd.get_context().get_stage()
+        if stage is None or stage != self._pending_stage:
+            # Stage was closed or swapped; the queued paths are meaningless now
+            self._cancel_pending_panels()
+            return
+
+        layer = stage.GetEditTarget().GetLayer()
+        with Sdf.ChangeBlock():
+            for _ in range(min(_PANELS_PER_TICK, len(self._pending_panels))):
+                job = self._pending_panels.popleft()
+                # Skip placeholders deleted (or rebuilt away) since they were queued
+                if layer.GetPrimAtPath(job[0]):
+                    instantiate_panel(stage, *job)
+
+        if self._pending_panels:
+            self._status_label.text = f"{self._built_text} - {len(self._pending_panels)} panel(s) pending"
+        else:
+            self._status_label.text = self._built_text
+            self._cancel_pending_panels()
 
     def _on_apply_variant_clicked(self):
         """
         Applies the selected variant to the currently selected panels.
         """
-        import re
-        
         ctx = omni.usd.get_context()
         selection = ctx.get_selection().get_selected_prim_paths()
         
@@ -681,7 +815,12 @@ class EnclosureConfiguratorWindow(ui.Window):
             }
         
         updates = 0
-        root_paths_touched = set()
+        # root path -> wall prim names whose panels changed
+        root_paths_touched = collections.defaultdict(set)
+        # Loop-invariant lookups bound once
+        parse_path = _parse_panel_path
+        model_wall_name = _MODEL_WALL_NAMES.get
+        get_wall = self._model.get_wall_by_name
         
         for path in selection:
             # We enforce that we only edit Enclosures created by this tool or compatible
@@ -693,43 +832,29 @@ class EnclosureConfiguratorWindow(ui.Window):
                 continue
             
             # Parse Panel_{col}_{row} or Floor/Panel_{col}_{row}
-            match = re.search(r"(?:Wall_(\w+)|Floor)/Panel_(\d+)_(\d+)", path)
-            if not match:
+            parsed = parse_path(path)
+            if not parsed:
                 continue
             
-            wall_name_raw = match.group(1) if match.group(1) else "Floor"
-            col_idx = int(match.group(2))
-            row_idx = int(match.group(3))
+            wall_name_raw, col_idx, row_idx, root = parsed
             
             # Map rendered wall names to model wall names
-            wall_name_map = {
-                "Left": "Left",
-                "Right": "Right",
-                "Roof": "Top",
-                "Entry": "Back",
-                "Exit": "Front",
-                "Floor": "Bottom"
-            }
-            wall_name = wall_name_map.get(wall_name_raw, wall_name_raw)
+            wall_name = model_wall_name(wall_name_raw, wall_name_raw)
             
-            wall = self._model.get_wall_by_name(wall_name)
+            wall = get_wall(wall_name)
             if wall:
                 wall.set_panel_type(col_idx, row_idx, v_type, v_params)
                 updates += 1
                 
-                # Identify root path for this panel
+                # Identify root path and wall prim for this panel
                 # path is like /World/Enclosure/Wall_Left/Panel...
-                # split by Wall_ or Floor
-                if "Wall_" in path:
-                    root = path.split("/Wall_")[0]
-                else:
-                    root = path.split("/Floor")[0]
-                root_paths_touched.add(root)
+                root_paths_touched[root].add(
+                    "Floor" if wall_name_raw == "Floor" else f"Wall_{wall_name_raw}")
         
         if updates > 0:
-            # Re-render all touched enclosures
-            for root_path in root_paths_touched:
-                render_enclosure(stage, self._model, root_path=root_path)
+            # Re-render only the touched walls of each touched enclosure
+            for root_path, wall_names in root_paths_touched.items():
+                render_enclosure(stage, self._model, root_path=root_path, walls=wall_names)
             self._status_label.text = f"Updated {updates} panel(s) in {len(root_paths_touched)} enclosure(s)."
         else:
             self._status_label.text = "No valid enclosure panels found in selection."
@@ -775,9 +900,8 @@ class EnclosureConfiguratorWindow(ui.Window):
         self._height_in.set_value(self._model.height % 12)
         
         # Gauge
-        gauge_map = [10, 12, 14, 16, 18]
-        if self._model.gauge in gauge_map:
-            idx = gauge_map.index(self._model.gauge)
+        if self._model.gauge in _GAUGE_UI_LIST:
+            idx = _GAUGE_UI_LIST.index(self._model.gauge)
             self._gauge_combo.model.get_item_value_model().as_int = idx
             
         # Options
@@ -7,9 +7,13 @@ Following TunnelModel pattern for clean separation of data and rendering.
 """
 
 from enum import Enum
-from pxr import Sdf
 
-__all__ = ["GridStrategy", "PanelNode", "Wall", "EnclosureModel"]
+import numpy as np
+from pxr import Sdf, Usd
+
+from ..utils._numba_compat import njit
+
+__all__ = ["GridStrategy", "PanelNode", "Wall", "EnclosureModel", "PANEL_TYPES", "PANEL_TYPE_IDS"]
 
 
 class GridStrategy(Enum):
@@ -20,6 +24,8 @@ class PanelNode:
     """
     Represents a single logical panel in a wall.
     """
+    __slots__ = ("type", "width", "height", "row", "variant_params")
+
     def __init__(self, p_type="Solid", width=30.0, height=30.0, row=0):
         self.type = p_type  # "Solid", "Window", "Louver", "Cutout"
         self.width = width
@@ -37,55 +43,202 @@ class PanelNode:
         }
 
 
+@njit(cache=True)
+def _build_wall_grid(target_width, tiers, panel_width, fabrication):
+    """
+    (cols, rows) panel widths and heights for a default wall: EQUAL splits
+    target_width into ~panel_width columns, FABRICATION into 48" columns
+    plus the remainder. Every row takes its height from tiers.
+    """
+    if fabrication:
+        max_w = 48.0
+        full_count = int(target_width // max_w)
+        remainder = target_width - (full_count * max_w)
+        n_cols = full_count + (1 if remainder > 0.01 else 0)
+        if n_cols == 0:
+            col_widths = np.full(1, target_width)
+        else:
+            col_widths = np.full(n_cols, max_w)
+            if remainder > 0.01:
+                col_widths[n_cols - 1] = remainder
+    else:
+        count = max(1, int(round(target_width / panel_width)))
+        col_widths = np.full(count, target_width / count)
+
+    n_cols = col_widths.shape[0]
+    n_rows = tiers.shape[0]
+    widths = np.empty((n_cols, n_rows))
+    heights = np.empty((n_cols, n_rows))
+    for c in range(n_cols):
+        for r in range(n_rows):
+            widths[c, r] = col_widths[c]
+            heights[c, r] = tiers[r]
+    return widths, heights
+
+
+# Panel type name <-> id stored in Wall's uint8 type array
+PANEL_TYPES = ("Solid", "Window", "Louver", "Cutout", "Door", "AccessPanel")
+PANEL_TYPE_IDS = {name: i for i, name in enumerate(PANEL_TYPES)}
+_PANEL_TYPE_NAMES = np.array(PANEL_TYPES, dtype=object)
+
+
+class _PanelView(PanelNode):
+    """
+    PanelNode-shaped, read-only view of one cell of a Wall's panel arrays.
+    """
+    __slots__ = ("_wall", "_col", "_row")
+
+    def __init__(self, wall, col, row):
+        self._wall = wall
+        self._col = col
+        self._row = row
+
+    @property
+    def type(self):
+        return PANEL_TYPES[self._wall._types[self._col, self._row]]
+
+    @property
+    def width(self):
+        return float(self._wall._widths[self._col, self._row])
+
+    @property
+    def height(self):
+        return float(self._wall._heights[self._col, self._row])
+
+    @property
+    def row(self):
+        return self._row
+
+    @property
+    def variant_params(self):
+        return self._wall._variants.get((self._col, self._row), {})
+
+
 class Wall:
     """
     Represents one wall of the enclosure (e.g., Back, Front, Left, Right, Top, Bottom).
     Contains a grid of panels organized as columns.
+
+    Panels are stored as parallel (cols, rows) arrays -- widths, heights and
+    type ids -- plus a sparse (col, row) -> params dict for the few panels
+    with variant parameters. wall[col, row] and wall.columns give
+    PanelNode-shaped views over them.
     """
+    __slots__ = ("name", "target_width", "target_height", "strategy",
+                 "_widths", "_heights", "_types", "_variants",
+                 "_grid_cache", "_tiers_cache")
+
     def __init__(self, name, target_width=60.0, target_height=60.0):
         self.name = name
         self.target_width = target_width  # Total wall dimension (X or Y depending on orientation)
         self.target_height = target_height  # Total wall height (Z for vertical walls, Y or X for top/bottom)
         self.strategy = GridStrategy.EQUAL
-        self.columns = []  # List[List[PanelNode]] - each column is a vertical stack
+        self._widths = np.zeros((0, 0))
+        self._heights = np.zeros((0, 0))
+        self._types = np.zeros((0, 0), dtype=np.uint8)
+        self._variants = {}  # (col, row) -> {"win_width": 24.0, ...}
+        # (col widths, row heights, col starts, row starts, widths, heights,
+        # types); rebuilt lazily. Grid changes must go through the methods
+        # below, which invalidate it.
+        self._grid_cache = None
+        # (target_height, tiers) from the last _calculate_tiers call; keyed on
+        # the height, so it survives clear() and regenerations at equal height
+        self._tiers_cache = None
 
     def clear(self):
-        self.columns = []
+        self._set_columns([], ())
+
+    def _set_columns(self, col_widths, tiers):
+        """Replaces the grid with Solid panels of the given column widths and tier heights."""
+        col_widths = np.asarray(col_widths, dtype=np.float64)
+        tiers = np.asarray(tiers, dtype=np.float64)
+        shape = (col_widths.size, tiers.size)
+        # Every panel in a column shares its width, every panel in a row its tier height
+        self._set_grid(np.broadcast_to(col_widths[:, None], shape).copy(),
+                       np.broadcast_to(tiers[None, :], shape).copy())
+
+    def _set_grid(self, widths, heights):
+        """Replaces the grid with Solid panels of the given (cols, rows) sizes."""
+        self._widths = widths
+        self._heights = heights
+        self._types = np.zeros(widths.shape, dtype=np.uint8)
+        self._variants = {}
+        self._grid_cache = None
+
+    def __getitem__(self, key):
+        """wall[col, row] -> PanelNode-shaped view of that panel."""
+        col, row = key
+        if not (0 <= col < self._types.shape[0] and 0 <= row < self._types.shape[1]):
+            raise IndexError(f"panel ({col}, {row}) out of range for wall {self.name}")
+        return _PanelView(self, col, row)
+
+    @property
+    def columns(self):
+        """List[List[PanelNode]] views, one list per column (bottom row first)."""
+        n_cols, n_rows = self._types.shape
+        return [[_PanelView(self, c, r) for r in range(n_rows)] for c in range(n_cols)]
+
+    def _grid(self):
+        if self._grid_cache is None:
+            col_w = self._widths[:, 0].copy() if self._widths.shape[1] else np.zeros(0)
+            row_h = self._heights[0].copy() if self._heights.shape[0] else np.zeros(0)
+            # Left/bottom edge of every column/row
+            col_starts = np.concatenate(([0.0], np.cumsum(col_w)[:-1])) if col_w.size else col_w
+            row_starts = np.concatenate(([0.0], np.cumsum(row_h)[:-1])) if row_h.size else row_h
+
+            # (rows, cols) views of the panel arrays for the renderer
+            widths = self._widths.T.copy()
+            heights = self._heights.T.copy()
+            types = _PANEL_TYPE_NAMES[self._types.T]
+
+            for arr in (col_w, row_h, col_starts, row_starts, widths, heights):
+                arr.flags.writeable = False
+            self._grid_cache = (col_w, row_h, col_starts, row_starts, widths, heights, types)
+        return self._grid_cache
+
+    def get_col_widths(self):
+        """Column widths (first panel of each column), read-only array."""
+        return self._grid()[0]
+
+    def get_row_heights(self):
+        """Row heights taken from the first column, read-only array."""
+        return self._grid()[1]
+
+    def get_col_starts(self):
+        """Cumulative left edge of each column, read-only array."""
+        return self._grid()[2]
+
+    def get_row_starts(self):
+        """Cumulative bottom edge of each row, read-only array."""
+        return self._grid()[3]
+
+    @property
+    def widths(self):
+        """(rows, cols) panel widths, read-only array."""
+        return self._grid()[4]
+
+    @property
+    def heights(self):
+        """(rows, cols) panel heights, read-only array."""
+        return self._grid()[5]
+
+    @property
+    def types(self):
+        """(rows, cols) panel type names, object array."""
+        return self._grid()[6]
 
     def regenerate_default(self, panel_width=30.0, strategy=GridStrategy.EQUAL):
         """
         Regenerates the wall with standard solid panels.
         """
-        self.clear()
         self.strategy = strategy
 
-        if strategy == GridStrategy.EQUAL:
-            # Calculate number of columns
-            count = max(1, int(round(self.target_width / panel_width)))
-            actual_width = self.target_width / count
-            col_widths = [actual_width] * count
-        else: # FABRICATION
-            # Max 48" panels + remainder
-            MAX_W = 48.0
-            full_count = int(self.target_width // MAX_W)
-            remainder = self.target_width - (full_count * MAX_W)
-            
-            col_widths = [MAX_W] * full_count
-            if remainder > 0.01:
-                col_widths.append(remainder)
-            
-            if not col_widths:
-                col_widths = [self.target_width]
-
-        # Calculate tiers (vertical stacking)
-        tiers = self._calculate_tiers()
-
-        for w in col_widths:
-            col_panels = []
-            for r, h in enumerate(tiers):
-                p = PanelNode("Solid", w, h, r)
-                col_panels.append(p)
-            self.columns.append(col_panels)
+        # Column widths (EQUAL / FABRICATION) and tier heights expanded to
+        # the full (cols, rows) grid in one compiled pass
+        tiers = np.asarray(self._calculate_tiers(), dtype=np.float64)
+        widths, heights = _build_wall_grid(float(self.target_width), tiers, float(panel_width),
+                                           strategy == GridStrategy.FABRICATION)
+        self._set_grid(widths, heights)
 
     def _calculate_tiers(self):
         """
@@ -94,6 +247,9 @@ class Wall:
         Rule: If Wall Height is > 30" and < 96", split into 2 equal panels (50%).
         Otherwise, use max panel size (48") logic.
         """
+        if self._tiers_cache is not None and self._tiers_cache[0] == self.target_height:
+            return self._tiers_cache[1]
+
         MAX_PANEL_HEIGHT = 96.0
         
         # User Logic: If > 96", max panel is 96", create header for remainder.
@@ -102,7 +258,9 @@ class Wall:
         # H > 96: [96, Remainder] (Bottom-Up)
 
         if self.target_height <= MAX_PANEL_HEIGHT:
-            return [self.target_height]
+            tiers = (self.target_height,)
+            self._tiers_cache = (self.target_height, tiers)
+            return tiers
         
         # H > 96: Multi-tier logic (Max + Remainder)
         tiers = []
@@ -112,51 +270,109 @@ class Wall:
             tier_h = min(MAX_PANEL_HEIGHT, remaining)
             tiers.append(tier_h)
             remaining -= tier_h
-        
+
+        tiers = tuple(tiers)
+        self._tiers_cache = (self.target_height, tiers)
         return tiers
 
     def set_panel_type(self, col_idx, row_idx, p_type, params=None):
         """
         Sets the type and parameters of a specific panel.
+        Type names outside PANEL_TYPES (e.g. read back from a stage) fall
+        back to Solid.
         """
-        if 0 <= col_idx < len(self.columns):
-            column = self.columns[col_idx]
-            if 0 <= row_idx < len(column):
-                column[row_idx].type = p_type
-                column[row_idx].variant_params = params.copy() if params else {}
+        n_cols, n_rows = self._types.shape
+        if 0 <= col_idx < n_cols and 0 <= row_idx < n_rows:
+            type_id = PANEL_TYPE_IDS.get(p_type)
+            if type_id is None:
+                print(f"[EnclosureModel] Unknown panel type {p_type!r} on {self.name} "
+                      f"panel ({col_idx}, {row_idx}); using Solid")
+                p_type = "Solid"
+                type_id = PANEL_TYPE_IDS[p_type]
+            self._types[col_idx, row_idx] = type_id
+            if params:
+                self._variants[(col_idx, row_idx)] = params.copy()
+            else:
+                self._variants.pop((col_idx, row_idx), None)
+            if self._grid_cache is not None:
+                self._grid_cache[6][row_idx, col_idx] = p_type
 
     def update_column_width(self, col_idx, new_width):
         """
         Updates width of a specific column and reflows the rest.
         """
-        if 0 <= col_idx < len(self.columns):
-            for p in self.columns[col_idx]:
-                p.width = new_width
+        if 0 <= col_idx < self._widths.shape[0]:
+            self._widths[col_idx] = new_width
+            self._grid_cache = None
             self._reflow_columns(col_idx)
 
     def _reflow_columns(self, frozen_idx):
         """
         Recalculates columns after frozen_idx to fit target_width.
         """
-        used_width = sum(col[0].width for col in self.columns[:frozen_idx + 1] if col)
+        keep = frozen_idx + 1
+        used_width = float(self._widths[:keep, 0].sum()) if self._widths.shape[1] else 0.0
         remaining = self.target_width - used_width
 
-        # Remove columns after frozen
-        del self.columns[frozen_idx + 1:]
-
-        if remaining <= 0.01:
-            return
-
         # Fill with standard panels
         std_width = 30.0
-        tiers = self._calculate_tiers()
-
+        new_widths = []
         while remaining > 0.01:
             next_w = min(std_width, remaining)
-            col_panels = [PanelNode("Solid", next_w, h, r) for r, h in enumerate(tiers)]
-            self.columns.append(col_panels)
+            new_widths.append(next_w)
             remaining -= next_w
 
+        # Remove columns after frozen, then append the refill as Solid panels
+        tiers = self._calculate_tiers()
+        fill = (len(new_widths), len(tiers))
+        fill_w = np.empty(fill)
+        fill_w[:] = np.asarray(new_widths, dtype=np.float64).reshape(-1, 1)
+        fill_h = np.empty(fill)
+        fill_h[:] = np.asarray(tiers, dtype=np.float64)
+        self._widths = np.concatenate((self._widths[:keep], fill_w))
+        self._heights = np.concatenate((self._heights[:keep], fill_h))
+        self._types = np.concatenate((self._types[:keep], np.zeros(fill, dtype=np.uint8)))
+        self._variants = {k: v for k, v in self._variants.items() if k[0] < keep}
+        self._grid_cache = None
+
+
+# Sheet gauge -> thickness (inches)
+_GAUGE_THICKNESS = {
+    10: 0.1345,
+    11: 0.1196,
+    12: 0.1046,
+    14: 0.0747,
+    16: 0.0598,
+    18: 0.0478,
+    20: 0.0359,
+    22: 0.0299,
+    24: 0.0239,
+}
+
+# EnclosureModel fields serialize writes as btai:enclosure:<name>
+_SERIALIZED_ATTRS = (
+    ("length", Sdf.ValueTypeNames.Double),
+    ("width", Sdf.ValueTypeNames.Double),
+    ("height", Sdf.ValueTypeNames.Double),
+    ("gauge", Sdf.ValueTypeNames.Int),
+    ("flange_depth", Sdf.ValueTypeNames.Double),
+    ("has_entry_wall", Sdf.ValueTypeNames.Bool),
+    ("has_exit_wall", Sdf.ValueTypeNames.Bool),
+    ("has_floor", Sdf.ValueTypeNames.Bool),
+    ("opening_width", Sdf.ValueTypeNames.Double),
+    ("opening_height", Sdf.ValueTypeNames.Double),
+    ("grid_strategy", Sdf.ValueTypeNames.String),
+)
+
+# Children of a wall prim deserialize considers as panels
+_PANEL_CHILD_PREDICATE = Usd.PrimIsActive & Usd.PrimIsDefined & ~Usd.PrimIsAbstract
+
+# (panel attribute name, variant key) pairs deserialize recovers
+_VARIANT_ATTRS = tuple(
+    (f"custom:{k}", k) for k in ("win_width", "win_height", "win_y",
+                                 "ap_width", "ap_height", "ap_y",
+                                 "door_width", "door_height"))
+
 
 class EnclosureModel:
     """
@@ -194,6 +410,16 @@ class EnclosureModel:
         self.top = Wall("Top", length, width)        # +Z face
         self.bottom = Wall("Bottom", length, width)  # -Z face
 
+        # Wall objects are never replaced, so the name lookup is built once
+        self._walls_by_name = {
+            "Back": self.back,
+            "Front": self.front,
+            "Left": self.left,
+            "Right": self.right,
+            "Top": self.top,
+            "Bottom": self.bottom
+        }
+
     def initialize_default(self, panel_width=30.0, strategy=GridStrategy.EQUAL):
         """
         Initializes walls with default solid panels.
@@ -238,50 +464,33 @@ class EnclosureModel:
         """
         Returns a wall object by name.
         """
-        walls = {
-            "Back": self.back,
-            "Front": self.front,
-            "Left": self.left,
-            "Right": self.right,
-            "Top": self.top,
-            "Bottom": self.bottom
-        }
-        return walls.get(name)
+        return self._walls_by_name.get(name)
 
     def set_gauge(self, gauge):
         """
         Sets the gauge and updates thickness.
         """
-        gauge_map = {
-            10: 0.1345,
-            11: 0.1196,
-            12: 0.1046,
-            14: 0.0747,
-            16: 0.0598,
-            18: 0.0478,
-            20: 0.0359,
-            22: 0.0299,
-            24: 0.0239,
-        }
         self.gauge = gauge
-        self.thickness = gauge_map.get(gauge, 0.0747)
+        self.thickness = _GAUGE_THICKNESS.get(gauge, 0.0747)
 
     def serialize(self, prim):
         """
         Saves the model state to USD attributes on the prim.
         """
-        # Save scalar attributes
-        prim.CreateAttribute("btai:enclosure:length", Sdf.ValueTypeNames.Double).Set(self.length)
-        prim.CreateAttribute("btai:enclosure:width", Sdf.ValueTypeNames.Double).Set(self.width)
-        prim.CreateAttribute("btai:enclosure:height", Sdf.ValueTypeNames.Double).Set(self.height)
-        prim.CreateAttribute("btai:enclosure:gauge", Sdf.ValueTypeNames.Int).Set(self.gauge)
-        prim.CreateAttribute("btai:enclosure:flange_depth", Sdf.ValueTypeNames.Double).Set(self.flange_depth)
-        prim.CreateAttribute("btai:enclosure:has_entry_wall", Sdf.ValueTypeNames.Bool).Set(self.has_entry_wall)
-        prim.CreateAttribute("btai:enclosure:has_exit_wall", Sdf.ValueTypeNames.Bool).Set(self.has_exit_wall)
-        prim.CreateAttribute("btai:enclosure:has_floor", Sdf.ValueTypeNames.Bool).Set(self.has_floor)
-        prim.CreateAttribute("btai:enclosure:opening_width", Sdf.ValueTypeNames.Double).Set(self.opening_width)
-        prim.CreateAttribute("btai:enclosure:opening_height", Sdf.ValueTypeNames.Double).Set(self.opening_height)
-        prim.CreateAttribute("btai:enclosure:grid_strategy", Sdf.ValueTypeNames.String).Set(self.grid_strategy.name)
+        # Save scalar attributes as specs on the edit target in one change
+        # block: one recomposition/notice for the batch, not one per attribute.
+        edit_target = prim.GetStage().GetEditTarget()
+        layer = edit_target.GetLayer()
+        values = {name: getattr(self, name) for name, _ in _SERIALIZED_ATTRS}
+        values["grid_strategy"] = self.grid_strategy.name
+        with Sdf.ChangeBlock():
+            spec = Sdf.CreatePrimInLayer(layer, edit_target.MapToSpecPath(prim.GetPath()))
+            for name, type_name in _SERIALIZED_ATTRS:
+                attr_name = f"btai:enclosure:{name}"
+                attr = spec.attributes[attr_name] if attr_name in spec.attributes else None
+                if attr is None:
+                    attr = Sdf.AttributeSpec(spec, attr_name, type_name, Sdf.VariabilityVarying, True)
+                attr.default = values[name]
         
         # We don't save every panel node here; the render process creates distinct prims.
         # However, to reload variants, we will need to walk the generated prims during load.
@@ -290,15 +499,17 @@ class EnclosureModel:
         """
         Loads the model state from USD attributes.
         """
-        attr_len = prim.GetAttribute("btai:enclosure:length")
-        if not attr_len.IsValid():
+        # One GetAttributes() call, then plain dict lookups
+        attrs = {a.GetName(): a for a in prim.GetAttributes()}
+        attr_len = attrs.get("btai:enclosure:length")
+        if attr_len is None:
             return False
             
         self.length = attr_len.Get()
         # Helper for safe attribute access
         def _get_attr(name, default=None):
-            attr = prim.GetAttribute(name)
-            if attr and attr.IsValid() and attr.HasValue():
+            attr = attrs.get(name)
+            if attr and attr.HasValue():
                 return attr.Get()
             return default
 
@@ -339,28 +550,29 @@ class EnclosureModel:
             if not wall_prim.IsValid():
                 continue
 
-            for child in wall_prim.GetChildren():
+            # Active, defined panel prims only; the predicate is evaluated in
+            # USD and the name test avoids fetching attributes of other children.
+            for child in wall_prim.GetFilteredChildren(_PANEL_CHILD_PREDICATE):
+                if not child.GetName().startswith("Panel_"):
+                    continue
                 # Check for panel attributes
-                row_attr = child.GetAttribute("btai:panel:row")
-                col_attr = child.GetAttribute("btai:panel:col")
-                type_attr = child.GetAttribute("custom:panel_type") # Saved by instantiate_panel relative to prim
+                child_attrs = {a.GetName(): a for a in child.GetAttributes()}
+                row_attr = child_attrs.get("btai:panel:row")
+                col_attr = child_attrs.get("btai:panel:col")
+                type_attr = child_attrs.get("custom:panel_type") # Saved by instantiate_panel relative to prim
                 
-                if row_attr.IsValid() and col_attr.IsValid():
+                if row_attr and col_attr:
                     row = row_attr.Get()
                     col = col_attr.Get()
-                    p_type = type_attr.Get() if type_attr.IsValid() else "Solid"
+                    p_type = type_attr.Get() if type_attr else "Solid"
                     
                     # Recover variants
                     v_params = {}
                     
                     # Try to read known params
-                    known_keys = ["win_width", "win_height", "win_y", 
-                                  "ap_width", "ap_height", "ap_y",
-                                  "door_width", "door_height"]
-                    
-                    for k in known_keys:
-                        attr = child.GetAttribute(f"custom:{k}")
-                        if attr.IsValid():
+                    for attr_name, k in _VARIANT_ATTRS:
+                        attr = child_attrs.get(attr_name)
+                        if attr:
                             v_params[k] = attr.Get()
                     
                     # Re-apply to memory model
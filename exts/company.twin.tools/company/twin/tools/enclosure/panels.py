@@ -4,28 +4,183 @@
 """
 Panel Instantiation for Sheet Metal Enclosure.
 Creates geometric primitives for different panel types.
-"""
-
-from pxr import UsdGeom, Gf, Sdf
-
 
-def _tag_subpart(prim, p_type, w, h, d, gauge, mat="Galvanized Steel"):
-    """Helper to tag a prim as a sheet metal sub-part for BOM."""
-    custom = prim.GetCustomData() or {}
-    custom['generatorType'] = 'sheet_metal_subpart'
-    custom['designation'] = f"{w:.1f}\"x{h:.1f}\" ({gauge}ga)"
-    custom['description'] = f"Part: {p_type}"
-    custom['thickness'] = d 
-    custom['width'] = w
-    custom['height'] = h
-    custom['gauge'] = gauge
-    custom['material'] = mat
-    prim.SetCustomData(custom)
+Geometry is authored as Sdf specs straight into the stage's edit-target layer
+(no UsdStage calls), so panels can be built inside an Sdf.ChangeBlock and the
+whole enclosure recomposes once. instance_panel shares the geometry of identical
+panels through instanceable internal references.
+"""
 
+import hashlib
+
+from pxr import UsdGeom, UsdShade, Gf, Sdf
+
+_GALVANIZED_PATH = "/Looks/GalvanizedMetal"
+_GLASS_PATH = "/Looks/Glass"
+
+# (input name, type, value) for each shared UsdPreviewSurface material
+_GALVANIZED_INPUTS = (
+    # Galvanized properties (Reflective)
+    ("diffuseColor", Sdf.ValueTypeNames.Color3f, Gf.Vec3f(0.6, 0.62, 0.65)),
+    ("metallic", Sdf.ValueTypeNames.Float, 0.8),
+    ("roughness", Sdf.ValueTypeNames.Float, 0.2),
+    ("ior", Sdf.ValueTypeNames.Float, 1.5),
+)
+_GLASS_INPUTS = (
+    # Glass properties (Transparent)
+    # Use dark base color so it looks like tinted glass rather than milky white
+    ("diffuseColor", Sdf.ValueTypeNames.Color3f, Gf.Vec3f(0.05, 0.05, 0.05)),
+    ("useSpecularWorkflow", Sdf.ValueTypeNames.Int, 0),
+    ("specularColor", Sdf.ValueTypeNames.Color3f, Gf.Vec3f(1.0, 1.0, 1.0)),  # Reflective
+    ("metallic", Sdf.ValueTypeNames.Float, 0.0),  # Dielectric
+    ("roughness", Sdf.ValueTypeNames.Float, 0.0),  # Perfectly smooth
+    ("clearcoat", Sdf.ValueTypeNames.Float, 1.0),
+    ("clearcoatRoughness", Sdf.ValueTypeNames.Float, 0.0),
+    ("opacity", Sdf.ValueTypeNames.Float, 0.2),  # Transparent
+    ("ior", Sdf.ValueTypeNames.Float, 1.52),  # Glass IOR
+)
+
+
+# ---------------------------------------------------------------------------
+# Sdf authoring helpers
+# ---------------------------------------------------------------------------
+
+def _define_spec(layer, path, type_name):
+    """Returns a `def` prim spec of type_name at path (parents become `over`s)."""
+    spec = Sdf.CreatePrimInLayer(layer, path)
+    spec.specifier = Sdf.SpecifierDef
+    spec.typeName = type_name
+    return spec
+
+
+def _set_attr(spec, name, type_name, value=None, custom=False, variability=Sdf.VariabilityVarying):
+    """Creates (or reuses) an attribute spec and sets its default value."""
+    attr = spec.attributes[name] if name in spec.attributes else None
+    if attr is None:
+        attr = Sdf.AttributeSpec(spec, name, type_name, variability, custom)
+    if value is not None:
+        attr.default = value
+    return attr
+
+
+def _set_xform_ops(spec, translate=None, rotate_xyz=None, rotate_x=None, scale=None):
+    """Authors xform ops (same names/precision as the UsdGeom Add*Op defaults) and xformOpOrder."""
+    order = []
+    if translate is not None:
+        _set_attr(spec, "xformOp:translate", Sdf.ValueTypeNames.Double3, Gf.Vec3d(*translate))
+        order.append("xformOp:translate")
+    if rotate_xyz is not None:
+        _set_attr(spec, "xformOp:rotateXYZ", Sdf.ValueTypeNames.Float3, Gf.Vec3f(*rotate_xyz))
+        order.append("xformOp:rotateXYZ")
+    if rotate_x is not None:
+        _set_attr(spec, "xformOp:rotateX", Sdf.ValueTypeNames.Float, float(rotate_x))
+        order.append("xformOp:rotateX")
+    if scale is not None:
+        _set_attr(spec, "xformOp:scale", Sdf.ValueTypeNames.Float3, Gf.Vec3f(*scale))
+        order.append("xformOp:scale")
+    _set_attr(spec, UsdGeom.Tokens.xformOpOrder, Sdf.ValueTypeNames.TokenArray, order,
+              variability=Sdf.VariabilityUniform)
+
+
+def _set_custom_data(spec, **entries):
+    data = dict(spec.customData)
+    data.update(entries)
+    spec.customData = data
+
+
+def _define_cube(layer, path, translate, scale, color=None, rotate_x=None):
+    """Cube spec with translate[/rotateX]/scale ops and an optional displayColor."""
+    spec = _define_spec(layer, path, "Cube")
+    _set_xform_ops(spec, translate=translate, rotate_x=rotate_x, scale=scale)
+    if color is not None:
+        _set_attr(spec, "primvars:displayColor", Sdf.ValueTypeNames.Color3fArray, [Gf.Vec3f(*color)])
+    return spec
+
+
+def _ensure_material(stage, layer, mat_path, inputs):
+    """
+    Authors a shared UsdPreviewSurface material at mat_path unless the stage or
+    the edit layer already has it.
+    """
+    if layer.GetPrimAtPath(mat_path) or stage.GetPrimAtPath(mat_path):
+        return
+    # Create Looks scope if needed
+    if not layer.GetPrimAtPath("/Looks") and not stage.GetPrimAtPath("/Looks"):
+        _define_spec(layer, "/Looks", "Scope")
+
+    mat = _define_spec(layer, mat_path, "Material")
+    shader_path = f"{mat_path}/PBRShader"
+    shader = _define_spec(layer, shader_path, "Shader")
+    _set_attr(shader, "info:id", Sdf.ValueTypeNames.Token, "UsdPreviewSurface",
+              variability=Sdf.VariabilityUniform)
+    for name, type_name, value in inputs:
+        _set_attr(shader, f"inputs:{name}", type_name, value)
+    _set_attr(shader, "outputs:surface", Sdf.ValueTypeNames.Token)
+
+    surface = _set_attr(mat, "outputs:surface", Sdf.ValueTypeNames.Token)
+    surface.connectionPathList.explicitItems = [Sdf.Path(shader_path).AppendProperty("outputs:surface")]
+
+
+def _bind_material(spec, mat_path):
+    """Sdf equivalent of UsdShade.MaterialBindingAPI(prim).Bind(material)."""
+    if "material:binding" in spec.relationships:
+        rel = spec.relationships["material:binding"]
+    else:
+        rel = Sdf.RelationshipSpec(spec, "material:binding", False)
+    rel.targetPathList.explicitItems = [Sdf.Path(mat_path)]
+
+
+def _tag_subpart(spec, p_type, w, h, d, gauge, mat="Galvanized Steel"):
+    """Helper to tag a prim spec as a sheet metal sub-part for BOM."""
+    _set_custom_data(
+        spec,
+        generatorType='sheet_metal_subpart',
+        designation=f"{w:.1f}\"x{h:.1f}\" ({gauge}ga)",
+        description=f"Part: {p_type}",
+        thickness=d,
+        width=w,
+        height=h,
+        gauge=gauge,
+        material=mat,
+    )
+
+
+def _author_panel_root(spec, width, height, thickness, p_type, variant_params, gauge):
+    """Panel-level custom:* attributes and BOM customData on the panel root spec."""
+    # Store metadata
+    _set_attr(spec, "custom:panel_type", Sdf.ValueTypeNames.String, p_type, custom=True)
+    _set_attr(spec, "custom:width", Sdf.ValueTypeNames.Double, width, custom=True)
+    _set_attr(spec, "custom:height", Sdf.ValueTypeNames.Double, height, custom=True)
+    _set_attr(spec, "custom:thickness", Sdf.ValueTypeNames.Double, thickness, custom=True)
+    _set_attr(spec, "custom:gauge", Sdf.ValueTypeNames.Int, gauge, custom=True)
+    _set_attr(spec, "custom:material", Sdf.ValueTypeNames.String, "Galvanized Steel", custom=True)
+    
+    # Save parameters for deserialization
+    if variant_params:
+        for k, v in variant_params.items():
+            attr_name = f"custom:{k}"
+            _set_attr(spec, attr_name, Sdf.ValueTypeNames.Double, float(v), custom=True)
 
-def instantiate_panel(stage, path, width, height, thickness, p_type="Solid", variant_params=None, flange_depth=1.0, gauge=16):
+    # Metadata for BOM
+    _set_custom_data(
+        spec,
+        generatorType='sheet_metal_panel',
+        designation=f"{width}\"x{height}\" ({gauge}ga)",
+        description=f"Sheet Metal Panel - {p_type}",
+        gauge=gauge,
+        thickness=thickness,
+        width=width,
+        height=height,
+        material="Galvanized Steel",
+    )
+
+
+def instantiate_panel(stage, path, width, height, thickness, p_type="Solid", variant_params=None, flange_depth=1.0, gauge=16, layer=None):
     """
     Creates a sheet metal panel at the given path.
+
+    Authors Sdf specs only (into layer, or the stage's edit-target layer), so
+    it is safe to call inside an Sdf.ChangeBlock.
     
     Args:
         stage: USD Stage
@@ -37,118 +192,122 @@ def instantiate_panel(stage, path, width, height, thickness, p_type="Solid", var
         variant_params: Dict with variant-specific parameters
         flange_depth: Bend/flange depth
         gauge: Sheet metal gauge (int)
+        layer: Sdf layer for the panel geometry, e.g. a scratch layer that is
+            copied onto the stage afterwards. Materials always go to the stage.
+
+    Returns:
+        Sdf.PrimSpec of the panel root, ready for placement.
     """
     if variant_params is None:
         variant_params = {}
 
+    stage_layer = stage.GetEditTarget().GetLayer()
+    _ensure_material(stage, stage_layer, _GALVANIZED_PATH, _GALVANIZED_INPUTS)
+    if p_type in ("Window", "Door", "AccessPanel"):
+        _ensure_material(stage, stage_layer, _GLASS_PATH, _GLASS_INPUTS)
+    if layer is None:
+        layer = stage_layer
+
     # Create panel root Xform
-    panel_root = UsdGeom.Xform.Define(stage, path)
+    spec = _define_spec(layer, path, "Xform")
     
-    # Store metadata
-    prim = panel_root.GetPrim()
-    prim.CreateAttribute("custom:panel_type", Sdf.ValueTypeNames.String).Set(p_type)
-    prim.CreateAttribute("custom:width", Sdf.ValueTypeNames.Double).Set(width)
-    prim.CreateAttribute("custom:height", Sdf.ValueTypeNames.Double).Set(height)
-    prim.CreateAttribute("custom:thickness", Sdf.ValueTypeNames.Double).Set(thickness)
-    prim.CreateAttribute("custom:gauge", Sdf.ValueTypeNames.Int).Set(gauge)
-    prim.CreateAttribute("custom:material", Sdf.ValueTypeNames.String).Set("Galvanized Steel")
-    
-    # Save parameters for deserialization
-    if variant_params:
-        for k, v in variant_params.items():
-            attr_name = f"custom:{k}"
-            prim.CreateAttribute(attr_name, Sdf.ValueTypeNames.Double).Set(float(v))
-
-    # Metadata for BOM
-    custom_data = prim.GetCustomData() or {}
-    custom_data['generatorType'] = 'sheet_metal_panel'
-    custom_data['designation'] = f"{width}\"x{height}\" ({gauge}ga)"
-    custom_data['description'] = f"Sheet Metal Panel - {p_type}"
-    custom_data['gauge'] = gauge
-    custom_data['thickness'] = thickness
-    custom_data['width'] = width
-    custom_data['height'] = height
-    custom_data['material'] = "Galvanized Steel"
-    prim.SetCustomData(custom_data)
-
-    W2 = width / 2.0
-    H = height
-    D = flange_depth
-    T = thickness
+    _author_panel_root(spec, width, height, thickness, p_type, variant_params, gauge)
 
     # --- Create Geometry Based on Type ---
 
     if p_type == "Solid":
-        _create_solid_panel(stage, path, width, height, thickness, flange_depth)
+        _create_solid_panel(layer, path, width, height, thickness, flange_depth)
     elif p_type == "Window":
-        _create_window_panel(stage, path, width, height, thickness, flange_depth, variant_params, gauge)
+        _create_window_panel(layer, path, width, height, thickness, flange_depth, variant_params, gauge)
     elif p_type == "Louver":
-        _create_louver_panel(stage, path, width, height, thickness, flange_depth, variant_params, gauge)
+        _create_louver_panel(layer, path, width, height, thickness, flange_depth, variant_params, gauge)
     elif p_type == "Door":
-        _create_door_panel(stage, path, width, height, thickness, flange_depth, variant_params, gauge)
+        _create_door_panel(layer, path, width, height, thickness, flange_depth, variant_params, gauge)
     elif p_type == "AccessPanel":
-        _create_access_panel(stage, path, width, height, thickness, flange_depth, variant_params, gauge)
+        _create_access_panel(layer, path, width, height, thickness, flange_depth, variant_params, gauge)
     elif p_type == "Cutout":
         pass # Create nothing (empty Xform remains)
     else:
         # Default to solid
-        _create_solid_panel(stage, path, width, height, thickness, flange_depth)
+        _create_solid_panel(layer, path, width, height, thickness, flange_depth)
+
+    return spec
+
+
+def instance_panel(stage, path, prototypes, prototype_root, width, height, thickness, p_type="Solid",
+                   variant_params=None, flange_depth=1.0, gauge=16, layer=None, deferred=None):
+    """
+    Like instantiate_panel, but panels of the same kind share one geometry prototype.
 
+    The first panel of each kind builds its geometry under prototype_root (a
+    `class` prim, so it is never drawn); every panel is then an instanceable
+    Xform with an internal reference to it plus its own custom:* attributes and
+    BOM customData. prototypes maps kind -> prototype path for the current build.
+    With deferred (a list), a new prototype is only placed and its
+    instantiate_panel arguments are appended for the caller to build later.
 
-def _create_solid_panel(stage, path, width, height, thickness, flange_depth):
+    Returns:
+        Sdf.PrimSpec of the panel root, ready for placement.
+    """
+    if variant_params is None:
+        variant_params = {}
+    if p_type == "Cutout":
+        # No geometry to share
+        return instantiate_panel(stage, path, width, height, thickness, p_type, variant_params,
+                                 flange_depth, gauge, layer=layer)
+    if layer is None:
+        layer = stage.GetEditTarget().GetLayer()
+
+    key = (p_type, width, height, thickness, flange_depth, gauge, tuple(sorted(variant_params.items())))
+    proto_path = prototypes.get(key)
+    if proto_path is None:
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=6).hexdigest()
+        proto_path = f"{prototype_root}/Panel_{digest}"
+        prototypes[key] = proto_path
+        proto = layer.GetPrimAtPath(proto_path)
+        # A prototype left from an earlier build is complete once it has its metadata
+        if not proto or "custom:panel_type" not in proto.attributes:
+            if not layer.GetPrimAtPath(prototype_root):
+                Sdf.CreatePrimInLayer(layer, prototype_root).specifier = Sdf.SpecifierClass
+            if deferred is None:
+                instantiate_panel(stage, proto_path, width, height, thickness, p_type, variant_params,
+                                  flange_depth, gauge, layer=layer)
+            else:
+                _define_spec(layer, proto_path, "Xform")
+                deferred.append((proto_path, width, height, thickness, p_type, dict(variant_params),
+                                 flange_depth, gauge))
+
+    spec = _define_spec(layer, path, "Xform")
+    _author_panel_root(spec, width, height, thickness, p_type, variant_params, gauge)
+    spec.referenceList.Prepend(Sdf.Reference(primPath=proto_path))
+    spec.SetInfo("instanceable", True)
+    return spec
+
+
+def _create_solid_panel(layer, path, width, height, thickness, flange_depth):
     """
     Creates a solid sheet metal panel with 4 flanges.
     Geometry: Main Face + Top/Bottom/Left/Right Flanges
     """
-    W2 = width / 2.0
     H = height
-    D = flange_depth
     T = thickness
 
     # 1. Main Face (Flat sheet)
-    face = UsdGeom.Cube.Define(stage, f"{path}/Face")
-    face.AddTranslateOp().Set(Gf.Vec3d(0, H/2.0, T/2.0))
-    face.AddScaleOp().Set(Gf.Vec3d(width/2.0, height/2.0, thickness/2.0))
-    face.CreateDisplayColorAttr([(0.65, 0.68, 0.72)])
-    _apply_galvanized_material(stage, face)
-
-    # 2. Top Flange
-    top = UsdGeom.Cube.Define(stage, f"{path}/Flange_Top")
-    top.AddTranslateOp().Set(Gf.Vec3d(0, H - T/2.0, D/2.0 + T))
-    top.AddScaleOp().Set(Gf.Vec3d(width/2.0, thickness/2.0, D/2.0))
-    top.CreateDisplayColorAttr([(0.55, 0.58, 0.62)])
-    _apply_galvanized_material(stage, top)
-
-    # 3. Bottom Flange
-    bot = UsdGeom.Cube.Define(stage, f"{path}/Flange_Bottom")
-    bot.AddTranslateOp().Set(Gf.Vec3d(0, T/2.0, D/2.0 + T))
-    bot.AddScaleOp().Set(Gf.Vec3d(width/2.0, thickness/2.0, D/2.0))
-    bot.CreateDisplayColorAttr([(0.55, 0.58, 0.62)])
-    _apply_galvanized_material(stage, bot)
-
-    # 4. Left Flange
-    left = UsdGeom.Cube.Define(stage, f"{path}/Flange_Left")
-    left.AddTranslateOp().Set(Gf.Vec3d(-W2 + T/2.0, H/2.0, D/2.0 + T))
-    left.AddScaleOp().Set(Gf.Vec3d(thickness/2.0, height/2.0, D/2.0))
-    left.CreateDisplayColorAttr([(0.55, 0.58, 0.62)])
-    _apply_galvanized_material(stage, left)
-
-    # 5. Right Flange
-    right = UsdGeom.Cube.Define(stage, f"{path}/Flange_Right")
-    right.AddTranslateOp().Set(Gf.Vec3d(W2 - T/2.0, H/2.0, D/2.0 + T))
-    right.AddScaleOp().Set(Gf.Vec3d(thickness/2.0, height/2.0, D/2.0))
-    right.CreateDisplayColorAttr([(0.55, 0.58, 0.62)])
-    _apply_galvanized_material(stage, right)
-
-
-def _create_window_panel(stage, path, width, height, thickness, flange_depth, params, gauge=16):
+    face = _define_cube(layer, f"{path}/Face",
+                        (0, H/2.0, T/2.0), (width/2.0, height/2.0, thickness/2.0), (0.65, 0.68, 0.72))
+    _bind_material(face, _GALVANIZED_PATH)
+
+    # 2-5. Top/Bottom/Left/Right Flanges
+    _add_flanges(layer, path, width, height, thickness, flange_depth)
+
+
+def _create_window_panel(layer, path, width, height, thickness, flange_depth, params, gauge=16):
     """
     Creates a panel with a window cutout.
     Window is represented as a gap (no geometry) in the center.
     """
     W2 = width / 2.0
     H = height
-    D = flange_depth
     T = thickness
 
     win_w = params.get("win_width", width * 0.6)
@@ -159,72 +318,63 @@ def _create_window_panel(stage, path, width, height, thickness, flange_depth, pa
     footer_h = win_y
     header_h = H - win_y - win_h
 
-
-
     # 1. Footer Section (Below Window)
     if footer_h > 0.01:
-        footer = UsdGeom.Cube.Define(stage, f"{path}/Footer")
-        footer.AddTranslateOp().Set(Gf.Vec3d(0, footer_h/2.0, T/2.0))
-        footer.AddScaleOp().Set(Gf.Vec3d(width/2.0, footer_h/2.0, thickness/2.0))
-        footer.CreateDisplayColorAttr([(0.65, 0.68, 0.72)])
-        _apply_galvanized_material(stage, footer)
+        footer = _define_cube(layer, f"{path}/Footer",
+                              (0, footer_h/2.0, T/2.0), (width/2.0, footer_h/2.0, thickness/2.0),
+                              (0.65, 0.68, 0.72))
+        _bind_material(footer, _GALVANIZED_PATH)
         # Tag Footer
-        _tag_subpart(footer.GetPrim(), "Footer", width, footer_h, thickness, 16) # Assuming 16ga if not passed, need valid gauge
+        _tag_subpart(footer, "Footer", width, footer_h, thickness, 16) # Assuming 16ga if not passed, need valid gauge
 
     # 2. Header Section (Above Window)
     if header_h > 0.01:
-        header = UsdGeom.Cube.Define(stage, f"{path}/Header")
-        header.AddTranslateOp().Set(Gf.Vec3d(0, win_y + win_h + header_h/2.0, T/2.0))
-        header.AddScaleOp().Set(Gf.Vec3d(width/2.0, header_h/2.0, thickness/2.0))
-        header.CreateDisplayColorAttr([(0.65, 0.68, 0.72)])
-        _apply_galvanized_material(stage, header)
+        header = _define_cube(layer, f"{path}/Header",
+                              (0, win_y + win_h + header_h/2.0, T/2.0), (width/2.0, header_h/2.0, thickness/2.0),
+                              (0.65, 0.68, 0.72))
+        _bind_material(header, _GALVANIZED_PATH)
         # Tag Header
-        _tag_subpart(header.GetPrim(), "Header", width, header_h, thickness, 16)
+        _tag_subpart(header, "Header", width, header_h, thickness, 16)
 
     # 3. Left Jamb (Side of Window)
     jamb_w = (width - win_w) / 2.0
     if jamb_w > 0.01:
-        left_jamb = UsdGeom.Cube.Define(stage, f"{path}/Jamb_Left")
-        left_jamb.AddTranslateOp().Set(Gf.Vec3d(-W2 + jamb_w/2.0, win_y + win_h/2.0, T/2.0))
-        left_jamb.AddScaleOp().Set(Gf.Vec3d(jamb_w/2.0, win_h/2.0, thickness/2.0))
-        left_jamb.CreateDisplayColorAttr([(0.65, 0.68, 0.72)])
-        _apply_galvanized_material(stage, left_jamb)
-        _tag_subpart(left_jamb.GetPrim(), "Jamb", jamb_w, win_h, thickness, 16)
-
-        right_jamb = UsdGeom.Cube.Define(stage, f"{path}/Jamb_Right")
-        right_jamb.AddTranslateOp().Set(Gf.Vec3d(W2 - jamb_w/2.0, win_y + win_h/2.0, T/2.0))
-        right_jamb.AddScaleOp().Set(Gf.Vec3d(jamb_w/2.0, win_h/2.0, thickness/2.0))
-        right_jamb.CreateDisplayColorAttr([(0.65, 0.68, 0.72)])
-        _apply_galvanized_material(stage, right_jamb)
-        _tag_subpart(right_jamb.GetPrim(), "Jamb", jamb_w, win_h, thickness, 16)
+        left_jamb = _define_cube(layer, f"{path}/Jamb_Left",
+                                 (-W2 + jamb_w/2.0, win_y + win_h/2.0, T/2.0), (jamb_w/2.0, win_h/2.0, thickness/2.0),
+                                 (0.65, 0.68, 0.72))
+        _bind_material(left_jamb, _GALVANIZED_PATH)
+        _tag_subpart(left_jamb, "Jamb", jamb_w, win_h, thickness, 16)
+
+        right_jamb = _define_cube(layer, f"{path}/Jamb_Right",
+                                  (W2 - jamb_w/2.0, win_y + win_h/2.0, T/2.0), (jamb_w/2.0, win_h/2.0, thickness/2.0),
+                                  (0.65, 0.68, 0.72))
+        _bind_material(right_jamb, _GALVANIZED_PATH)
+        _tag_subpart(right_jamb, "Jamb", jamb_w, win_h, thickness, 16)
 
     # 4. Window Glass (Optional - Semi-transparent)
-    glass = UsdGeom.Cube.Define(stage, f"{path}/Window_Glass")
-    glass.AddTranslateOp().Set(Gf.Vec3d(0, win_y + win_h/2.0, T/2.0))
-    glass.AddScaleOp().Set(Gf.Vec3d(win_w/2.0, win_h/2.0, 0.125))  # Thin glass
-    # glass.CreateDisplayColorAttr([(0.2, 0.4, 0.6)])  # Blue-ish glass
-    _apply_glass_material(stage, glass)
+    glass = _define_cube(layer, f"{path}/Window_Glass",
+                         (0, win_y + win_h/2.0, T/2.0), (win_w/2.0, win_h/2.0, 0.125))  # Thin glass
+    _bind_material(glass, _GLASS_PATH)
     
     # Tag Glass
-    g_prim = glass.GetPrim()
-    g_custom = g_prim.GetCustomData() or {}
-    g_custom['generatorType'] = 'glazing_panel'
-    g_custom['designation'] = f"{win_w:.1f}\"x{win_h:.1f}\""
-    g_custom['description'] = "Window Glazing (Plexiglass)"
-    g_custom['width'] = win_w
-    g_custom['height'] = win_h
-    g_custom['material'] = "Plexiglass"
-    g_prim.SetCustomData(g_custom)
+    _set_custom_data(
+        glass,
+        generatorType='glazing_panel',
+        designation=f"{win_w:.1f}\"x{win_h:.1f}\"",
+        description="Window Glazing (Plexiglass)",
+        width=win_w,
+        height=win_h,
+        material="Plexiglass",
+    )
     
     # Add flanges
-    _add_flanges(stage, path, width, height, thickness, flange_depth)
+    _add_flanges(layer, path, width, height, thickness, flange_depth)
 
 
-def _create_louver_panel(stage, path, width, height, thickness, flange_depth, params, gauge=16):
+def _create_louver_panel(layer, path, width, height, thickness, flange_depth, params, gauge=16):
     """
     Creates a panel with louver vents.
     """
-    W2 = width / 2.0
     H = height
     T = thickness
 
@@ -233,29 +383,25 @@ def _create_louver_panel(stage, path, width, height, thickness, flange_depth, pa
     louver_angle = params.get("louver_angle", 45.0)
 
     # Main Face Background
-    face = UsdGeom.Cube.Define(stage, f"{path}/Face")
-    face.AddTranslateOp().Set(Gf.Vec3d(0, H/2.0, T/2.0))
-    face.AddScaleOp().Set(Gf.Vec3d(width/2.0, height/2.0, thickness/2.0))
-    face.CreateDisplayColorAttr([(0.65, 0.68, 0.72)])
-    _apply_galvanized_material(stage, face)
+    face = _define_cube(layer, f"{path}/Face",
+                        (0, H/2.0, T/2.0), (width/2.0, height/2.0, thickness/2.0), (0.65, 0.68, 0.72))
+    _bind_material(face, _GALVANIZED_PATH)
 
     # Louver Blades
     blade_h = louver_spacing * 0.6
     for i in range(louver_count):
         y_pos = louver_spacing * (i + 1)
-        blade = UsdGeom.Cube.Define(stage, f"{path}/Louver_{i}")
-        blade.AddTranslateOp().Set(Gf.Vec3d(0, y_pos, T + blade_h/2.0))
-        blade.AddRotateXOp().Set(louver_angle)
-        blade.AddScaleOp().Set(Gf.Vec3d((width - 2)/2.0, blade_h/2.0, thickness/2.0))
-        blade.CreateDisplayColorAttr([(0.5, 0.52, 0.55)])
-        _apply_galvanized_material(stage, blade)
+        blade = _define_cube(layer, f"{path}/Louver_{i}",
+                             (0, y_pos, T + blade_h/2.0), ((width - 2)/2.0, blade_h/2.0, thickness/2.0),
+                             (0.5, 0.52, 0.55), rotate_x=louver_angle)
+        _bind_material(blade, _GALVANIZED_PATH)
         # Tag Blade
-        _tag_subpart(blade.GetPrim(), "Louver Blade", width-2, blade_h, thickness, gauge)
+        _tag_subpart(blade, "Louver Blade", width-2, blade_h, thickness, gauge)
 
-    _add_flanges(stage, path, width, height, thickness, flange_depth)
+    _add_flanges(layer, path, width, height, thickness, flange_depth)
 
 
-def _create_door_panel(stage, path, width, height, thickness, flange_depth, params, gauge=16):
+def _create_door_panel(layer, path, width, height, thickness, flange_depth, params, gauge=16):
     """
     Creates a panel with a door (Man Door or Double Door).
     Includes a viewing window and handle.
@@ -271,29 +417,26 @@ def _create_door_panel(stage, path, width, height, thickness, flange_depth, para
     # 1. Header (Above Door)
     header_h = H - door_h
     if header_h > 0.01:
-        header = UsdGeom.Cube.Define(stage, f"{path}/Header")
-        header.AddTranslateOp().Set(Gf.Vec3d(0, door_h + header_h/2.0, T/2.0))
-        header.AddScaleOp().Set(Gf.Vec3d(width/2.0, header_h/2.0, thickness/2.0))
-        header.CreateDisplayColorAttr([(0.65, 0.68, 0.72)])
-        _apply_galvanized_material(stage, header)
-        _tag_subpart(header.GetPrim(), "Door Header", width, header_h, thickness, gauge)
+        header = _define_cube(layer, f"{path}/Header",
+                              (0, door_h + header_h/2.0, T/2.0), (width/2.0, header_h/2.0, thickness/2.0),
+                              (0.65, 0.68, 0.72))
+        _bind_material(header, _GALVANIZED_PATH)
+        _tag_subpart(header, "Door Header", width, header_h, thickness, gauge)
         
     # 2. Side Jambs
     jamb_w = (width - door_w) / 2.0
     if jamb_w > 0.01:
-        left_jamb = UsdGeom.Cube.Define(stage, f"{path}/Jamb_Left")
-        left_jamb.AddTranslateOp().Set(Gf.Vec3d(-W2 + jamb_w/2.0, door_h/2.0, T/2.0))
-        left_jamb.AddScaleOp().Set(Gf.Vec3d(jamb_w/2.0, door_h/2.0, thickness/2.0))
-        left_jamb.CreateDisplayColorAttr([(0.65, 0.68, 0.72)])
-        _apply_galvanized_material(stage, left_jamb)
-        _tag_subpart(left_jamb.GetPrim(), "Door Jamb", jamb_w, door_h, thickness, gauge)
-
-        right_jamb = UsdGeom.Cube.Define(stage, f"{path}/Jamb_Right")
-        right_jamb.AddTranslateOp().Set(Gf.Vec3d(W2 - jamb_w/2.0, door_h/2.0, T/2.0))
-        right_jamb.AddScaleOp().Set(Gf.Vec3d(jamb_w/2.0, door_h/2.0, thickness/2.0))
-        right_jamb.CreateDisplayColorAttr([(0.65, 0.68, 0.72)])
-        _apply_galvanized_material(stage, right_jamb)
-        _tag_subpart(right_jamb.GetPrim(), "Door Jamb", jamb_w, door_h, thickness, gauge)
+        left_jamb = _define_cube(layer, f"{path}/Jamb_Left",
+                                 (-W2 + jamb_w/2.0, door_h/2.0, T/2.0), (jamb_w/2.0, door_h/2.0, thickness/2.0),
+                                 (0.65, 0.68, 0.72))
+        _bind_material(left_jamb, _GALVANIZED_PATH)
+        _tag_subpart(left_jamb, "Door Jamb", jamb_w, door_h, thickness, gauge)
+
+        right_jamb = _define_cube(layer, f"{path}/Jamb_Right",
+                                  (W2 - jamb_w/2.0, door_h/2.0, T/2.0), (jamb_w/2.0, door_h/2.0, thickness/2.0),
+                                  (0.65, 0.68, 0.72))
+        _bind_material(right_jamb, _GALVANIZED_PATH)
+        _tag_subpart(right_jamb, "Door Jamb", jamb_w, door_h, thickness, gauge)
         
     # --- 3. Composite Door Slab with Window ---
     # Window dimensions
@@ -320,6 +463,7 @@ def _create_door_panel(stage, path, width, height, thickness, flange_depth, para
         has_window = False
 
     door_thick = 1.75
+    slab_color = (0.6, 0.6, 0.65) # Industrial Grey
     
     if has_window:
         win_y_bottom = win_y_center - (win_h / 2.0)
@@ -327,77 +471,65 @@ def _create_door_panel(stage, path, width, height, thickness, flange_depth, para
         # Bottom Section
         bot_h = win_y_bottom
         if bot_h > 0:
-            slab_bot = UsdGeom.Cube.Define(stage, f"{path}/DoorSlab_Bottom")
-            slab_bot.AddTranslateOp().Set(Gf.Vec3d(0, bot_h/2.0, T))
-            slab_bot.AddScaleOp().Set(Gf.Vec3d(door_w/2.0, bot_h/2.0, door_thick/2.0))
-            slab_bot.CreateDisplayColorAttr([(0.6, 0.6, 0.65)]) # Industrial Grey
-            _tag_subpart(slab_bot.GetPrim(), "Door Slab Bottom", door_w, bot_h, door_thick, gauge)
+            slab_bot = _define_cube(layer, f"{path}/DoorSlab_Bottom",
+                                    (0, bot_h/2.0, T), (door_w/2.0, bot_h/2.0, door_thick/2.0), slab_color)
+            _tag_subpart(slab_bot, "Door Slab Bottom", door_w, bot_h, door_thick, gauge)
 
         # Top Section
         top_y = win_y_bottom + win_h
         top_h = door_h - top_y
         if top_h > 0:
-            slab_top = UsdGeom.Cube.Define(stage, f"{path}/DoorSlab_Top")
-            slab_top.AddTranslateOp().Set(Gf.Vec3d(0, top_y + top_h/2.0, T))
-            slab_top.AddScaleOp().Set(Gf.Vec3d(door_w/2.0, top_h/2.0, door_thick/2.0))
-            slab_top.CreateDisplayColorAttr([(0.6, 0.6, 0.65)])
-            _tag_subpart(slab_top.GetPrim(), "Door Slab Top", door_w, top_h, door_thick, gauge)
+            slab_top = _define_cube(layer, f"{path}/DoorSlab_Top",
+                                    (0, top_y + top_h/2.0, T), (door_w/2.0, top_h/2.0, door_thick/2.0), slab_color)
+            _tag_subpart(slab_top, "Door Slab Top", door_w, top_h, door_thick, gauge)
             
         # Side Stiles
         stile_w = (door_w - win_w) / 2.0
         if stile_w > 0:
             # Left Stile
-            stile_l = UsdGeom.Cube.Define(stage, f"{path}/DoorSlab_StileLeft")
-            stile_l.AddTranslateOp().Set(Gf.Vec3d(-(door_w/2.0) + (stile_w/2.0), win_y_center, T))
-            stile_l.AddScaleOp().Set(Gf.Vec3d(stile_w/2.0, win_h/2.0, door_thick/2.0))
-            stile_l.CreateDisplayColorAttr([(0.6, 0.6, 0.65)])
+            _define_cube(layer, f"{path}/DoorSlab_StileLeft",
+                         (-(door_w/2.0) + (stile_w/2.0), win_y_center, T),
+                         (stile_w/2.0, win_h/2.0, door_thick/2.0), slab_color)
             
             # Right Stile
-            stile_r = UsdGeom.Cube.Define(stage, f"{path}/DoorSlab_StileRight")
-            stile_r.AddTranslateOp().Set(Gf.Vec3d((door_w/2.0) - (stile_w/2.0), win_y_center, T))
-            stile_r.AddScaleOp().Set(Gf.Vec3d(stile_w/2.0, win_h/2.0, door_thick/2.0))
-            stile_r.CreateDisplayColorAttr([(0.6, 0.6, 0.65)])
+            _define_cube(layer, f"{path}/DoorSlab_StileRight",
+                         ((door_w/2.0) - (stile_w/2.0), win_y_center, T),
+                         (stile_w/2.0, win_h/2.0, door_thick/2.0), slab_color)
 
         # Window Glass
-        glass = UsdGeom.Cube.Define(stage, f"{path}/DoorWindow")
-        glass.AddTranslateOp().Set(Gf.Vec3d(0, win_y_center, T))
-        glass.AddScaleOp().Set(Gf.Vec3d(win_w/2.0, win_h/2.0, 0.125)) 
-        # glass.CreateDisplayColorAttr([(0.2, 0.3, 0.4)])
-        # glass.CreateDisplayOpacityAttr([0.3])
-        _apply_glass_material(stage, glass)
+        glass = _define_cube(layer, f"{path}/DoorWindow",
+                             (0, win_y_center, T), (win_w/2.0, win_h/2.0, 0.125))
+        _bind_material(glass, _GLASS_PATH)
     
     else:
         # Full solid slab
-        slab = UsdGeom.Cube.Define(stage, f"{path}/DoorSlab")
-        slab.AddTranslateOp().Set(Gf.Vec3d(0, door_h/2.0, T))
-        slab.AddScaleOp().Set(Gf.Vec3d(door_w/2.0, door_h/2.0, door_thick/2.0))
-        slab.CreateDisplayColorAttr([(0.6, 0.6, 0.65)])
-        _tag_subpart(slab.GetPrim(), "Door Slab", door_w, door_h, door_thick, gauge)
+        slab = _define_cube(layer, f"{path}/DoorSlab",
+                            (0, door_h/2.0, T), (door_w/2.0, door_h/2.0, door_thick/2.0), slab_color)
+        _tag_subpart(slab, "Door Slab", door_w, door_h, door_thick, gauge)
 
     # Handle (Lever style)
     handle_h = min(36.0, door_h * 0.5) # Handle height adjusted for small doors
     handle_offset = (door_w / 2.0) - 3.0 # 3 inches from edge
-    handle_root = UsdGeom.Xform.Define(stage, f"{path}/DoorHandle")
-    handle_root.AddTranslateOp().Set(Gf.Vec3d(handle_offset, handle_h, T + door_thick/2.0))
+    handle_root = _define_spec(layer, f"{path}/DoorHandle", "Xform")
+    _set_xform_ops(handle_root, translate=(handle_offset, handle_h, T + door_thick/2.0))
     
     # Handle Base
-    base = UsdGeom.Cylinder.Define(stage, f"{path}/DoorHandle/Base")
-    base.AddTranslateOp().Set(Gf.Vec3d(0, 0, 0.25))
-    base.CreateHeightAttr(0.5)
-    base.CreateRadiusAttr(1.5)
-    base.CreateAxisAttr("Z")
-    base.CreateDisplayColorAttr([(0.8, 0.8, 0.8)]) # Chrome/Silver
+    base = _define_spec(layer, f"{path}/DoorHandle/Base", "Cylinder")
+    _set_xform_ops(base, translate=(0, 0, 0.25))
+    _set_attr(base, "height", Sdf.ValueTypeNames.Double, 0.5)
+    _set_attr(base, "radius", Sdf.ValueTypeNames.Double, 1.5)
+    _set_attr(base, "axis", Sdf.ValueTypeNames.Token, "Z", variability=Sdf.VariabilityUniform)
+    _set_attr(base, "primvars:displayColor", Sdf.ValueTypeNames.Color3fArray,
+              [Gf.Vec3f(0.8, 0.8, 0.8)]) # Chrome/Silver
     
     # Handle Lever
-    lever = UsdGeom.Cube.Define(stage, f"{path}/DoorHandle/Lever")
-    lever.AddTranslateOp().Set(Gf.Vec3d(-2.0, 0, 0.75)) # Pointing inwards
-    lever.AddScaleOp().Set(Gf.Vec3d(2.5, 0.5, 0.25))
-    lever.CreateDisplayColorAttr([(0.8, 0.8, 0.8)])
+    _define_cube(layer, f"{path}/DoorHandle/Lever",
+                 (-2.0, 0, 0.75), (2.5, 0.5, 0.25), (0.8, 0.8, 0.8)) # Pointing inwards
 
-    _add_flanges(stage, path, width, height, thickness, flange_depth)
+    _add_flanges(layer, path, width, height, thickness, flange_depth)
 
 
-def _create_access_panel(stage, path, width, height, thickness, flange_depth, params, gauge=16):
+def _create_access_panel(layer, path, width, height, thickness, flange_depth, params, gauge=16):
     """
     Creates a panel with a removable access hatch.
     """
@@ -406,22 +538,20 @@ def _create_access_panel(stage, path, width, height, thickness, flange_depth, pa
     ap_y = params.get("ap_y", 36.0)
     
     # Base is effectively a Window panel but filled
-    _create_window_panel(stage, path, width, height, thickness, flange_depth, {
+    _create_window_panel(layer, path, width, height, thickness, flange_depth, {
         "win_width": ap_w,
         "win_height": ap_h,
         "win_y": ap_y
     }, gauge)
     
     # Add Hatch Cover
-    hatch = UsdGeom.Cube.Define(stage, f"{path}/HatchCover")
-    hatch.AddTranslateOp().Set(Gf.Vec3d(0, ap_y + ap_h/2.0, thickness + 0.1))
-    hatch.AddScaleOp().Set(Gf.Vec3d(ap_w/2.0 + 1.0, ap_h/2.0 + 1.0, 0.1)) # Overlap
-    hatch.CreateDisplayColorAttr([(0.9, 0.9, 0.9)])
-    _tag_subpart(hatch.GetPrim(), "Access Hatch Cover", ap_w + 2.0, ap_h + 2.0, 0.1, gauge)
-
+    hatch = _define_cube(layer, f"{path}/HatchCover",
+                         (0, ap_y + ap_h/2.0, thickness + 0.1), (ap_w/2.0 + 1.0, ap_h/2.0 + 1.0, 0.1), # Overlap
+                         (0.9, 0.9, 0.9))
+    _tag_subpart(hatch, "Access Hatch Cover", ap_w + 2.0, ap_h + 2.0, 0.1, gauge)
 
 
-def _add_flanges(stage, path, width, height, thickness, flange_depth):
+def _add_flanges(layer, path, width, height, thickness, flange_depth):
     """
     Helper to add 4 standard flanges to a panel.
     """
@@ -429,30 +559,16 @@ def _add_flanges(stage, path, width, height, thickness, flange_depth):
     H = height
     D = flange_depth
     T = thickness
+    color = (0.55, 0.58, 0.62)
 
-    top = UsdGeom.Cube.Define(stage, f"{path}/Flange_Top")
-    top.AddTranslateOp().Set(Gf.Vec3d(0, H - T/2.0, D/2.0 + T))
-    top.AddScaleOp().Set(Gf.Vec3d(width/2.0, thickness/2.0, D/2.0))
-    top.CreateDisplayColorAttr([(0.55, 0.58, 0.62)])
-    _apply_galvanized_material(stage, top)
-
-    bot = UsdGeom.Cube.Define(stage, f"{path}/Flange_Bottom")
-    bot.AddTranslateOp().Set(Gf.Vec3d(0, T/2.0, D/2.0 + T))
-    bot.AddScaleOp().Set(Gf.Vec3d(width/2.0, thickness/2.0, D/2.0))
-    bot.CreateDisplayColorAttr([(0.55, 0.58, 0.62)])
-    _apply_galvanized_material(stage, bot)
-
-    left = UsdGeom.Cube.Define(stage, f"{path}/Flange_Left")
-    left.AddTranslateOp().Set(Gf.Vec3d(-W2 + T/2.0, H/2.0, D/2.0 + T))
-    left.AddScaleOp().Set(Gf.Vec3d(thickness/2.0, height/2.0, D/2.0))
-    left.CreateDisplayColorAttr([(0.55, 0.58, 0.62)])
-    _apply_galvanized_material(stage, left)
-
-    right = UsdGeom.Cube.Define(stage, f"{path}/Flange_Right")
-    right.AddTranslateOp().Set(Gf.Vec3d(W2 - T/2.0, H/2.0, D/2.0 + T))
-    right.AddScaleOp().Set(Gf.Vec3d(thickness/2.0, height/2.0, D/2.0))
-    right.CreateDisplayColorAttr([(0.55, 0.58, 0.62)])
-    _apply_galvanized_material(stage, right)
+    for name, translate, scale in (
+        ("Flange_Top", (0, H - T/2.0, D/2.0 + T), (width/2.0, thickness/2.0, D/2.0)),
+        ("Flange_Bottom", (0, T/2.0, D/2.0 + T), (width/2.0, thickness/2.0, D/2.0)),
+        ("Flange_Left", (-W2 + T/2.0, H/2.0, D/2.0 + T), (thickness/2.0, height/2.0, D/2.0)),
+        ("Flange_Right", (W2 - T/2.0, H/2.0, D/2.0 + T), (thickness/2.0, height/2.0, D/2.0)),
+    ):
+        flange = _define_cube(layer, f"{path}/{name}", translate, scale, color)
+        _bind_material(flange, _GALVANIZED_PATH)
 
 
 def _apply_galvanized_material(stage, prim_schema):
@@ -460,64 +576,5 @@ def _apply_galvanized_material(stage, prim_schema):
     Applies a standard 'Galvanized Metal' material to the prim.
     Creates the material if it doesn't exist.
     """
-    from pxr import UsdShade
-    
-    mat_path = "/Looks/GalvanizedMetal"
-    mat = UsdShade.Material.Get(stage, mat_path)
-    
-    if not mat:
-        # Create Looks scope if needed
-        if not stage.GetPrimAtPath("/Looks"):
-            stage.DefinePrim("/Looks", "Scope")
-            
-        mat = UsdShade.Material.Define(stage, mat_path)
-        pbr_shader = UsdShade.Shader.Define(stage, f"{mat_path}/PBRShader")
-        pbr_shader.CreateIdAttr("UsdPreviewSurface")
-        
-        # Galvanized properties (Reflective)
-        pbr_shader.CreateInput("diffuseColor", Sdf.ValueTypeNames.Color3f).Set((0.6, 0.62, 0.65))
-        pbr_shader.CreateInput("metallic", Sdf.ValueTypeNames.Float).Set(0.8)
-        pbr_shader.CreateInput("roughness", Sdf.ValueTypeNames.Float).Set(0.2)
-        pbr_shader.CreateInput("ior", Sdf.ValueTypeNames.Float).Set(1.5)
-        
-        mat.CreateSurfaceOutput().ConnectToSource(pbr_shader.ConnectableAPI(), "surface")
-
-    # Bind material
-    UsdShade.MaterialBindingAPI(prim_schema.GetPrim()).Bind(mat)
-
-
-def _apply_glass_material(stage, prim_schema):
-    """
-    Applies a standard 'Glass' material to the prim.
-    Creates the material if it doesn't exist.
-    """
-    from pxr import UsdShade
-    
-    mat_path = "/Looks/Glass"
-    mat = UsdShade.Material.Get(stage, mat_path)
-    
-    if not mat:
-        # Create Looks scope if needed
-        if not stage.GetPrimAtPath("/Looks"):
-            stage.DefinePrim("/Looks", "Scope")
-            
-        mat = UsdShade.Material.Define(stage, mat_path)
-        pbr_shader = UsdShade.Shader.Define(stage, f"{mat_path}/PBRShader")
-        pbr_shader.CreateIdAttr("UsdPreviewSurface")
-        
-        # Glass properties (Transparent)
-        # Use dark base color so it looks like tinted glass rather than milky white
-        pbr_shader.CreateInput("diffuseColor", Sdf.ValueTypeNames.Color3f).Set((0.05, 0.05, 0.05))
-        pbr_shader.CreateInput("useSpecularWorkflow", Sdf.ValueTypeNames.Int).Set(0)
-        pbr_shader.CreateInput("specularColor", Sdf.ValueTypeNames.Color3f).Set((1.0, 1.0, 1.0)) # Reflective
-        pbr_shader.CreateInput("metallic", Sdf.ValueTypeNames.Float).Set(0.0) # Dielectric
-        pbr_shader.CreateInput("roughness", Sdf.ValueTypeNames.Float).Set(0.0) # Perfectly smooth
-        pbr_shader.CreateInput("clearcoat", Sdf.ValueTypeNames.Float).Set(1.0)
-        pbr_shader.CreateInput("clearcoatRoughness", Sdf.ValueTypeNames.Float).Set(0.0)
-        pbr_shader.CreateInput("opacity", Sdf.ValueTypeNames.Float).Set(0.2) # Transparent
-        pbr_shader.CreateInput("ior", Sdf.ValueTypeNames.Float).Set(1.52) # Glass IOR
-        
-        mat.CreateSurfaceOutput().ConnectToSource(pbr_shader.ConnectableAPI(), "surface")
-
-    # Bind material
-    UsdShade.MaterialBindingAPI(prim_schema.GetPrim()).Bind(mat)
+    _ensure_material(stage, stage.GetEditTarget().GetLayer(), _GALVANIZED_PATH, _GALVANIZED_INPUTS)
+    UsdShade.MaterialBindingAPI(prim_schema.GetPrim()).Bind(UsdShade.Material.Get(stage, _GALVANIZED_PATH))
@@ -153,9 +153,13 @@ class TapWindow(ui.Window):
                 thick_val = 0.0747  # default 14ga
                 
                 for p_path_str, p_prim in panels:
-                    # Get panel translation via XformCommonAPI
-                    xform_api = UsdGeom.XformCommonAPI(p_prim)
-                    trans, _, _, _, _ = xform_api.GetXformVectors(Usd.TimeCode.Default())
+                    # Get panel translation. render_enclosure authors a single
+                    # translate op per panel, so read it directly and only fall
+                    # back to the XformCommonAPI decomposition for edited prims.
+                    trans = p_prim.GetAttribute("xformOp:translate").Get()
+                    if trans is None:
+                        xform_api = UsdGeom.XformCommonAPI(p_prim)
+                        trans, _, _, _, _ = xform_api.GetXformVectors(Usd.TimeCode.Default())
                     
                     
                     # Read panel dimensions from attributes
@@ -188,12 +192,11 @@ class TapWindow(ui.Window):
                 filler_h = max_y - min_y
                 
                 # 1. Hide original panels (set to Cutout)
+                #    Panels are instanceable, so their children cannot be edited;
+                #    hide the panel root instead.
                 for p_path_str, p_prim in panels:
                     p_prim.GetAttribute("custom:panel_type").Set("Cutout")
-                    for child in p_prim.GetChildren():
-                        imageable = UsdGeom.Imageable(child)
-                        if imageable:
-                            imageable.MakeInvisible()
+                    UsdGeom.Imageable(p_prim).MakeInvisible()
                 
                 # 2. Create Filler Panel
                 #    Matches panels.py convention:
@@ -1,7 +1,15 @@
 import build123d as bd
+import numpy as np
 import math
+import json
+import weakref
+import functools
 from typing import List, Dict, Any
 
+# Per-solid edge classification, keyed weakly so entries die with the solid.
+# Value: {(base, height, top_base): {'vertical': [...], 'base': [...], 'top': [...], 'all': [...]}}
+_EDGE_CLASS_CACHE = weakref.WeakKeyDictionary()
+
 class PyramidGenerator:
     """
     Generator for Pyramid (or Tapered Extrusion) shapes with feature support.
@@ -24,7 +32,29 @@ class PyramidGenerator:
                                    {'type': 'fillet', 'edges': 'vertical', 'radius': 5.0, 'enabled': True}
 
         Returns:
-            bd.Solid: The generated solid.
+            bd.Solid: The generated solid. Results are cached by input, so
+                      treat it as read-only (copy before moving it in place).
+        """
+        # Features are plain dicts (unhashable); key the cache on their JSON form.
+        try:
+            features_key = json.dumps(features or [], sort_keys=True)
+        except (TypeError, ValueError):
+            return PyramidGenerator._build(base, height, taper_angle, features)
+
+        return PyramidGenerator._create_cached(float(base), float(height), float(taper_angle), features_key)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _create_cached(base: float, height: float, taper_angle: float, features_key: str) -> bd.Solid:
+        """
+        Cached wrapper around _build; features_key is the JSON-encoded feature list.
+        """
+        return PyramidGenerator._build(base, height, taper_angle, json.loads(features_key))
+
+    @staticmethod
+    def _build(base: float, height: float, taper_angle: float, features: List[Dict[str, Any]] = None) -> bd.Solid:
+        """
+        Builds the lofted pyramid and applies features (uncached).
         """
         # Calculate top dimension
         delta = height * math.tan(math.radians(taper_angle))
@@ -190,6 +220,63 @@ class PyramidGenerator:
                  
         return best_face
 
+    @staticmethod
+    def _classify_edges(solid: bd.Solid, base: float, height: float, top_base: float) -> Dict[str, List]:
+        """
+        Classifies every edge of the solid into semantic groups in a single pass.
+
+        Results are memoized per solid, so repeated group queries on the same
+        solid (e.g. vertical, then base, then top) only scan its edges once.
+        A filleted solid is a new object and gets classified afresh.
+
+        Returns:
+            Dict with 'vertical', 'base', 'top' and 'all' edge lists
+        """
+        key = (base, height, top_base)
+        try:
+            per_solid = _EDGE_CLASS_CACHE.setdefault(solid, {})
+        except TypeError:
+            per_solid = {}  # Not weak-referenceable/hashable: classify uncached
+
+        groups = per_solid.get(key)
+        if groups is not None:
+            return groups
+
+        all_edges = solid.edges()
+        groups = {'vertical': [], 'base': [], 'top': [], 'all': list(all_edges)}
+
+        tolerance = 0.1
+
+        # Gather edge bounding boxes, then test every group with array masks
+        edges = []
+        boxes = []
+        for edge in all_edges:
+            try:
+                bbox = edge.bounding_box()
+            except Exception as e:
+                print(f"[Edge Selection] Error checking edge: {e}")
+                continue
+            edges.append(edge)
+            boxes.append(((bbox.min.X, bbox.min.Y, bbox.min.Z), (bbox.max.X, bbox.max.Y, bbox.max.Z)))
+
+        if edges:
+            boxes = np.asarray(boxes, dtype=np.float64)  # (E, 2, 3): min/max corners
+            dx, dy, dz = np.abs(boxes[:, 1] - boxes[:, 0]).T
+            center_y = boxes[:, :, 1].mean(axis=1)
+
+            # Vertical edges connect base to top: large Y component, small X and Z
+            is_vertical = (dy > height * 0.5) & (dx < base * 0.3) & (dz < base * 0.3)
+            # Base edges are at Y ≈ 0, top edges at Y ≈ height
+            is_base = np.abs(center_y) < tolerance
+            is_top = np.abs(center_y - height) < tolerance
+
+            groups['vertical'] = [edges[i] for i in np.flatnonzero(is_vertical)]
+            groups['base'] = [edges[i] for i in np.flatnonzero(is_base)]
+            groups['top'] = [edges[i] for i in np.flatnonzero(is_top)]
+
+        per_solid[key] = groups
+        return groups
+
     @staticmethod
     def _get_semantic_edges(solid: bd.Solid, edge_group: str, base: float, height: float, top_base: float) -> List:
         """
@@ -205,60 +292,11 @@ class PyramidGenerator:
         Returns:
             List of edges matching the semantic group
         """
-        all_edges = solid.edges()
-        selected_edges = []
-
-        print(f"[Edge Selection] Looking for '{edge_group}' edges from {len(all_edges)} total edges")
-
-        tolerance = 0.1
+        groups = PyramidGenerator._classify_edges(solid, base, height, top_base)
 
-        if edge_group == 'vertical':
-            # Vertical edges connect base to top (edges that are approximately vertical)
-            for edge in all_edges:
-                try:
-                    # Get edge bounding box center
-                    bbox = edge.bounding_box()
-                    center_y = (bbox.min.Y + bbox.max.Y) / 2
-
-                    # Get edge length components
-                    dx = abs(bbox.max.X - bbox.min.X)
-                    dy = abs(bbox.max.Y - bbox.min.Y)
-                    dz = abs(bbox.max.Z - bbox.min.Z)
-
-                    # Vertical edges have large Y component, small X and Z
-                    # And center Y should be around mid-height
-                    if dy > height * 0.5 and dx < base * 0.3 and dz < base * 0.3:
-                        selected_edges.append(edge)
-                except Exception as e:
-                    print(f"[Edge Selection] Error checking vertical edge: {e}")
-                    pass
-
-        elif edge_group == 'base':
-            # Base edges are at Y ≈ 0
-            for edge in all_edges:
-                try:
-                    bbox = edge.bounding_box()
-                    center_y = (bbox.min.Y + bbox.max.Y) / 2
-                    if abs(center_y) < tolerance:
-                        selected_edges.append(edge)
-                except Exception as e:
-                    print(f"[Edge Selection] Error checking base edge: {e}")
-                    pass
-
-        elif edge_group == 'top':
-            # Top edges are at Y ≈ height
-            for edge in all_edges:
-                try:
-                    bbox = edge.bounding_box()
-                    center_y = (bbox.min.Y + bbox.max.Y) / 2
-                    if abs(center_y - height) < tolerance:
-                        selected_edges.append(edge)
-                except Exception as e:
-                    print(f"[Edge Selection] Error checking top edge: {e}")
-                    pass
+        print(f"[Edge Selection] Looking for '{edge_group}' edges from {len(groups['all'])} total edges")
 
-        elif edge_group == 'all':
-            selected_edges = list(all_edges)
+        selected_edges = list(groups.get(edge_group, []))
 
         print(f"[Edge Selection] Selected {len(selected_edges)} {edge_group} edges")
         return selected_edges
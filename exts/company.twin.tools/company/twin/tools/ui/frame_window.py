@@ -598,7 +598,7 @@ class FrameWindow(ui.Window):
             frame_data = solver.solve(solver_inputs)
             
             # Update Validation UI
-            val = frame_data['metadata'].get('validation', {})
+            val = frame_data.metadata.get('validation') or {}
             status = val.get('status', 'UNKNOWN')
             defl = val.get('deflection', 0.0)
             lim = val.get('limit_deflection', 0.0)
@@ -610,9 +610,7 @@ class FrameWindow(ui.Window):
                 self._validation_label.text = f"PASS: Deflection {defl:.3f} < {lim:.3f}"
                 self._validation_label.style = {"color": 0xFF00FF00} # Green
             
-            parts = frame_data['parts']
-            transforms = frame_data['transforms']
-            anchors = frame_data.get('anchors', {})
+            anchors = frame_data.anchors
             
             # USD Setup
             ctx = omni.usd.get_context()
@@ -660,7 +658,7 @@ class FrameWindow(ui.Window):
                 root_prim.SetCustomDataByKey("driver_path", driver_path_str)
             
             # STORE ENGINEERING DATA
-            validation_data = frame_data['metadata'].get('validation')
+            validation_data = frame_data.metadata.get('validation')
             if validation_data:
                 root_prim.SetCustomDataByKey("engineering_data", json.dumps(validation_data))
             
@@ -708,20 +706,27 @@ class FrameWindow(ui.Window):
             # ---------------------------------------------------------
             
             # Create sub-prims
-            for name, solid in parts.items():
+            # Instances share solids (parts holds one per solid_id), so tessellate
+            # each solid once and reuse the mesh data for every placement.
+            mesh_cache = {}
+            for name, solid, loc in frame_data.expand_instances():
                 part_path = f"{root_path}/{name}"
-                mesh_prim = usd_utils.create_mesh_from_shape(stage, part_path, solid)
+                if id(solid) not in mesh_cache:
+                    mesh_cache[id(solid)] = usd_utils.tessellate_shape(solid)
+                mesh_data = mesh_cache[id(solid)]
+                if mesh_data is None:
+                    print(f"Warning: Tessellation failed for shape at {part_path}")
+                    continue
+                mesh_prim = usd_utils.create_mesh_from_data(stage, part_path, mesh_data)
                 
-                if name in transforms:
-                    loc = transforms[name]
-                    pos = loc.position
-                    
-                    xform_api = UsdGeom.XformCommonAPI(mesh_prim)
-                    xform_api.SetTranslate((pos.X, pos.Y, pos.Z))
-                    
-                    rot = loc.to_tuple()[1]
-                    xform_api.SetRotate(rot)
-                    xform_api.SetScale((1, 1, 1))
+                pos = loc.position
+                
+                xform_api = UsdGeom.XformCommonAPI(mesh_prim)
+                xform_api.SetTranslate((pos.X, pos.Y, pos.Z))
+                
+                rot = loc.to_tuple()[1]
+                xform_api.SetRotate(rot)
+                xform_api.SetScale((1, 1, 1))
                 
                 
                         
@@ -737,7 +742,7 @@ class FrameWindow(ui.Window):
                     profile = self._col_section
                     designation = profile['designation']
                     gen_type = 'hss_tube' if 'HSS' in designation else 'wide_flange'
-                    length = frame_data['metadata']['col_length']
+                    length = frame_data.metadata['col_length']
                     
                     prim.SetCustomDataByKey("generatorType", gen_type)
                     prim.SetCustomDataByKey("designation", designation)
@@ -748,7 +753,7 @@ class FrameWindow(ui.Window):
                     profile = self._header_section
                     designation = profile['designation']
                     gen_type = 'hss_tube' if 'HSS' in designation else 'wide_flange'
-                    length = frame_data['metadata']['header_length']
+                    length = frame_data.metadata['header_length']
                     
                     prim.SetCustomDataByKey("generatorType", gen_type)
                     prim.SetCustomDataByKey("designation", designation)
@@ -761,7 +766,7 @@ class FrameWindow(ui.Window):
                     gen_type = 'hss_tube' if 'HSS' in designation else 'wide_flange'
                     # Retrieve calculated length from metadata or calculate?
                     # Better to store in metadata from solver per beam, or common length
-                    length = frame_data['metadata'].get('conn_beam_length', 0.0)
+                    length = frame_data.metadata.get('conn_beam_length', 0.0)
                     
                     prim.SetCustomDataByKey("generatorType", gen_type)
                     prim.SetCustomDataByKey("designation", designation)
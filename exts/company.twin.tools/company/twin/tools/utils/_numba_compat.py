@@ -0,0 +1,21 @@
+"""
+Optional Numba support.
+
+``njit`` is numba.njit when Numba is installed, otherwise a pass-through
+decorator, so kernels decorated with it run as plain Python. ``HAS_NUMBA``
+lets callers pick a NumPy path instead of the uncompiled loop.
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Pass-through stand-in for numba.njit."""
+        def decorator(func):
+            return func
+        return decorator
+
+__all__ = ["njit", "HAS_NUMBA"]
@@ -14,7 +14,7 @@ class Port:
         self.xform = UsdGeom.Xform(prim)
         
     @classmethod
-    def define(cls, stage, parent_path, name, position, direction, port_type="HVAC", shape="Rectangular", width=0.0, height=0.0, diameter=None):
+    def define(cls, stage, parent_path, name, position, direction, port_type="HVAC", shape="Rectangular", width=0.0, height=0.0, diameter=None, is_anchor=False):
         """
         Defines a new Port prim.
         
@@ -29,6 +29,7 @@ class Port:
             width: Width (Rectangular) or Diameter (if diameter arg not used)
             height: Height (Rectangular)
             diameter: Optional explicit diameter for Round ports
+            is_anchor: Also tag the prim with custom:is_anchor (enclosure entry/exit anchors)
         """
         port_path = f"{parent_path}/{name}"
         xform = UsdGeom.Xform.Define(stage, port_path)
@@ -74,6 +75,9 @@ class Port:
         else:
             cls._set_attr(prim, "twin:port_width", float(width), Sdf.ValueTypeNames.Double)
             cls._set_attr(prim, "twin:port_height", float(height), Sdf.ValueTypeNames.Double)
+
+        if is_anchor:
+            cls._set_attr(prim, "custom:is_anchor", True, Sdf.ValueTypeNames.Bool)
         
         # Visualization (Selectable Proxy)
         # Create a small cube to make the port selectable
@@ -6,13 +6,25 @@ def create_mesh_from_shape(stage: Usd.Stage, path: str, shape: bd.Shape, toleran
     """
     Creates a USD Mesh from a build123d Shape at the specified path.
     """
+    mesh_data = tessellate_shape(shape, tolerance)
+    if mesh_data is None:
+        print(f"Warning: Tessellation failed for shape at {path}")
+        return None
+    
+    return create_mesh_from_data(stage, path, mesh_data)
+
+def tessellate_shape(shape: bd.Shape, tolerance: float = 0.001):
+    """
+    Tessellates a build123d Shape into USD-ready mesh data.
+    Returns (points, face_vertex_indices, face_vertex_counts), or None on failure.
+    The result can be reused for every instance of the same shape.
+    """
     # Tessellate the shape
     # build123d/OCP tessellation returns (vertices, triangles)
     # vertices is a list of Vector objects
     # triangles is a list of (i1, i2, i3) tuples
     mesh_data = shape.tessellate(tolerance)
     if not mesh_data:
-        print(f"Warning: Tessellation failed for shape at {path}")
         return None
         
     vertices, triangles = mesh_data
@@ -28,6 +40,14 @@ def create_mesh_from_shape(stage: Usd.Stage, path: str, shape: bd.Shape, toleran
     # faceVertexCounts is just [3, 3, 3, ...] since we have triangles
     face_vertex_counts = [3] * len(triangles)
     
+    return usd_points, face_vertex_indices, face_vertex_counts
+
+def create_mesh_from_data(stage: Usd.Stage, path: str, mesh_data):
+    """
+    Defines a USD Mesh at path from data returned by tessellate_shape.
+    """
+    usd_points, face_vertex_indices, face_vertex_counts = mesh_data
+    
     # Create the mesh prim
     mesh_prim = UsdGeom.Mesh.Define(stage, path)
     